@@ -1,19 +1,53 @@
+from ._columnar_implementation.columnar_order_storage_factory import (
+    create_columnar_order_storage,
+)
 from ._database_implementation.database_order_storage_factory import (
     create_db_order_storage,
 )
+from ._heap_implementation.heap_order_storage_factory import create_heap_order_storage
+from ._ladder_implementation.ladder_order_storage_factory import (
+    create_ladder_order_storage,
+)
+from ._sharded_implementation.sharded_order_storage_factory import (
+    create_sharded_order_storage,
+)
 from ._tree_implementation.tree_order_storage_factory import create_tree_order_storage
-from .best_bid_and_ask import get_best_bid_and_ask
-from .best_bid_and_ask_view import BestBidAndAskView
+from .best_bid_and_ask import get_best_bid_and_ask, get_best_bids_and_asks
+from .best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from .depth_view import DepthView, MarketDepth, PriceLevel
 from .order_book import OrderBookProcessor
 from .order_storage import OrderStorage
 from .process_order import process_order
+from .process_orders import ProcessingSummary, process_orders
+from .replay import ReplayReport, replay_order_log
+from .top_of_book_conflation import ConflatedTopOfBookPublisher
+from .top_of_book_feed import TopOfBook, TopOfBookFeed, TopOfBookListener
+from .top_of_book_snapshot import TopOfBookSnapshot
 
 __all__ = [
     "process_order",
+    "process_orders",
+    "ProcessingSummary",
+    "replay_order_log",
+    "ReplayReport",
     "get_best_bid_and_ask",
+    "get_best_bids_and_asks",
     "create_db_order_storage",
     "create_tree_order_storage",
+    "create_heap_order_storage",
+    "create_ladder_order_storage",
+    "create_columnar_order_storage",
+    "create_sharded_order_storage",
     "OrderBookProcessor",
     "OrderStorage",
     "BestBidAndAskView",
+    "BestBidsAndAsks",
+    "DepthView",
+    "MarketDepth",
+    "PriceLevel",
+    "TopOfBook",
+    "TopOfBookFeed",
+    "TopOfBookListener",
+    "ConflatedTopOfBookPublisher",
+    "TopOfBookSnapshot",
 ]
@@ -0,0 +1,350 @@
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from ..best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from ..depth_view import DepthView, MarketDepth, PriceLevel
+from ..order import Order, OrderType
+from ..order_book import OrderBookError, OrderBookProcessor
+from ..prices import PRICE_SCALE, ticks_to_price
+from .order_columns import (
+    ASK_SIDE,
+    BID_SIDE,
+    FREE_SLOT,
+    INT64_RANGE,
+    ORDER_DTYPE,
+    TickerSlots,
+)
+
+NO_ASK = np.iinfo(np.int64).max
+
+
+class OrderDoesNotExistError(OrderBookError):
+    pass
+
+
+class InvalidOrderSizeZeroError(OrderBookError):
+    pass
+
+
+class DuplicatedOrderIdError(OrderBookError):
+    pass
+
+
+class InvalidOrderColumnsError(OrderBookError):
+    pass
+
+
+class OrderValueOutOfRangeError(OrderBookError):
+    pass
+
+
+class BestPrices(NamedTuple):
+    tickers: List[str]
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+class ColumnarOrderBook(OrderBookProcessor, BestBidAndAskView, DepthView):
+    def __init__(self, initial_capacity: int) -> None:
+        self.__columns = np.zeros(max(initial_capacity, 1), dtype=ORDER_DTYPE)
+        self.__slot_ids: List[Optional[str]] = [None] * len(self.__columns)
+        self.__ids_to_slots: Dict[str, int] = {}
+        self.__free_slots: List[int] = []
+        self.__num_of_used_slots = 0
+        self.__ticker_ids: Dict[str, int] = {}
+        self.__tickers: List[str] = []
+        self.__ticker_slots: List[TickerSlots] = []
+
+    def __len__(self) -> int:
+        return len(self.__ids_to_slots)
+
+    def add_order(self, order: Order) -> None:
+        if order.size == 0:
+            raise InvalidOrderSizeZeroError(
+                f"Cannot add order with id: {order.order_id} due to size being 0."
+            )
+
+        if order.order_id in self.__ids_to_slots:
+            raise DuplicatedOrderIdError(
+                f"Cannot add order with id: {order.order_id} to book."
+            )
+
+        for name, value in (
+            ("timestamp", order.timestamp),
+            ("price_ticks", order.price_ticks),
+            ("size", order.size),
+        ):
+            if value not in INT64_RANGE:
+                raise OrderValueOutOfRangeError(
+                    f"Cannot add order with id: {order.order_id} "
+                    f"due to {name} {value} not fitting in an int64 column."
+                )
+
+        ticker_id = self.__get_ticker_id(ticker=order.ticker)
+        slot = self.__allocate_slot()
+        self.__columns[slot] = (
+            order.timestamp,
+            ticker_id,
+            order.price_ticks,
+            order.size,
+            _side_from_order_type(order_type=order.order_type),
+            self.__ticker_slots[ticker_id].append(slot=slot),
+        )
+        self.__slot_ids[slot] = order.order_id
+        self.__ids_to_slots[order.order_id] = slot
+
+    def load_orders(
+        self,
+        order_ids: Sequence[str],
+        tickers: Sequence[str],
+        price_ticks: Sequence[int],
+        sizes: Sequence[int],
+        sides: Sequence[int],
+        timestamps: Sequence[int],
+    ) -> None:
+        num_of_orders = len(order_ids)
+        columns = (tickers, price_ticks, sizes, sides, timestamps)
+        if any(len(column) != num_of_orders for column in columns):
+            raise InvalidOrderColumnsError(
+                "Cannot load orders from columns of different lengths."
+            )
+
+        timestamp_values = _int64_column(name="timestamp", values=timestamps)
+        price_tick_values = _int64_column(name="price_ticks", values=price_ticks)
+        size_values = _int64_column(name="size", values=sizes)
+
+        side_codes = np.asarray(sides, dtype=np.int8)
+        if not np.all((side_codes == BID_SIDE) | (side_codes == ASK_SIDE)):
+            raise InvalidOrderColumnsError("Cannot load orders with unknown sides.")
+
+        if np.any(size_values == 0):
+            raise InvalidOrderSizeZeroError("Cannot load orders with size 0.")
+
+        if len(set(order_ids)) != len(
+            order_ids
+        ) or not self.__ids_to_slots.keys().isdisjoint(order_ids):
+            raise DuplicatedOrderIdError("Cannot load orders with duplicated ids.")
+
+        if num_of_orders == 0:
+            return
+
+        unique_tickers, ticker_inverse = np.unique(
+            np.asarray(tickers), return_inverse=True
+        )
+        ticker_ids = np.array(
+            [self.__get_ticker_id(ticker=str(ticker)) for ticker in unique_tickers],
+            dtype=np.int32,
+        )[ticker_inverse.ravel()]
+
+        self.__reserve(num_of_slots=num_of_orders)
+        start = self.__num_of_used_slots
+        stop = start + num_of_orders
+        slots = np.arange(start, stop, dtype=np.int64)
+
+        loaded = self.__columns[start:stop]
+        loaded["timestamp"] = timestamp_values
+        loaded["ticker_id"] = ticker_ids
+        loaded["price_ticks"] = price_tick_values
+        loaded["size"] = size_values
+        loaded["side"] = side_codes
+
+        grouped = np.argsort(ticker_ids, kind="stable")
+        group_starts = np.flatnonzero(np.diff(ticker_ids[grouped], prepend=-1))
+        for group in np.split(grouped, group_starts[1:]):
+            ticker_slots = self.__ticker_slots[ticker_ids[group[0]]]
+            first_position = ticker_slots.extend(slots=slots[group])
+            loaded["ticker_position"][group] = first_position + np.arange(len(group))
+
+        self.__slot_ids[start:stop] = order_ids
+        self.__ids_to_slots.update(zip(order_ids, range(start, stop)))
+        self.__num_of_used_slots = stop
+
+    def update(self, order_id: str, size: int) -> None:
+        if order_id not in self.__ids_to_slots:
+            raise OrderDoesNotExistError(
+                f"Cannot update non existing order: {order_id}"
+            )
+
+        if size not in INT64_RANGE:
+            raise OrderValueOutOfRangeError(
+                f"Cannot update order with id: {order_id} "
+                f"due to size {size} not fitting in an int64 column."
+            )
+
+        self.__columns["size"][self.__ids_to_slots[order_id]] = size
+
+    def cancel(self, order_id: str) -> None:
+        if order_id not in self.__ids_to_slots:
+            raise OrderDoesNotExistError(
+                f"Cannot cancel non existing order: {order_id}"
+            )
+
+        slot = self.__ids_to_slots.pop(order_id)
+        ticker_id = int(self.__columns["ticker_id"][slot])
+        position = int(self.__columns["ticker_position"][slot])
+
+        moved_slot = self.__ticker_slots[ticker_id].remove(position=position)
+        self.__columns["ticker_position"][moved_slot] = position
+
+        self.__columns["ticker_id"][slot] = FREE_SLOT
+        self.__slot_ids[slot] = None
+        self.__free_slots.append(slot)
+
+    def get_best_ask(self, ticker: str) -> float:
+        prices = self.__side_prices(ticker=ticker, side=ASK_SIDE)
+        if len(prices) == 0:
+            return 0.0
+        return ticks_to_price(price_ticks=int(prices.min()))
+
+    def get_best_bid(self, ticker: str) -> float:
+        prices = self.__side_prices(ticker=ticker, side=BID_SIDE)
+        if len(prices) == 0:
+            return 0.0
+        return ticks_to_price(price_ticks=int(prices.max()))
+
+    def get_best_prices(self) -> BestPrices:
+        used = self.__columns[: self.__num_of_used_slots]
+        ticker_ids = used["ticker_id"]
+        price_ticks = used["price_ticks"]
+        is_ask = used["side"] == ASK_SIDE
+        asks = is_ask & (ticker_ids != FREE_SLOT)
+        bids = ~is_ask & (ticker_ids != FREE_SLOT)
+
+        best_asks = np.full(len(self.__tickers), NO_ASK, dtype=np.int64)
+        np.minimum.at(best_asks, ticker_ids[asks], price_ticks[asks])
+        best_asks[best_asks == NO_ASK] = 0
+
+        best_bids = np.zeros(len(self.__tickers), dtype=np.int64)
+        np.maximum.at(best_bids, ticker_ids[bids], price_ticks[bids])
+
+        return BestPrices(
+            tickers=list(self.__tickers),
+            bids=best_bids / PRICE_SCALE,
+            asks=best_asks / PRICE_SCALE,
+        )
+
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        best_prices = self.get_best_prices()
+
+        if tickers is None:
+            selected = np.array(
+                [
+                    ticker_id
+                    for ticker_id, ticker_slots in enumerate(self.__ticker_slots)
+                    if ticker_slots.count > 0
+                ],
+                dtype=np.int64,
+            )
+            tickers = [self.__tickers[ticker_id] for ticker_id in selected]
+        else:
+            # unknown tickers select the trailing zero appended below
+            selected = np.array(
+                [self.__ticker_ids.get(ticker, -1) for ticker in tickers],
+                dtype=np.int64,
+            )
+
+        return BestBidsAndAsks(
+            tickers=list(tickers),
+            bids=array("d", np.append(best_prices.bids, 0.0)[selected].tobytes()),
+            asks=array("d", np.append(best_prices.asks, 0.0)[selected].tobytes()),
+        )
+
+    def get_depth(self, ticker: str, levels: int) -> MarketDepth:
+        rows = self.__ticker_rows(ticker=ticker)
+        return MarketDepth(
+            bids=_top_levels(
+                rows=rows[rows["side"] == BID_SIDE], levels=levels, descending=True
+            ),
+            asks=_top_levels(
+                rows=rows[rows["side"] == ASK_SIDE], levels=levels, descending=False
+            ),
+        )
+
+    def get_order(self, order_id: str) -> Order:
+        if order_id not in self.__ids_to_slots:
+            raise OrderDoesNotExistError(f"Cannot find non existing order: {order_id}")
+
+        row = self.__columns[self.__ids_to_slots[order_id]]
+        return Order(
+            order_id=order_id,
+            timestamp=int(row["timestamp"]),
+            ticker=self.__tickers[row["ticker_id"]],
+            price_ticks=int(row["price_ticks"]),
+            size=int(row["size"]),
+            order_type=OrderType.ASK if row["side"] == ASK_SIDE else OrderType.BID,
+        )
+
+    def __side_prices(self, ticker: str, side: int) -> np.ndarray:
+        rows = self.__ticker_rows(ticker=ticker)
+        return rows["price_ticks"][rows["side"] == side]
+
+    def __ticker_rows(self, ticker: str) -> np.ndarray:
+        if ticker not in self.__ticker_ids:
+            return self.__columns[:0]
+        return self.__columns[self.__ticker_slots[self.__ticker_ids[ticker]].live()]
+
+    def __get_ticker_id(self, ticker: str) -> int:
+        ticker_id = self.__ticker_ids.get(ticker)
+        if ticker_id is None:
+            ticker_id = len(self.__tickers)
+            self.__ticker_ids[ticker] = ticker_id
+            self.__tickers.append(ticker)
+            self.__ticker_slots.append(TickerSlots(capacity=16))
+        return ticker_id
+
+    def __allocate_slot(self) -> int:
+        if self.__free_slots:
+            return self.__free_slots.pop()
+
+        self.__reserve(num_of_slots=1)
+        self.__num_of_used_slots += 1
+        return self.__num_of_used_slots - 1
+
+    def __reserve(self, num_of_slots: int) -> None:
+        needed = self.__num_of_used_slots + num_of_slots
+        capacity = len(self.__columns)
+        if needed <= capacity:
+            return
+
+        grown = np.zeros(max(needed, 2 * capacity), dtype=ORDER_DTYPE)
+        grown[: self.__num_of_used_slots] = self.__columns[: self.__num_of_used_slots]
+        self.__columns = grown
+        self.__slot_ids.extend([None] * (len(grown) - capacity))
+
+
+def _top_levels(rows: np.ndarray, levels: int, descending: bool) -> List[PriceLevel]:
+    prices, inverse, counts = np.unique(
+        rows["price_ticks"], return_inverse=True, return_counts=True
+    )
+    sizes = np.zeros(len(prices), dtype=np.int64)
+    np.add.at(sizes, inverse.ravel(), rows["size"])
+
+    order = np.arange(len(prices))
+    if descending:
+        order = order[::-1]
+
+    return [
+        PriceLevel(
+            price=ticks_to_price(price_ticks=int(prices[idx])),
+            size=int(sizes[idx]),
+            num_of_orders=int(counts[idx]),
+        )
+        for idx in order[:levels]
+    ]
+
+
+def _int64_column(name: str, values: Sequence[int]) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except OverflowError as err:
+        raise OrderValueOutOfRangeError(
+            f"Cannot load orders with {name} not fitting in an int64 column."
+        ) from err
+
+
+def _side_from_order_type(order_type: OrderType) -> int:
+    return ASK_SIDE if order_type == OrderType.ASK else BID_SIDE
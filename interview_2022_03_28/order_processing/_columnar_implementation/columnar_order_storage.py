@@ -0,0 +1,18 @@
+from ..best_bid_and_ask_view import BestBidAndAskView
+from ..order_book import OrderBookProcessor
+from ..order_storage import OrderStorage
+from .columnar_order_book import ColumnarOrderBook
+
+
+class ColumnarOrderStorage(OrderStorage):
+    def __init__(self, initial_capacity: int) -> None:
+        self.__order_book = ColumnarOrderBook(initial_capacity=initial_capacity)
+
+    def get_processor(self) -> OrderBookProcessor:
+        return self.__order_book
+
+    def get_price_view(self) -> BestBidAndAskView:
+        return self.__order_book
+
+    def get_bulk_loader(self) -> ColumnarOrderBook:
+        return self.__order_book
@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .columnar_order_storage import ColumnarOrderStorage
+
+
+def create_columnar_order_storage(
+    initial_capacity: int = 1_024,
+) -> "ColumnarOrderStorage":
+    # numpy is only required by this backend, so it is imported on first use
+    from .columnar_order_storage import (  # pylint: disable=import-outside-toplevel
+        ColumnarOrderStorage,
+    )
+
+    return ColumnarOrderStorage(initial_capacity=initial_capacity)
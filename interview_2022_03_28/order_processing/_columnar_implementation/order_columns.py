@@ -0,0 +1,56 @@
+import numpy as np
+
+BID_SIDE = 0
+ASK_SIDE = 1
+FREE_SLOT = -1
+INT64_RANGE = range(np.iinfo(np.int64).min, np.iinfo(np.int64).max + 1)
+
+ORDER_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("ticker_id", np.int32),
+        ("price_ticks", np.int64),
+        ("size", np.int64),
+        ("side", np.int8),
+        ("ticker_position", np.int64),
+    ]
+)
+
+
+class TickerSlots:
+    __slots__ = ("slots", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.slots = np.empty(capacity, dtype=np.int64)
+        self.count = 0
+
+    def append(self, slot: int) -> int:
+        self.__reserve(num_of_slots=1)
+        self.slots[self.count] = slot
+        self.count += 1
+        return self.count - 1
+
+    def extend(self, slots: np.ndarray) -> int:
+        self.__reserve(num_of_slots=len(slots))
+        start = self.count
+        self.count += len(slots)
+        self.slots[start : self.count] = slots
+        return start
+
+    def remove(self, position: int) -> int:
+        self.count -= 1
+        moved_slot = int(self.slots[self.count])
+        self.slots[position] = moved_slot
+        return moved_slot
+
+    def live(self) -> np.ndarray:
+        return self.slots[: self.count]
+
+    def __reserve(self, num_of_slots: int) -> None:
+        needed = self.count + num_of_slots
+        if needed <= len(self.slots):
+            return
+
+        grown = np.empty(max(needed, 2 * len(self.slots)), dtype=np.int64)
+        grown[: self.count] = self.slots[: self.count]
+        self.slots = grown
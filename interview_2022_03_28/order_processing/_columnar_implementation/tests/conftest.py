@@ -0,0 +1,8 @@
+import pytest
+
+from ..columnar_order_book import ColumnarOrderBook
+
+
+@pytest.fixture(name="columnar_order_book")
+def fixture_columnar_order_book() -> ColumnarOrderBook:
+    return ColumnarOrderBook(initial_capacity=4)
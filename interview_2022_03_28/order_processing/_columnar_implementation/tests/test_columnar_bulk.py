@@ -0,0 +1,196 @@
+import random
+
+import numpy as np
+import pytest
+
+from ..._tree_implementation.tree_order_book import TreeOrderBook
+from ...order import Order, OrderType
+from ...prices import price_to_ticks
+from ..columnar_order_book import (
+    ColumnarOrderBook,
+    DuplicatedOrderIdError,
+    InvalidOrderColumnsError,
+    InvalidOrderSizeZeroError,
+    OrderValueOutOfRangeError,
+)
+from ..order_columns import ASK_SIDE, BID_SIDE
+
+TICKERS = ["AAA", "BBB", "CCC", "DDD"]
+
+
+def random_orders(num_of_orders: int) -> list:
+    rng = random.Random(2022)
+    return [
+        Order(
+            order_id=f"o{idx}",
+            timestamp=idx,
+            ticker=rng.choice(TICKERS),
+            price_ticks=price_to_ticks(price=rng.randint(1, 1_000) / 100),
+            size=rng.randint(1, 100),
+            order_type=rng.choice([OrderType.BID, OrderType.ASK]),
+        )
+        for idx in range(num_of_orders)
+    ]
+
+
+def load(columnar_order_book: ColumnarOrderBook, orders: list) -> None:
+    columnar_order_book.load_orders(
+        order_ids=[order.order_id for order in orders],
+        tickers=[order.ticker for order in orders],
+        price_ticks=[order.price_ticks for order in orders],
+        sizes=[order.size for order in orders],
+        sides=[
+            ASK_SIDE if order.order_type == OrderType.ASK else BID_SIDE
+            for order in orders
+        ],
+        timestamps=[order.timestamp for order in orders],
+    )
+
+
+def test_bulk_loaded_and_cancelled_orders_should_match_tree_book(
+    columnar_order_book: ColumnarOrderBook,
+):
+    orders = random_orders(num_of_orders=2_000)
+    tree_order_book = TreeOrderBook()
+    load(columnar_order_book=columnar_order_book, orders=orders[:1_500])
+    for order in orders:
+        tree_order_book.add_order(order=order)
+    for order in orders[1_500:]:
+        columnar_order_book.add_order(order=order)
+    for order in orders[::3]:
+        columnar_order_book.cancel(order_id=order.order_id)
+        tree_order_book.cancel(order_id=order.order_id)
+
+    best_prices = columnar_order_book.get_best_prices()
+
+    assert best_prices.tickers == TICKERS
+    for ticker, best_bid, best_ask in zip(
+        best_prices.tickers, best_prices.bids, best_prices.asks
+    ):
+        assert best_bid == tree_order_book.get_best_bid(ticker=ticker)
+        assert best_ask == tree_order_book.get_best_ask(ticker=ticker)
+        assert columnar_order_book.get_best_bid(ticker=ticker) == best_bid
+        assert columnar_order_book.get_best_ask(ticker=ticker) == best_ask
+        assert columnar_order_book.get_depth(
+            ticker=ticker, levels=5
+        ) == tree_order_book.get_depth(ticker=ticker, levels=5)
+
+    assert columnar_order_book.get_order(order_id="o1") == orders[1]
+
+
+def test_given_empty_book_best_prices_should_be_empty(
+    columnar_order_book: ColumnarOrderBook,
+):
+    best_prices = columnar_order_book.get_best_prices()
+
+    assert best_prices.tickers == []
+    assert len(best_prices.bids) == 0 and len(best_prices.asks) == 0
+
+
+def test_ticker_without_asks_should_have_zero_best_ask(
+    columnar_order_book: ColumnarOrderBook,
+):
+    orders = [
+        Order(
+            order_id="bid",
+            timestamp=1,
+            ticker="ONLYBIDS",
+            price_ticks=price_to_ticks(price=2.5),
+            size=1,
+            order_type=OrderType.BID,
+        )
+    ]
+    load(columnar_order_book=columnar_order_book, orders=orders)
+
+    best_prices = columnar_order_book.get_best_prices()
+    ticker_idx = best_prices.tickers.index("ONLYBIDS")
+
+    assert best_prices.bids[ticker_idx] == pytest.approx(2.5)
+    assert best_prices.asks[ticker_idx] == 0.0
+
+
+@pytest.mark.parametrize(
+    "order_ids, sizes, error",
+    [
+        (["a", "b"], [1, 0], InvalidOrderSizeZeroError),
+        (["a", "a"], [1, 1], DuplicatedOrderIdError),
+        (["o0", "b"], [1, 1], DuplicatedOrderIdError),
+    ],
+)
+def test_invalid_bulk_load_should_raise_and_load_nothing(
+    columnar_order_book: ColumnarOrderBook, order_ids: list, sizes: list, error
+):
+    load(columnar_order_book=columnar_order_book, orders=random_orders(1))
+
+    with pytest.raises(error):
+        columnar_order_book.load_orders(
+            order_ids=order_ids,
+            tickers=["AAA", "AAA"],
+            price_ticks=np.array([1, 2]),
+            sizes=sizes,
+            sides=[BID_SIDE, ASK_SIDE],
+            timestamps=[1, 2],
+        )
+
+    assert len(columnar_order_book) == 1
+
+
+@pytest.mark.parametrize(
+    "tickers, sides",
+    [
+        (["NEW", "NEW", "NEW"], [BID_SIDE, ASK_SIDE]),
+        (["NEW"], [BID_SIDE, ASK_SIDE]),
+        (["NEW", "NEW"], [BID_SIDE]),
+        (["NEW", "NEW"], [BID_SIDE, 2]),
+        (["NEW", "NEW"], [-1, ASK_SIDE]),
+    ],
+)
+def test_bulk_load_with_malformed_columns_should_raise_and_load_nothing(
+    columnar_order_book: ColumnarOrderBook, tickers: list, sides: list
+):
+    load(columnar_order_book=columnar_order_book, orders=random_orders(1))
+    tickers_before = columnar_order_book.get_best_prices().tickers
+
+    with pytest.raises(InvalidOrderColumnsError):
+        columnar_order_book.load_orders(
+            order_ids=["a", "b"],
+            tickers=tickers,
+            price_ticks=[1, 2],
+            sizes=[1, 1],
+            sides=sides,
+            timestamps=[1, 2],
+        )
+
+    assert len(columnar_order_book) == 1
+    assert columnar_order_book.get_best_prices().tickers == tickers_before
+
+
+@pytest.mark.parametrize(
+    "price_ticks, sizes, timestamps",
+    [
+        ([1, 2**63], [1, 1], [1, 2]),
+        ([1, 2], [1, -(2**63) - 1], [1, 2]),
+        ([1, 2], [1, 1], [1, 10**20]),
+    ],
+)
+def test_bulk_load_with_values_out_of_int64_range_should_raise_and_load_nothing(
+    columnar_order_book: ColumnarOrderBook,
+    price_ticks: list,
+    sizes: list,
+    timestamps: list,
+):
+    load(columnar_order_book=columnar_order_book, orders=random_orders(1))
+    tickers_before = columnar_order_book.get_best_prices().tickers
+
+    with pytest.raises(OrderValueOutOfRangeError):
+        columnar_order_book.load_orders(
+            order_ids=["a", "b"],
+            tickers=["NEW", "NEW"],
+            price_ticks=price_ticks,
+            sizes=sizes,
+            sides=[BID_SIDE, ASK_SIDE],
+            timestamps=timestamps,
+        )
+
+    assert len(columnar_order_book) == 1
+    assert columnar_order_book.get_best_prices().tickers == tickers_before
@@ -0,0 +1,128 @@
+import re
+
+import pytest
+
+from ...depth_view import MarketDepth
+from ...order import Order, OrderType
+from ...prices import price_to_ticks
+from ...process_order import process_order
+from ..columnar_order_book import ColumnarOrderBook
+
+
+@pytest.mark.parametrize(
+    "side, order_type", [("B", OrderType.BID), ("S", OrderType.ASK)]
+)
+def test_adding_order_should_store_all_its_fields(
+    columnar_order_book: ColumnarOrderBook, side: str, order_type: OrderType
+):
+    process_order(
+        order_book=columnar_order_book, order=f"789|bbaa|a|XXYY|{side}|4.56789|8"
+    )
+
+    assert columnar_order_book.get_order(order_id="bbaa") == Order(
+        order_id="bbaa",
+        timestamp=789,
+        ticker="XXYY",
+        price_ticks=price_to_ticks(price=4.56789),
+        size=8,
+        order_type=order_type,
+    )
+
+
+@pytest.mark.parametrize(
+    "order",
+    [
+        "123|z42|a|ZZZZ|B|3.3|0",
+        "123|z42|a|ZZZZ|S|3.3|-1",
+        "123|#id|a|ZZZZ|S|3.3|1",
+        "123|z42|u|a",
+    ],
+)
+def test_invalid_order_should_not_be_added(
+    columnar_order_book: ColumnarOrderBook, order: str
+):
+    process_order(order_book=columnar_order_book, order=order)
+
+    assert len(columnar_order_book) == 0
+
+
+@pytest.mark.parametrize(
+    "order",
+    [
+        "99999999999999999999|a1|a|T|B|1|1",
+        "1|a1|a|T|B|1e200|1",
+        "1|a1|a|T|B|1|99999999999999999999",
+    ],
+)
+def test_adding_order_with_value_out_of_int64_range_should_log_error(
+    columnar_order_book: ColumnarOrderBook, capsys, order: str
+):
+    process_order(order_book=columnar_order_book, order=order)
+
+    assert re.match("ERROR.*a1", capsys.readouterr().err)
+    assert len(columnar_order_book) == 0
+    assert columnar_order_book.get_depth(ticker="T", levels=5) == MarketDepth(
+        bids=[], asks=[]
+    )
+
+
+def test_updating_order_with_size_out_of_int64_range_should_log_error(
+    columnar_order_book: ColumnarOrderBook, capsys
+):
+    process_order(order_book=columnar_order_book, order="1|o1|a|TICK|B|1.2|1")
+    process_order(order_book=columnar_order_book, order="2|o1|u|99999999999999999999")
+
+    assert re.match("ERROR.*o1", capsys.readouterr().err)
+    assert columnar_order_book.get_order(order_id="o1").size == 1
+
+
+def test_adding_order_with_duplicated_id_should_log_error(
+    columnar_order_book: ColumnarOrderBook, capsys
+):
+    process_order(order_book=columnar_order_book, order="1|dup|a|TICK|B|1.2|1")
+    process_order(order_book=columnar_order_book, order="2|dup|a|TICK|S|1.3|2")
+
+    assert re.match("ERROR.*dup", capsys.readouterr().err)
+    assert columnar_order_book.get_order(order_id="dup").size == 1
+
+
+def test_updating_order_should_change_only_its_size(
+    columnar_order_book: ColumnarOrderBook,
+):
+    process_order(order_book=columnar_order_book, order="1|o1|a|TICK|B|1.2|1")
+    process_order(order_book=columnar_order_book, order="1|o2|a|TICK|B|1.2|5")
+    process_order(order_book=columnar_order_book, order="2|o1|u|17")
+
+    assert columnar_order_book.get_order(order_id="o1").size == 17
+    assert columnar_order_book.get_order(order_id="o2").size == 5
+
+
+@pytest.mark.parametrize("action", ["u|5", "c"])
+def test_modifying_non_existing_order_should_log_error(
+    columnar_order_book: ColumnarOrderBook, capsys, action: str
+):
+    process_order(order_book=columnar_order_book, order=f"1|missing|{action}")
+
+    assert re.match("ERROR.*missing", capsys.readouterr().err)
+
+
+def test_cancelled_order_should_not_be_found_and_its_slot_reused(
+    columnar_order_book: ColumnarOrderBook, capsys
+):
+    for idx in range(10):
+        process_order(
+            order_book=columnar_order_book, order=f"1|o{idx}|a|TICK|S|{idx + 1}|1"
+        )
+    process_order(order_book=columnar_order_book, order="2|o0|c")
+    process_order(order_book=columnar_order_book, order="2|o0|c")
+
+    assert re.match("ERROR.*o0", capsys.readouterr().err)
+    assert columnar_order_book.get_best_ask(ticker="TICK") == pytest.approx(2.0)
+
+    process_order(order_book=columnar_order_book, order="3|new|a|TICK|S|0.5|1")
+
+    assert len(columnar_order_book) == 10
+    assert columnar_order_book.get_best_ask(ticker="TICK") == pytest.approx(0.5)
+    assert columnar_order_book.get_order(order_id="o9").price_ticks == price_to_ticks(
+        price=10
+    )
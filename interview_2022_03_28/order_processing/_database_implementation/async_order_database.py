@@ -0,0 +1,198 @@
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..order import Order, OrderType
+from .order_database import OrderDatabase, check_integer_column
+
+Task = Callable[[OrderDatabase], Any]
+QueuedTask = Tuple[Task, Optional[Future], Optional[str]]
+
+DEFAULT_QUEUE_SIZE = 10_000
+
+
+class DatabaseClosedError(Exception):
+    pass
+
+
+class AsyncOrderDatabase(OrderDatabase):
+    def __init__(
+        self,
+        create_database: Callable[[], OrderDatabase],
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        self.__queue: "queue.Queue[Optional[QueuedTask]]" = queue.Queue(
+            maxsize=queue_size
+        )
+        self.__max_batch_size = queue_size
+        self.__failed_writes: "queue.SimpleQueue[Tuple[str, Exception]]" = (
+            queue.SimpleQueue()
+        )
+        self.__error: Optional[Exception] = None
+        self.__is_closed = False
+
+        started: Future = Future()
+        self.__writer = threading.Thread(
+            target=self.__run_writer,
+            args=(create_database, started),
+            daemon=True,
+        )
+        self.__writer.start()
+        started.result()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.__is_closed:
+            return
+
+        self.__is_closed = True
+        self.__queue.put(None)
+        self.__writer.join()
+        error = self.__error
+        if error is not None:
+            self.__error = None
+            raise error
+
+    def has_table(self, name: str) -> bool:
+        return self.__call(lambda database: database.has_table(name=name))
+
+    def create_table(self, name: str, columns) -> None:
+        self.__call(lambda database: database.create_table(name=name, columns=columns))
+
+    def create_index(self, name: str, table: str, columns: List[str]) -> None:
+        self.__call(
+            lambda database: database.create_index(
+                name=name, table=table, columns=columns
+            )
+        )
+
+    def insert(self, order: Order) -> None:
+        check_integer_column(name="time_created", value=order.timestamp)
+        check_integer_column(name="price", value=order.price_ticks)
+        check_integer_column(name="size", value=order.size)
+
+        self.__submit(
+            task=lambda database: database.insert(order=order), order_id=order.order_id
+        )
+
+    def remove(self, order_id: str) -> None:
+        self.__submit(
+            task=lambda database: database.remove(order_id=order_id), order_id=order_id
+        )
+
+    def has_order(self, order_id: str) -> bool:
+        return self.__call(lambda database: database.has_order(order_id=order_id))
+
+    def update(self, order_id: str, size: int) -> bool:
+        check_integer_column(name="size", value=size)
+
+        self.__submit(
+            task=lambda database: database.update(order_id=order_id, size=size),
+            order_id=order_id,
+        )
+        return True
+
+    def get_live_orders(self) -> List[Tuple[str, Tuple[str, OrderType, int]]]:
+        return self.__call(lambda database: database.get_live_orders())
+
+    def find_order(self, order_id: str) -> Optional[Tuple[str, OrderType, int]]:
+        return self.__call(lambda database: database.find_order(order_id=order_id))
+
+    def take_failed_writes(self) -> List[Tuple[str, Exception]]:
+        failed_writes = []
+        while not self.__failed_writes.empty():
+            failed_writes.append(self.__failed_writes.get())
+        return failed_writes
+
+    def begin_batch(self) -> None:
+        pass
+
+    def end_batch(self) -> None:
+        pass
+
+    def flush(self) -> None:
+        self.__call(lambda database: database.flush())
+
+    def get_best_ask(self, ticker: str) -> int:
+        return self.__call(lambda database: database.get_best_ask(ticker=ticker))
+
+    def get_best_bid(self, ticker: str) -> int:
+        return self.__call(lambda database: database.get_best_bid(ticker=ticker))
+
+    def get_best_prices(self) -> Dict[str, Tuple[int, int]]:
+        return self.__call(lambda database: database.get_best_prices())
+
+    def get_depth(
+        self, ticker: str, order_type: OrderType, levels: int
+    ) -> List[Tuple[int, int, int]]:
+        return self.__call(
+            lambda database: database.get_depth(
+                ticker=ticker, order_type=order_type, levels=levels
+            )
+        )
+
+    def __submit(self, task: Task, order_id: str) -> None:
+        self.__check_is_open()
+        self.__queue.put((task, None, order_id))
+
+    def __call(self, task: Task) -> Any:
+        self.__check_is_open()
+        result: Future = Future()
+        self.__queue.put((task, result, None))
+        return result.result()
+
+    def __check_is_open(self) -> None:
+        if self.__is_closed:
+            raise DatabaseClosedError("Cannot use database after it was closed.")
+
+    def __run_writer(
+        self, create_database: Callable[[], OrderDatabase], started: Future
+    ) -> None:
+        try:
+            database = create_database()
+        except Exception as err:  # pylint: disable=broad-except
+            started.set_exception(err)
+            return
+        started.set_result(None)
+
+        is_running = True
+        while is_running:
+            tasks = [self.__queue.get()]
+            while len(tasks) < self.__max_batch_size:
+                try:
+                    tasks.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            database.begin_batch()
+            for task in tasks:
+                if task is None:
+                    is_running = False
+                    break
+                self.__run_task(database=database, task=task)
+
+            try:
+                database.end_batch()
+            except Exception:  # pylint: disable=broad-except
+                continue
+
+        try:
+            database.close()
+        except Exception as err:  # pylint: disable=broad-except
+            self.__error = err
+
+    def __run_task(self, database: OrderDatabase, task: QueuedTask) -> None:
+        function, result, order_id = task
+        try:
+            value = function(database)
+        except Exception as err:  # pylint: disable=broad-except
+            if result is not None:
+                result.set_exception(err)
+            elif order_id is not None:
+                self.__failed_writes.put((order_id, err))
+        else:
+            if result is not None:
+                result.set_result(value)
@@ -1,8 +1,10 @@
+import itertools
 import sqlite3
-from typing import List
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Union
 
-from ..order import Order
-from .order_database import OrderDatabase
+from ..order import Order, OrderType
+from .order_database import ORDER_TYPE_CODES, OrderDatabase, check_integer_column
 
 
 class DatabaseTableAlreadyExistsError(Exception):
@@ -13,16 +15,87 @@ class DatabaseTableCreationError(Exception):
     pass
 
 
+class DuplicatedRowError(Exception):
+    pass
+
+
+INSERT_QUERY = "insert into orders values (?, ?, ?, ?, ?, ?)"
+REMOVE_QUERY = "delete from orders where order_id=?"
+INSERT_TICKER_QUERY = "insert into tickers (ticker_id, name) values (?, ?)"
+UPDATE_QUERY = "update orders set size = ? where order_id=?"
+BEST_PRICES_QUERY = """select name,
+    coalesce(max(case when type=? then price end), 0),
+    coalesce(min(case when type=? then price end), 0)
+    from orders join tickers using (ticker_id) group by ticker_id"""
+
+ORDER_TYPES_BY_CODE = {
+    code: order_type for order_type, code in ORDER_TYPE_CODES.items()
+}
+
+ORDER_COLUMNS = {
+    "order_id": "order_id",
+    "time_created": "time_created",
+    "ticker": "name",
+    "price": "price",
+    "size": "size",
+    "type": "case type "
+    + " ".join(
+        f"when {code} then '{order_type.name}'"
+        for order_type, code in ORDER_TYPE_CODES.items()
+    )
+    + " end",
+}
+
+
 class ConcreteOrderDatabase(OrderDatabase):
-    def __init__(self, database_name: str) -> None:
+    def __init__(
+        self,
+        database_name: str,
+        batch_size: int = 1,
+        pragmas: Optional[Dict[str, Union[str, int]]] = None,
+    ) -> None:
         self.__connection = sqlite3.connect(database=database_name)
         self.__cursor = self.__connection.cursor()
+        self.__is_closed = False
+        self.__batch_size = batch_size
+        self.__batch_depth = 0
+        self.__pending: List[Tuple[str, tuple]] = []
+        self.__pending_orders: Dict[str, Optional[Tuple[str, OrderType, int]]] = {}
+        self.__pending_tickers: List[Tuple[int, str]] = []
+        self.__ticker_ids: Dict[str, int] = {}
+        self.__ticker_names: Dict[int, str] = {}
+
+        for pragma, value in (pragmas or {}).items():
+            self.__cursor.execute(f"pragma {pragma}={value}")
+
+        if self.has_table(name="tickers"):
+            self.__cursor.execute("select name, ticker_id from tickers")
+            self.__ticker_ids = dict(self.__cursor.fetchall())
+            self.__ticker_names = {
+                ticker_id: ticker for ticker, ticker_id in self.__ticker_ids.items()
+            }
 
     def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.__is_closed:
+            return
+
+        self.flush()
         self.__connection.close()
+        self.__is_closed = True
+
+    def has_table(self, name: str) -> bool:
+        self.__cursor.execute(
+            "select count(name) from sqlite_master where type='table' and name=?",
+            (name,),
+        )
+        num_of_tables = self.__cursor.fetchone()[0]
+        return num_of_tables > 0
 
     def create_table(self, name: str, columns) -> None:
-        if self.__does_table_exist(name=name):
+        if self.has_table(name=name):
             raise DatabaseTableAlreadyExistsError(f"Table {name} already exists!")
 
         joined_columns = ", ".join([f"{key} {val}" for key, val in columns.items()])
@@ -35,30 +108,102 @@ class ConcreteOrderDatabase(OrderDatabase):
                 f"Cannot create table {name} with columns: {columns}"
             ) from err
 
+    def create_index(self, name: str, table: str, columns: List[str]) -> None:
+        joined_columns = ", ".join(columns)
+        self.__cursor.execute(f"create index {name} on {table} ({joined_columns})")
+
     def insert(self, order: Order) -> None:
-        self.__cursor.execute(
-            "insert into orders values (?, ?, ?, ?, ?, ?)",
-            (
-                order.order_id,
-                order.timestamp,
-                order.ticker,
-                order.price,
-                order.size,
-                order.order_type.name,
-            ),
+        check_integer_column(name="time_created", value=order.timestamp)
+        check_integer_column(name="price", value=order.price_ticks)
+        check_integer_column(name="size", value=order.size)
+
+        params = (
+            order.order_id,
+            order.timestamp,
+            self.__get_or_create_ticker_id(ticker=order.ticker),
+            order.price_ticks,
+            order.size,
+            ORDER_TYPE_CODES[order.order_type],
         )
-        self.__connection.commit()
 
-    def remove(self, order_id: str) -> None:
-        self.__cursor.execute("delete from orders where order_id=?", (order_id,))
+        if not self.__is_batching():
+            self.__cursor.execute(INSERT_QUERY, params)
+            self.__connection.commit()
+            return
 
-    def update(self, order_id: str, size: int) -> None:
-        self.__cursor.execute(
-            "update orders set size = :size where order_id=:order_id",
-            {"order_id": order_id, "size": size},
+        if self.__pending_orders.get(order.order_id) is not None:
+            raise DuplicatedRowError(f"Order {order.order_id} is already stored.")
+
+        self.__enqueue(query=INSERT_QUERY, params=params)
+        self.__pending_orders[order.order_id] = (
+            order.ticker,
+            order.order_type,
+            order.price_ticks,
         )
 
+    def remove(self, order_id: str) -> None:
+        if not self.__is_batching():
+            self.__cursor.execute(REMOVE_QUERY, (order_id,))
+            self.__connection.commit()
+            return
+
+        self.__enqueue(query=REMOVE_QUERY, params=(order_id,))
+        self.__pending_orders[order_id] = None
+
+    def update(self, order_id: str, size: int) -> bool:
+        check_integer_column(name="size", value=size)
+
+        if not self.__is_batching():
+            self.__cursor.execute(UPDATE_QUERY, (size, order_id))
+            self.__connection.commit()
+            return self.__cursor.rowcount == 1
+
+        if (
+            order_id in self.__pending_orders
+            and self.__pending_orders[order_id] is None
+        ):
+            return False
+
+        self.__enqueue(query=UPDATE_QUERY, params=(size, order_id))
+        return True
+
+    def take_failed_writes(self) -> List[Tuple[str, Exception]]:
+        return []
+
+    def begin_batch(self) -> None:
+        self.__batch_depth += 1
+
+    def end_batch(self) -> None:
+        self.__batch_depth -= 1
+        if self.__batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.__pending and not self.__pending_tickers:
+            return
+
+        try:
+            for query, statements in itertools.groupby(
+                self.__pending, key=itemgetter(0)
+            ):
+                self.__cursor.executemany(query, [params for _, params in statements])
+            self.__connection.commit()
+        except Exception:
+            self.__connection.rollback()
+            self.__pending = [
+                (INSERT_TICKER_QUERY, ticker) for ticker in self.__pending_tickers
+            ] + self.__pending
+            self.__pending_tickers = []
+            raise
+
+        self.__pending = []
+        self.__pending_orders = {}
+        self.__pending_tickers = []
+
     def has_order(self, order_id: str) -> bool:
+        if order_id in self.__pending_orders:
+            return self.__pending_orders[order_id] is not None
+
         self.__cursor.execute(
             "select order_id from orders where order_id=?", (order_id,)
         )
@@ -66,41 +211,111 @@ class ConcreteOrderDatabase(OrderDatabase):
         result = self.__cursor.fetchone()
         return result is not None
 
-    def get_best_ask(self, ticker: str) -> float:
+    def get_live_orders(self) -> List[Tuple[str, Tuple[str, OrderType, int]]]:
+        self.flush()
         self.__cursor.execute(
-            """select price from orders where type='ASK' and ticker=?
-            order by price limit 1""",
-            (ticker,),
+            "select order_id, name, type, price from orders join tickers using (ticker_id)"
         )
-        result = self.__cursor.fetchone()
-        return 0.0 if result is None else result[0]
+        return [
+            (order_id, (ticker, ORDER_TYPES_BY_CODE[order_type_code], price_ticks))
+            for order_id, ticker, order_type_code, price_ticks in self.__cursor.fetchall()
+        ]
+
+    def find_order(self, order_id: str) -> Optional[Tuple[str, OrderType, int]]:
+        if order_id in self.__pending_orders:
+            return self.__pending_orders[order_id]
 
-    def get_best_bid(self, ticker: str) -> float:
         self.__cursor.execute(
-            """select price from orders where type='BID' and ticker=?
-            order by price desc limit 1""",
-            (ticker,),
+            """select name, type, price from orders join tickers using (ticker_id)
+            where order_id=?""",
+            (order_id,),
         )
         result = self.__cursor.fetchone()
-        return 0.0 if result is None else result[0]
+        if result is None:
+            return None
 
-    def fetch_orders(self) -> list:
-        self.__cursor.execute("select * from orders")
+        ticker, order_type_code, price_ticks = result
+        return ticker, ORDER_TYPES_BY_CODE[order_type_code], price_ticks
+
+    def get_best_ask(self, ticker: str) -> int:
+        return self.__get_best_price(ticker=ticker, order_type=OrderType.ASK)
+
+    def get_best_bid(self, ticker: str) -> int:
+        return self.__get_best_price(ticker=ticker, order_type=OrderType.BID)
+
+    def get_best_prices(self) -> Dict[str, Tuple[int, int]]:
+        self.flush()
+        self.__cursor.execute(
+            BEST_PRICES_QUERY,
+            (ORDER_TYPE_CODES[OrderType.BID], ORDER_TYPE_CODES[OrderType.ASK]),
+        )
+        return {ticker: (bid, ask) for ticker, bid, ask in self.__cursor.fetchall()}
+
+    def get_depth(
+        self, ticker: str, order_type: OrderType, levels: int
+    ) -> List[Tuple[int, int, int]]:
+        self.flush()
+        if ticker not in self.__ticker_ids:
+            return []
+
+        ordering = "asc" if order_type == OrderType.ASK else "desc"
+        self.__cursor.execute(
+            f"""select price, sum(size), count(*) from orders
+            where ticker_id=? and type=?
+            group by price order by price {ordering} limit ?""",
+            (self.__ticker_ids[ticker], ORDER_TYPE_CODES[order_type], levels),
+        )
         return self.__cursor.fetchall()
 
+    def fetch_orders(self) -> list:
+        return self.fetch_columns(columns=list(ORDER_COLUMNS))
+
     def fetch_column(self, column: str) -> list:
-        self.__cursor.execute(f"select {column} from orders")
-        return self.__cursor.fetchall()
+        return self.fetch_columns(columns=[column])
 
     def fetch_columns(self, columns: List[str]) -> list:
-        selected_columns = ", ".join(columns)
-        self.__cursor.execute(f"select {selected_columns} from orders")
+        self.flush()
+        selected_columns = ", ".join([ORDER_COLUMNS[column] for column in columns])
+        self.__cursor.execute(
+            f"""select {selected_columns} from orders join tickers using (ticker_id)
+            order by orders.rowid"""
+        )
         return self.__cursor.fetchall()
 
-    def __does_table_exist(self, name: str) -> bool:
+    def __get_best_price(self, ticker: str, order_type: OrderType) -> int:
+        self.flush()
+        if ticker not in self.__ticker_ids:
+            return 0
+
+        ordering = "asc" if order_type == OrderType.ASK else "desc"
         self.__cursor.execute(
-            "select count(name) from sqlite_master where type='table' and name=?",
-            (name,),
+            f"""select price from orders where ticker_id=? and type=?
+            order by price {ordering} limit 1""",
+            (self.__ticker_ids[ticker], ORDER_TYPE_CODES[order_type]),
         )
-        num_of_orders_tables = self.__cursor.fetchone()[0]
-        return num_of_orders_tables > 0
+        result = self.__cursor.fetchone()
+        return 0 if result is None else result[0]
+
+    def __get_or_create_ticker_id(self, ticker: str) -> int:
+        ticker_id = self.__ticker_ids.get(ticker)
+        if ticker_id is None:
+            self.__cursor.execute("insert into tickers (name) values (?)", (ticker,))
+            ticker_id = self.__cursor.lastrowid
+            assert ticker_id is not None
+            self.__ticker_ids[ticker] = ticker_id
+            self.__ticker_names[ticker_id] = ticker
+            if self.__is_batching():
+                self.__pending_tickers.append((ticker_id, ticker))
+        return ticker_id
+
+    def __is_batching(self) -> bool:
+        return self.__batch_size > 1 or self.__batch_depth > 0
+
+    def __enqueue(self, query: str, params: tuple) -> None:
+        self.__pending.append((query, params))
+        if len(self.__pending) >= self.__batch_size and self.__batch_depth == 0:
+            try:
+                self.flush()
+            except Exception:
+                self.__pending.pop()
+                raise
@@ -1,7 +1,15 @@
-from ..best_bid_and_ask_view import BestBidAndAskView
+from array import array
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from ..depth_view import DepthView, MarketDepth, PriceLevel
 from ..order import Order, OrderType
 from ..order_book import OrderBookError, OrderBookProcessor
+from ..prices import ticks_to_price
 from .concrete_order_database import OrderDatabase
+from .live_orders import LiveOrders
+from .order_database import ORDER_TYPE_CODES, ColumnValueOutOfRangeError
 
 
 class OrderDoesNotExistError(OrderBookError):
@@ -16,25 +24,26 @@ class DuplicatedOrderIdError(OrderBookError):
     pass
 
 
-class DatabaseOrderBook(OrderBookProcessor, BestBidAndAskView):
-    def __init__(self, database: OrderDatabase) -> None:
-        self.__database = database
+class OrderValueOutOfRangeError(OrderBookError):
+    pass
 
-        order_types = ", ".join(
-            [f"'{order_type.name}'" for order_type in list(OrderType)]
-        )
 
-        self.__database.create_table(
-            name="orders",
-            columns={
-                "order_id": "text primary key not null",
-                "time_created": "timestamp not null",
-                "ticker": "text not null",
-                "price": "real not null",
-                "size": "integer not null",
-                "type": f"text check(type in ({order_types})) not null",
-            },
-        )
+class OrderWriteFailedError(OrderBookError):
+    pass
+
+
+class DatabaseOrderBook(OrderBookProcessor, BestBidAndAskView, DepthView):
+    def __init__(
+        self, database: OrderDatabase, compact_order_ids: bool = False
+    ) -> None:
+        self.__database = database
+        self.__best_prices: Dict[Tuple[str, OrderType], int] = {}
+        self.__live_orders = LiveOrders(compact=compact_order_ids)
+
+        if self.__database.has_table(name="orders"):
+            self.__live_orders.update(live_orders=self.__database.get_live_orders())
+        else:
+            self.__create_schema()
 
     def add_order(self, order: Order) -> None:
         if order.size == 0:
@@ -42,29 +51,182 @@ class DatabaseOrderBook(OrderBookProcessor, BestBidAndAskView):
                 f"Cannot add order with id: {order.order_id} due to size being 0."
             )
 
+        if order.order_id in self.__live_orders:
+            raise DuplicatedOrderIdError(
+                f"Cannot add order with id: {order.order_id} to database."
+            )
+
         try:
             self.__database.insert(order=order)
+        except ColumnValueOutOfRangeError as err:
+            raise OrderValueOutOfRangeError(
+                f"Cannot add order with id: {order.order_id}. " + str(err)
+            ) from err
         except Exception as err:
             raise DuplicatedOrderIdError(
                 f"Cannot add order with id: {order.order_id} to database." + str(err)
             ) from err
+        self.__live_orders.add(
+            order_id=order.order_id,
+            live_order=(order.ticker, order.order_type, order.price_ticks),
+        )
+
+        key = (order.ticker, order.order_type)
+        best_price = self.__best_prices.get(key)
+        if best_price is not None and (
+            best_price == 0 or _is_better(order=order, price_ticks=best_price)
+        ):
+            self.__best_prices[key] = order.price_ticks
+
+        self.__raise_failed_writes()
 
     def cancel(self, order_id: str) -> None:
-        if not self.__database.has_order(order_id=order_id):
+        live_order = self.__live_orders.get(order_id=order_id)
+        if live_order is None:
             raise OrderDoesNotExistError(
                 f"Cannot cancel non existing order: {order_id}"
             )
+
         self.__database.remove(order_id=order_id)
+        self.__live_orders.discard(order_id=order_id)
+
+        ticker, order_type, price_ticks = live_order
+        if self.__best_prices.get((ticker, order_type)) == price_ticks:
+            del self.__best_prices[(ticker, order_type)]
+
+        self.__raise_failed_writes()
 
     def update(self, order_id: str, size: int) -> None:
-        if not self.__database.has_order(order_id=order_id):
+        if order_id not in self.__live_orders:
+            raise OrderDoesNotExistError(
+                f"Cannot update non existing order: {order_id}"
+            )
+
+        try:
+            is_updated = self.__database.update(order_id=order_id, size=size)
+        except ColumnValueOutOfRangeError as err:
+            raise OrderValueOutOfRangeError(
+                f"Cannot update order with id: {order_id}. " + str(err)
+            ) from err
+        if not is_updated:
             raise OrderDoesNotExistError(
                 f"Cannot update non existing order: {order_id}"
             )
-        self.__database.update(order_id=order_id, size=size)
+
+        self.__raise_failed_writes()
+
+    def close(self) -> None:
+        self.__database.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self.__database.begin_batch()
+        try:
+            yield
+        finally:
+            self.__database.end_batch()
 
     def get_best_ask(self, ticker: str) -> float:
-        return self.__database.get_best_ask(ticker=ticker)
+        best_price = self.__best_prices.get((ticker, OrderType.ASK))
+        if best_price is None:
+            best_price = self.__database.get_best_ask(ticker=ticker)
+            self.__best_prices[(ticker, OrderType.ASK)] = best_price
+        return ticks_to_price(price_ticks=best_price)
 
     def get_best_bid(self, ticker: str) -> float:
-        return self.__database.get_best_bid(ticker=ticker)
+        best_price = self.__best_prices.get((ticker, OrderType.BID))
+        if best_price is None:
+            best_price = self.__database.get_best_bid(ticker=ticker)
+            self.__best_prices[(ticker, OrderType.BID)] = best_price
+        return ticks_to_price(price_ticks=best_price)
+
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        best_prices = self.__database.get_best_prices()
+        if tickers is None:
+            tickers = list(best_prices)
+
+        bids = array("d")
+        asks = array("d")
+        for ticker in tickers:
+            best_bid, best_ask = best_prices.get(ticker, (0, 0))
+            bids.append(ticks_to_price(price_ticks=best_bid))
+            asks.append(ticks_to_price(price_ticks=best_ask))
+
+        return BestBidsAndAsks(tickers=list(tickers), bids=bids, asks=asks)
+
+    def get_depth(self, ticker: str, levels: int) -> MarketDepth:
+        return MarketDepth(
+            bids=self.__get_levels(
+                ticker=ticker, order_type=OrderType.BID, levels=levels
+            ),
+            asks=self.__get_levels(
+                ticker=ticker, order_type=OrderType.ASK, levels=levels
+            ),
+        )
+
+    def __create_schema(self) -> None:
+        order_types = ", ".join([str(code) for code in ORDER_TYPE_CODES.values()])
+
+        self.__database.create_table(
+            name="tickers",
+            columns={
+                "ticker_id": "integer primary key",
+                "name": "text unique not null",
+            },
+        )
+        self.__database.create_table(
+            name="orders",
+            columns={
+                "order_id": "text primary key not null",
+                "time_created": "timestamp not null",
+                "ticker_id": "integer not null references tickers(ticker_id)",
+                "price": "integer not null",
+                "size": "integer not null",
+                "type": f"integer check(type in ({order_types})) not null",
+            },
+        )
+        self.__database.create_index(
+            name="orders_by_price",
+            table="orders",
+            columns=["ticker_id", "type", "price"],
+        )
+
+    def __raise_failed_writes(self) -> None:
+        failed_writes = self.__database.take_failed_writes()
+        if not failed_writes:
+            return
+
+        self.__best_prices.clear()
+        for order_id, _ in failed_writes:
+            live_order = self.__database.find_order(order_id=order_id)
+            if live_order is None:
+                self.__live_orders.discard(order_id=order_id)
+            else:
+                self.__live_orders.add(order_id=order_id, live_order=live_order)
+
+        raise OrderWriteFailedError(
+            "Cannot write orders to database: "
+            + ", ".join(f"{order_id} ({err})" for order_id, err in failed_writes)
+        )
+
+    def __get_levels(
+        self, ticker: str, order_type: OrderType, levels: int
+    ) -> List[PriceLevel]:
+        return [
+            PriceLevel(
+                price=ticks_to_price(price_ticks=price_ticks),
+                size=size,
+                num_of_orders=num_of_orders,
+            )
+            for price_ticks, size, num_of_orders in self.__database.get_depth(
+                ticker=ticker, order_type=order_type, levels=levels
+            )
+        ]
+
+
+def _is_better(order: Order, price_ticks: int) -> bool:
+    if order.order_type == OrderType.ASK:
+        return order.price_ticks < price_ticks
+    return order.price_ticks > price_ticks
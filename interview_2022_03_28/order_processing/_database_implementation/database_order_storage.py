@@ -1,16 +1,37 @@
+from typing import Callable, Optional
+
 from ..best_bid_and_ask_view import BestBidAndAskView
 from ..order_book import OrderBookProcessor
 from ..order_storage import OrderStorage
 from .database_order_book import DatabaseOrderBook
 from .order_database import OrderDatabase
+from .pooled_best_bid_and_ask_view import PooledBestBidAndAskView
+from .reader_connection_pool import ReaderConnectionPool
 
 
 class DatabaseOrderStorage(OrderStorage):
-    def __init__(self, database: OrderDatabase) -> None:
-        self.__order_book = DatabaseOrderBook(database=database)
+    def __init__(
+        self,
+        database: OrderDatabase,
+        compact_order_ids: bool = False,
+        create_reader_pool: Optional[Callable[[], ReaderConnectionPool]] = None,
+    ) -> None:
+        self.__order_book = DatabaseOrderBook(
+            database=database, compact_order_ids=compact_order_ids
+        )
+        self.__reader_pool = (
+            None if create_reader_pool is None else create_reader_pool()
+        )
 
     def get_processor(self) -> OrderBookProcessor:
         return self.__order_book
 
     def get_price_view(self) -> BestBidAndAskView:
-        return self.__order_book
+        if self.__reader_pool is None:
+            return self.__order_book
+        return PooledBestBidAndAskView(pool=self.__reader_pool)
+
+    def close(self) -> None:
+        if self.__reader_pool is not None:
+            self.__reader_pool.close()
+        self.__order_book.close()
@@ -1,9 +1,76 @@
+from typing import Dict, Union
+
 from ..order_storage import OrderStorage
+from .async_order_database import DEFAULT_QUEUE_SIZE, AsyncOrderDatabase
 from .concrete_order_database import ConcreteOrderDatabase
 from .database_order_storage import DatabaseOrderStorage
+from .order_database import OrderDatabase
+from .reader_connection_pool import ReaderConnectionPool
+
+IN_MEMORY_DATABASE = ":memory:"
+
+FILE_DATABASE_PRAGMAS: Dict[str, Union[str, int]] = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "cache_size": -64_000,
+    "mmap_size": 268_435_456,
+    "temp_store": "memory",
+}
+
+READER_PRAGMAS: Dict[str, Union[str, int]] = {
+    "cache_size": -16_000,
+    "mmap_size": 268_435_456,
+}
+
+
+class InMemoryReaderPoolError(Exception):
+    pass
+
+
+class DeferredWritesReaderPoolError(Exception):
+    pass
+
+
+def create_db_order_storage(
+    batch_size: int = 1,
+    database_path: str = IN_MEMORY_DATABASE,
+    compact_order_ids: bool = False,
+    asynchronous: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    num_of_readers: int = 0,
+) -> OrderStorage:
+    if num_of_readers > 0 and database_path == IN_MEMORY_DATABASE:
+        raise InMemoryReaderPoolError(
+            "Reader connections require a file database, not an in-memory one."
+        )
+    if num_of_readers > 0 and (asynchronous or batch_size > 1):
+        raise DeferredWritesReaderPoolError(
+            "Reader connections only see committed orders, so they require "
+            "synchronous writes with batch_size=1."
+        )
+
+    pragmas = {} if database_path == IN_MEMORY_DATABASE else FILE_DATABASE_PRAGMAS
+
+    def create_database() -> ConcreteOrderDatabase:
+        return ConcreteOrderDatabase(
+            database_name=database_path, batch_size=batch_size, pragmas=pragmas
+        )
+
+    database: OrderDatabase = (
+        AsyncOrderDatabase(create_database=create_database, queue_size=queue_size)
+        if asynchronous
+        else create_database()
+    )
 
+    def create_reader_pool() -> ReaderConnectionPool:
+        return ReaderConnectionPool(
+            database_path=database_path,
+            num_of_connections=num_of_readers,
+            pragmas=READER_PRAGMAS,
+        )
 
-def create_db_order_storage() -> OrderStorage:
     return DatabaseOrderStorage(
-        database=ConcreteOrderDatabase(database_name=":memory:")
+        database=database,
+        compact_order_ids=compact_order_ids,
+        create_reader_pool=create_reader_pool if num_of_readers > 0 else None,
     )
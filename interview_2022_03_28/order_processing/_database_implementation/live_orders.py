@@ -0,0 +1,39 @@
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from ..order import OrderType
+
+OrderIdKey = Union[str, int]
+LiveOrder = Tuple[str, OrderType, int]
+
+
+class LiveOrders:
+    def __init__(self, compact: bool = False) -> None:
+        self.__compact = compact
+        self.__orders: Dict[OrderIdKey, LiveOrder] = {}
+        self.__tickers: Dict[str, str] = {}
+
+    def __contains__(self, order_id: str) -> bool:
+        return self.__key(order_id=order_id) in self.__orders
+
+    def __len__(self) -> int:
+        return len(self.__orders)
+
+    def get(self, order_id: str) -> Optional[LiveOrder]:
+        return self.__orders.get(self.__key(order_id=order_id))
+
+    def add(self, order_id: str, live_order: LiveOrder) -> None:
+        ticker, order_type, price_ticks = live_order
+        ticker = self.__tickers.setdefault(ticker, ticker)
+        self.__orders[self.__key(order_id=order_id)] = (ticker, order_type, price_ticks)
+
+    def update(self, live_orders: Iterable[Tuple[str, LiveOrder]]) -> None:
+        for order_id, live_order in live_orders:
+            self.add(order_id=order_id, live_order=live_order)
+
+    def discard(self, order_id: str) -> None:
+        self.__orders.pop(self.__key(order_id=order_id), None)
+
+    def __key(self, order_id: str) -> OrderIdKey:
+        if not self.__compact:
+            return order_id
+        return int.from_bytes(b"\x01" + order_id.encode(), "big")
@@ -1,13 +1,37 @@
 from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
 
-from ..order import Order
+from ..order import Order, OrderType
+
+ORDER_TYPE_CODES: Dict[OrderType, int] = {OrderType.BID: 0, OrderType.ASK: 1}
+
+SQLITE_INTEGER_RANGE = range(-(2**63), 2**63)
+
+
+class ColumnValueOutOfRangeError(Exception):
+    pass
+
+
+def check_integer_column(name: str, value: int) -> None:
+    if value not in SQLITE_INTEGER_RANGE:
+        raise ColumnValueOutOfRangeError(
+            f"Value {value} of column {name} does not fit in an SQLite integer."
+        )
 
 
 class OrderDatabase(ABC):
+    @abstractmethod
+    def has_table(self, name: str) -> bool:
+        pass
+
     @abstractmethod
     def create_table(self, name: str, columns) -> None:
         pass
 
+    @abstractmethod
+    def create_index(self, name: str, table: str, columns: List[str]) -> None:
+        pass
+
     @abstractmethod
     def insert(self, order: Order) -> None:
         pass
@@ -21,13 +45,51 @@ class OrderDatabase(ABC):
         pass
 
     @abstractmethod
-    def update(self, order_id: str, size: int) -> None:
+    def update(self, order_id: str, size: int) -> bool:
+        pass
+
+    @abstractmethod
+    def get_live_orders(self) -> List[Tuple[str, Tuple[str, OrderType, int]]]:
+        pass
+
+    @abstractmethod
+    def find_order(self, order_id: str) -> Optional[Tuple[str, OrderType, int]]:
+        pass
+
+    @abstractmethod
+    def take_failed_writes(self) -> List[Tuple[str, Exception]]:
+        pass
+
+    @abstractmethod
+    def begin_batch(self) -> None:
+        pass
+
+    @abstractmethod
+    def end_batch(self) -> None:
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_best_ask(self, ticker: str) -> int:
+        pass
+
+    @abstractmethod
+    def get_best_bid(self, ticker: str) -> int:
         pass
 
     @abstractmethod
-    def get_best_ask(self, ticker: str) -> float:
+    def get_best_prices(self) -> Dict[str, Tuple[int, int]]:
         pass
 
     @abstractmethod
-    def get_best_bid(self, ticker: str) -> float:
+    def get_depth(
+        self, ticker: str, order_type: OrderType, levels: int
+    ) -> List[Tuple[int, int, int]]:
         pass
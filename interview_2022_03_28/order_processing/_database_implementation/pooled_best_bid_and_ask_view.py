@@ -0,0 +1,60 @@
+from array import array
+from typing import Optional, Sequence
+
+from ..best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from ..order import OrderType
+from ..prices import ticks_to_price
+from .concrete_order_database import BEST_PRICES_QUERY
+from .order_database import ORDER_TYPE_CODES
+from .reader_connection_pool import ReaderConnectionPool
+
+BEST_ASK_QUERY = """select min(price) from orders
+    where ticker_id=(select ticker_id from tickers where name=?) and type=?"""
+BEST_BID_QUERY = """select max(price) from orders
+    where ticker_id=(select ticker_id from tickers where name=?) and type=?"""
+
+
+class PooledBestBidAndAskView(BestBidAndAskView):
+    def __init__(self, pool: ReaderConnectionPool) -> None:
+        self.__pool = pool
+
+    def get_best_ask(self, ticker: str) -> float:
+        return self.__get_best_price(
+            query=BEST_ASK_QUERY, ticker=ticker, order_type=OrderType.ASK
+        )
+
+    def get_best_bid(self, ticker: str) -> float:
+        return self.__get_best_price(
+            query=BEST_BID_QUERY, ticker=ticker, order_type=OrderType.BID
+        )
+
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        with self.__pool.connection() as connection:
+            best_prices = {
+                ticker: (bid, ask)
+                for ticker, bid, ask in connection.execute(
+                    BEST_PRICES_QUERY,
+                    (ORDER_TYPE_CODES[OrderType.BID], ORDER_TYPE_CODES[OrderType.ASK]),
+                )
+            }
+
+        if tickers is None:
+            tickers = list(best_prices)
+
+        bids = array("d")
+        asks = array("d")
+        for ticker in tickers:
+            best_bid, best_ask = best_prices.get(ticker, (0, 0))
+            bids.append(ticks_to_price(price_ticks=best_bid))
+            asks.append(ticks_to_price(price_ticks=best_ask))
+
+        return BestBidsAndAsks(tickers=list(tickers), bids=bids, asks=asks)
+
+    def __get_best_price(self, query: str, ticker: str, order_type: OrderType) -> float:
+        with self.__pool.connection() as connection:
+            best_price = connection.execute(
+                query, (ticker, ORDER_TYPE_CODES[order_type])
+            ).fetchone()[0]
+        return ticks_to_price(price_ticks=best_price or 0)
@@ -0,0 +1,48 @@
+import queue
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+
+class ReaderConnectionPool:
+    def __init__(
+        self,
+        database_path: str,
+        num_of_connections: int,
+        pragmas: Optional[Dict[str, Union[str, int]]] = None,
+    ) -> None:
+        self.__connections: List[sqlite3.Connection] = []
+        self.__available: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        database_uri = Path(database_path).resolve().as_uri() + "?mode=ro"
+
+        for _ in range(num_of_connections):
+            connection = sqlite3.connect(
+                database=database_uri,
+                uri=True,
+                check_same_thread=False,
+            )
+            for pragma, value in (pragmas or {}).items():
+                connection.execute(f"pragma {pragma}={value}")
+
+            self.__connections.append(connection)
+            self.__available.put(connection)
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.__connections)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self.__available.get()
+        try:
+            yield connection
+        finally:
+            self.__available.put(connection)
+
+    def close(self) -> None:
+        for connection in self.__connections:
+            connection.close()
+        self.__connections = []
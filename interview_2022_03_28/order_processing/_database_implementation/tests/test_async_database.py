@@ -0,0 +1,188 @@
+import re
+import sqlite3
+import threading
+from typing import Iterable, Set
+
+import pytest
+
+from ...order import Order, OrderType
+from ...prices import price_to_ticks
+from ...process_order import process_order
+from ..async_order_database import AsyncOrderDatabase, DatabaseClosedError
+from ..concrete_order_database import ConcreteOrderDatabase
+from ..database_order_book import DatabaseOrderBook
+from ..database_order_storage_factory import create_db_order_storage
+
+
+class BlockingOrderDatabase(ConcreteOrderDatabase):
+    def __init__(self, release: threading.Event) -> None:
+        super().__init__(database_name=":memory:")
+        self.__release = release
+
+    def insert(self, order: Order) -> None:
+        self.__release.wait()
+        super().insert(order=order)
+
+
+class FailingOrderDatabase(ConcreteOrderDatabase):
+    def __init__(
+        self,
+        failing_inserts: Iterable[str] = (),
+        failing_removes: Iterable[str] = (),
+    ) -> None:
+        super().__init__(database_name=":memory:")
+        self.__failing_inserts = set(failing_inserts)
+        self.__failing_removes = set(failing_removes)
+
+    def insert(self, order: Order) -> None:
+        _fail_once(order_ids=self.__failing_inserts, order_id=order.order_id)
+        super().insert(order=order)
+
+    def remove(self, order_id: str) -> None:
+        _fail_once(order_ids=self.__failing_removes, order_id=order_id)
+        super().remove(order_id=order_id)
+
+
+def _fail_once(order_ids: Set[str], order_id: str) -> None:
+    if order_id in order_ids:
+        order_ids.discard(order_id)
+        raise sqlite3.OperationalError("disk I/O error")
+
+
+@pytest.fixture(name="database_path")
+def fixture_database_path(tmp_path) -> str:
+    return str(tmp_path / "orders.db")
+
+
+def test_writes_should_not_wait_for_writer_thread():
+    release = threading.Event()
+    database = AsyncOrderDatabase(
+        create_database=lambda: BlockingOrderDatabase(release=release)
+    )
+    order_book = DatabaseOrderBook(database=database)
+
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=order_book, order="2|o1|u|5")
+    process_order(order_book=order_book, order="2|o2|a|TICK|B|1.2|1")
+    process_order(order_book=order_book, order="3|o2|c")
+
+    release.set()
+    assert database.find_order(order_id="o1") == (
+        "TICK",
+        OrderType.BID,
+        price_to_ticks(price=1.1),
+    )
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.1)
+    database.close()
+
+
+def test_reads_should_see_queued_writes(capsys):
+    storage = create_db_order_storage(asynchronous=True, queue_size=4)
+    processor = storage.get_processor()
+    for idx in range(100):
+        process_order(order_book=processor, order=f"1|o{idx}|a|TICK|B|{idx + 1}|1")
+    process_order(order_book=processor, order="2|o99|c")
+    process_order(order_book=processor, order="2|o98|u|7")
+
+    assert "ERROR" not in capsys.readouterr().err
+    assert storage.get_price_view().get_best_bid(ticker="TICK") == pytest.approx(99.0)
+    depth = processor.get_depth(ticker="TICK", levels=1)
+    assert (depth.bids[0].price, depth.bids[0].size) == (pytest.approx(99.0), 7)
+    storage.close()
+
+
+def test_closing_should_persist_queued_writes(database_path: str):
+    storage = create_db_order_storage(database_path=database_path, asynchronous=True)
+    processor = storage.get_processor()
+    process_order(order_book=processor, order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=processor, order="1|o2|a|TICK|S|1.5|1")
+    process_order(order_book=processor, order="2|o1|u|3")
+    process_order(order_book=processor, order="3|o2|c")
+    storage.close()
+
+    connection = sqlite3.connect(database=database_path)
+    try:
+        orders = connection.execute("select order_id, size from orders").fetchall()
+    finally:
+        connection.close()
+
+    assert orders == [("o1", 3)]
+
+
+def test_reopened_orders_should_be_cancelled_and_updated(database_path: str, capsys):
+    storage = create_db_order_storage(database_path=database_path)
+    process_order(order_book=storage.get_processor(), order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=storage.get_processor(), order="1|o2|a|TICK|B|1.3|1")
+    storage.close()
+
+    reopened = create_db_order_storage(database_path=database_path, asynchronous=True)
+    process_order(order_book=reopened.get_processor(), order="2|o2|c")
+    process_order(order_book=reopened.get_processor(), order="2|o1|u|4")
+
+    assert "ERROR" not in capsys.readouterr().err
+    assert reopened.get_price_view().get_best_bid(ticker="TICK") == pytest.approx(1.1)
+    reopened.close()
+
+
+def test_failed_insert_should_be_reported_and_rolled_back(capsys):
+    database = AsyncOrderDatabase(
+        create_database=lambda: FailingOrderDatabase(failing_inserts={"o1"})
+    )
+    order_book = DatabaseOrderBook(database=database)
+
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.5|1")
+    database.flush()
+    process_order(order_book=order_book, order="2|o2|a|TICK|B|1.1|1")
+    assert re.match("ERROR.*o1.*disk I/O error", capsys.readouterr().err)
+
+    process_order(order_book=order_book, order="3|o1|c")
+    assert re.match("ERROR", capsys.readouterr().err)
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.1)
+
+    process_order(order_book=order_book, order="4|o1|a|TICK|B|1.5|1")
+    assert capsys.readouterr().err == ""
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.5)
+    database.close()
+
+
+def test_failed_cancel_should_keep_order_live(capsys):
+    database = AsyncOrderDatabase(
+        create_database=lambda: FailingOrderDatabase(failing_removes={"o1"})
+    )
+    order_book = DatabaseOrderBook(database=database)
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.5|1")
+
+    process_order(order_book=order_book, order="2|o1|c")
+    database.flush()
+    process_order(order_book=order_book, order="3|o2|a|TICK|B|1.1|1")
+    assert re.match("ERROR.*o1", capsys.readouterr().err)
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.5)
+
+    process_order(order_book=order_book, order="4|o1|c")
+    assert capsys.readouterr().err == ""
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.1)
+    database.close()
+
+
+def test_out_of_range_order_should_be_rejected_before_queueing(capsys):
+    storage = create_db_order_storage(asynchronous=True)
+    processor = storage.get_processor()
+
+    process_order(order_book=processor, order="1|o1|a|TICK|B|1.1|99999999999999999999")
+    assert re.match("ERROR", capsys.readouterr().err)
+
+    process_order(order_book=processor, order="2|o1|a|TICK|B|1.1|1")
+    process_order(order_book=processor, order="3|o1|u|99999999999999999999")
+    assert re.match("ERROR", capsys.readouterr().err)
+    assert processor.get_depth(ticker="TICK", levels=1).bids[0].size == 1
+    storage.close()
+
+
+def test_closed_database_should_reject_calls():
+    database = AsyncOrderDatabase(
+        create_database=lambda: ConcreteOrderDatabase(database_name=":memory:")
+    )
+    database.close()
+
+    with pytest.raises(DatabaseClosedError):
+        database.get_best_bid(ticker="TICK")
@@ -0,0 +1,141 @@
+import re
+import sqlite3
+
+import pytest
+
+from ...prices import price_to_ticks
+from ...process_order import process_order
+from ..concrete_order_database import ConcreteOrderDatabase
+from ..database_order_book import DatabaseOrderBook
+
+
+@pytest.fixture(name="database_path")
+def fixture_database_path(tmp_path) -> str:
+    return str(tmp_path / "orders.db")
+
+
+def count_committed_orders(database_path: str) -> int:
+    connection = sqlite3.connect(database=database_path)
+    try:
+        return connection.execute("select count(*) from orders").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_given_batch_size_orders_should_be_committed_once_batch_is_full(
+    database_path: str,
+):
+    order_book = DatabaseOrderBook(
+        database=ConcreteOrderDatabase(database_name=database_path, batch_size=3)
+    )
+
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=order_book, order="1|o2|a|TICK|B|1.2|1")
+    assert count_committed_orders(database_path=database_path) == 0
+
+    process_order(order_book=order_book, order="1|o3|a|TICK|B|1.3|1")
+    assert count_committed_orders(database_path=database_path) == 3
+
+
+def test_batch_context_should_commit_on_exit(database_path: str):
+    order_book = DatabaseOrderBook(
+        database=ConcreteOrderDatabase(database_name=database_path)
+    )
+
+    with order_book.batch():
+        for idx in range(5):
+            process_order(order_book=order_book, order=f"1|o{idx}|a|TICK|S|1.{idx}|1")
+        assert count_committed_orders(database_path=database_path) == 0
+
+    assert count_committed_orders(database_path=database_path) == 5
+
+
+def test_batched_operations_should_apply_in_order(order_book, database):
+    with order_book.batch():
+        process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+        process_order(order_book=order_book, order="1|o2|a|TICK|B|1.2|1")
+        process_order(order_book=order_book, order="2|o1|u|7")
+        process_order(order_book=order_book, order="3|o2|c")
+        process_order(order_book=order_book, order="4|o2|a|TICK|S|1.5|3")
+        process_order(order_book=order_book, order="5|o2|u|9")
+
+    assert database.fetch_columns(columns=["order_id", "price", "size", "type"]) == [
+        ("o1", price_to_ticks(price=1.1), 7, "BID"),
+        ("o2", price_to_ticks(price=1.5), 9, "ASK"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "order", ["2|o1|a|TICK|S|2.0|1", "2|gone|c", "2|gone|u|5", "2|missing|c"]
+)
+def test_invalid_operations_in_batch_should_log_error(order_book, capsys, order: str):
+    with order_book.batch():
+        process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+        process_order(order_book=order_book, order="1|gone|a|TICK|B|1.1|1")
+        process_order(order_book=order_book, order="1|gone|c")
+        capsys.readouterr()
+        process_order(order_book=order_book, order=order)
+
+    assert re.match("ERROR", capsys.readouterr().err)
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.1)
+    assert order_book.get_best_ask(ticker="TICK") == 0.0
+
+
+def test_reads_inside_batch_should_see_pending_orders(order_book):
+    with order_book.batch():
+        process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+
+        assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.1)
+
+
+def test_out_of_range_order_should_be_rejected_without_losing_batch(
+    database_path: str, capsys
+):
+    order_book = DatabaseOrderBook(
+        database=ConcreteOrderDatabase(database_name=database_path, batch_size=10)
+    )
+
+    for idx in range(9):
+        process_order(order_book=order_book, order=f"1|o{idx}|a|TICK|B|1.{idx}|1")
+    process_order(
+        order_book=order_book, order="1|huge|a|TICK|B|2.0|99999999999999999999"
+    )
+    assert re.match("ERROR", capsys.readouterr().err)
+
+    process_order(order_book=order_book, order="1|o9|a|TICK|B|1.9|1")
+    assert count_committed_orders(database_path=database_path) == 10
+
+    process_order(order_book=order_book, order="2|huge|c")
+    assert re.match("ERROR", capsys.readouterr().err)
+    process_order(order_book=order_book, order="2|o9|c")
+    assert capsys.readouterr().err == ""
+
+
+def test_out_of_range_update_should_log_error(order_book, capsys):
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=order_book, order="2|o1|u|99999999999999999999")
+
+    assert re.match("ERROR", capsys.readouterr().err)
+
+
+def test_failed_flush_should_keep_pending_orders(database_path: str):
+    database = ConcreteOrderDatabase(
+        database_name=database_path, pragmas={"busy_timeout": 0}
+    )
+    order_book = DatabaseOrderBook(database=database)
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+
+    locking_connection = sqlite3.connect(database=database_path)
+    locking_connection.execute("begin exclusive")
+    with pytest.raises(sqlite3.OperationalError):
+        with order_book.batch():
+            process_order(order_book=order_book, order="2|o2|a|TICK|S|2.0|1")
+            process_order(order_book=order_book, order="3|o1|u|5")
+    locking_connection.rollback()
+    locking_connection.close()
+
+    database.flush()
+    assert database.fetch_columns(columns=["order_id", "size"]) == [
+        ("o1", 5),
+        ("o2", 1),
+    ]
@@ -2,14 +2,15 @@ import pytest
 
 from ...best_bid_and_ask import get_best_bid_and_ask
 from ...order import Order, OrderType
+from ...prices import price_to_ticks
 
 
 def create_ask(order_id: str, ticker: str, price: float) -> Order:
     return Order(
         order_id=order_id,
-        timestamp="2",
+        timestamp=2,
         ticker=ticker,
-        price=price,
+        price_ticks=price_to_ticks(price=price),
         size=1,
         order_type=OrderType.ASK,
     )
@@ -18,9 +19,9 @@ def create_ask(order_id: str, ticker: str, price: float) -> Order:
 def create_bid(order_id: str, ticker: str, price: float) -> Order:
     return Order(
         order_id=order_id,
-        timestamp="23",
+        timestamp=23,
         ticker=ticker,
-        price=price,
+        price_ticks=price_to_ticks(price=price),
         size=1,
         order_type=OrderType.BID,
     )
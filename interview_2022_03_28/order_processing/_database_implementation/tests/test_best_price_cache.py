@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from ...prices import price_to_ticks
+from ...process_order import process_order
+from ..concrete_order_database import ConcreteOrderDatabase
+from ..database_order_book import DatabaseOrderBook
+
+
+class CountingOrderDatabase(ConcreteOrderDatabase):
+    def __init__(self) -> None:
+        super().__init__(database_name=":memory:")
+        self.num_of_best_price_queries = 0
+
+    def get_best_ask(self, ticker: str) -> int:
+        self.num_of_best_price_queries += 1
+        return super().get_best_ask(ticker=ticker)
+
+    def get_best_bid(self, ticker: str) -> int:
+        self.num_of_best_price_queries += 1
+        return super().get_best_bid(ticker=ticker)
+
+
+def test_repeated_reads_should_be_served_from_cache():
+    database = CountingOrderDatabase()
+    order_book = DatabaseOrderBook(database=database)
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+
+    for _ in range(10):
+        assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.1)
+        assert order_book.get_best_ask(ticker="TICK") == 0.0
+
+    assert database.num_of_best_price_queries == 2
+
+
+def test_adds_and_updates_should_not_invalidate_cached_prices():
+    database = CountingOrderDatabase()
+    order_book = DatabaseOrderBook(database=database)
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+    order_book.get_best_bid(ticker="TICK")
+
+    process_order(order_book=order_book, order="2|o2|a|TICK|B|1.3|1")
+    process_order(order_book=order_book, order="2|o3|a|TICK|B|1.0|1")
+    process_order(order_book=order_book, order="3|o2|u|7")
+    process_order(order_book=order_book, order="4|o3|c")
+
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.3)
+    assert database.num_of_best_price_queries == 1
+
+
+def test_cancelling_best_order_should_recompute_only_its_ticker_side():
+    database = CountingOrderDatabase()
+    order_book = DatabaseOrderBook(database=database)
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=order_book, order="1|o2|a|TICK|B|1.3|1")
+    process_order(order_book=order_book, order="1|o3|a|TICK|S|2.0|1")
+    order_book.get_best_bid(ticker="TICK")
+    order_book.get_best_ask(ticker="TICK")
+
+    process_order(order_book=order_book, order="2|o2|c")
+
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.1)
+    assert order_book.get_best_ask(ticker="TICK") == pytest.approx(2.0)
+    assert database.num_of_best_price_queries == 3
+
+
+@pytest.mark.parametrize("batch_size", [1, 16])
+def test_cached_prices_should_match_database_under_random_churn(batch_size: int):
+    rng = random.Random(2020)
+    database = ConcreteOrderDatabase(database_name=":memory:", batch_size=batch_size)
+    order_book = DatabaseOrderBook(database=database)
+    live_ids = []
+
+    for idx in range(1_500):
+        ticker = rng.choice(["AAA", "BBB"])
+        action = rng.random()
+        if live_ids and action < 0.3:
+            order_id = live_ids.pop(rng.randrange(len(live_ids)))
+            process_order(order_book=order_book, order=f"{idx}|{order_id}|c")
+        elif live_ids and action < 0.4:
+            order_id = rng.choice(live_ids)
+            process_order(order_book=order_book, order=f"{idx}|{order_id}|u|3")
+        else:
+            side = rng.choice(["B", "S"])
+            price = rng.randint(1, 40) / 4
+            process_order(
+                order_book=order_book, order=f"{idx}|o{idx}|a|{ticker}|{side}|{price}|1"
+            )
+            live_ids.append(f"o{idx}")
+
+        assert price_to_ticks(
+            price=order_book.get_best_bid(ticker=ticker)
+        ) == database.get_best_bid(ticker=ticker)
+        assert price_to_ticks(
+            price=order_book.get_best_ask(ticker=ticker)
+        ) == database.get_best_ask(ticker=ticker)
@@ -0,0 +1,61 @@
+import pytest
+
+from ...depth_view import MarketDepth, PriceLevel
+from ...process_order import process_order
+
+
+def add_orders(order_book) -> None:
+    for idx, (side, price, size) in enumerate(
+        [
+            ("B", 10.1, 5),
+            ("B", 10.2, 7),
+            ("B", 10.2, 3),
+            ("B", 9.9, 1),
+            ("S", 10.5, 2),
+            ("S", 10.4, 4),
+            ("S", 10.4, 6),
+            ("S", 11.0, 8),
+        ]
+    ):
+        process_order(
+            order_book=order_book, order=f"1|o{idx}|a|TICK|{side}|{price}|{size}"
+        )
+
+
+def test_given_non_existing_ticker_depth_should_be_empty(
+    order_book,
+):
+    assert order_book.get_depth(ticker="NONEXT", levels=5) == MarketDepth(
+        bids=[], asks=[]
+    )
+
+
+def test_depth_should_aggregate_orders_per_level_from_best_price(
+    order_book,
+):
+    add_orders(order_book=order_book)
+
+    depth = order_book.get_depth(ticker="TICK", levels=2)
+
+    assert depth.bids == [
+        PriceLevel(price=pytest.approx(10.2), size=10, num_of_orders=2),
+        PriceLevel(price=pytest.approx(10.1), size=5, num_of_orders=1),
+    ]
+    assert depth.asks == [
+        PriceLevel(price=pytest.approx(10.4), size=10, num_of_orders=2),
+        PriceLevel(price=pytest.approx(10.5), size=2, num_of_orders=1),
+    ]
+
+
+def test_depth_should_follow_updates_and_cancels(order_book):
+    add_orders(order_book=order_book)
+
+    process_order(order_book=order_book, order="2|o1|u|17")
+    process_order(order_book=order_book, order="2|o5|c")
+    process_order(order_book=order_book, order="2|o6|c")
+
+    depth = order_book.get_depth(ticker="TICK", levels=10)
+
+    assert [level.size for level in depth.bids] == [20, 5, 1]
+    assert [level.num_of_orders for level in depth.bids] == [2, 1, 1]
+    assert [level.price for level in depth.asks] == pytest.approx([10.5, 11.0])
@@ -0,0 +1,69 @@
+import sqlite3
+
+import pytest
+
+from ...process_order import process_order
+from ..database_order_storage_factory import create_db_order_storage
+
+
+@pytest.fixture(name="database_path")
+def fixture_database_path(tmp_path) -> str:
+    return str(tmp_path / "orders.db")
+
+
+def test_file_database_should_use_write_ahead_log(database_path: str):
+    storage = create_db_order_storage(database_path=database_path)
+    process_order(order_book=storage.get_processor(), order="1|o1|a|TICK|B|1.1|1")
+
+    connection = sqlite3.connect(database=database_path)
+    try:
+        journal_mode = connection.execute("pragma journal_mode").fetchone()[0]
+        committed_orders = connection.execute("select count(*) from orders").fetchone()
+    finally:
+        connection.close()
+        storage.close()
+
+    assert journal_mode == "wal"
+    assert committed_orders == (1,)
+
+
+@pytest.mark.parametrize("batch_size", [1, 1_000])
+def test_reopened_file_database_should_keep_orders(database_path: str, batch_size):
+    storage = create_db_order_storage(
+        batch_size=batch_size, database_path=database_path
+    )
+    process_order(order_book=storage.get_processor(), order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=storage.get_processor(), order="1|o2|a|TICK|S|1.5|1")
+    process_order(order_book=storage.get_processor(), order="1|o3|a|OTHER|S|2.5|1")
+    storage.close()
+
+    reopened = create_db_order_storage(
+        batch_size=batch_size, database_path=database_path
+    )
+    processor = reopened.get_processor()
+    process_order(order_book=processor, order="2|o1|c")
+    process_order(order_book=processor, order="2|o4|a|TICK|B|1.2|1")
+    price_view = reopened.get_price_view()
+
+    assert price_view.get_best_bid(ticker="TICK") == pytest.approx(1.2)
+    assert price_view.get_best_ask(ticker="TICK") == pytest.approx(1.5)
+    assert price_view.get_best_ask(ticker="OTHER") == pytest.approx(2.5)
+    assert sorted(price_view.get_best_bids_and_asks().tickers) == ["OTHER", "TICK"]
+    reopened.close()
+
+
+def test_closing_should_keep_trailing_updates_and_cancels(database_path: str):
+    storage = create_db_order_storage(database_path=database_path)
+    process_order(order_book=storage.get_processor(), order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=storage.get_processor(), order="1|o2|a|TICK|B|1.2|1")
+    process_order(order_book=storage.get_processor(), order="2|o1|u|5")
+    process_order(order_book=storage.get_processor(), order="3|o2|c")
+    storage.close()
+
+    connection = sqlite3.connect(database=database_path)
+    try:
+        orders = connection.execute("select order_id, size from orders").fetchall()
+    finally:
+        connection.close()
+
+    assert orders == [("o1", 5)]
@@ -0,0 +1,116 @@
+import pytest
+
+from ...order import Order, OrderType
+from ...process_order import process_order
+from ..concrete_order_database import ConcreteOrderDatabase
+from ..database_order_book import DatabaseOrderBook
+from ..database_order_storage_factory import create_db_order_storage
+from ..live_orders import LiveOrders
+
+
+class CountingOrderDatabase(ConcreteOrderDatabase):
+    def __init__(self) -> None:
+        super().__init__(database_name=":memory:")
+        self.num_of_writes = 0
+
+    def insert(self, order: Order) -> None:
+        self.num_of_writes += 1
+        super().insert(order=order)
+
+    def remove(self, order_id: str) -> None:
+        self.num_of_writes += 1
+        super().remove(order_id=order_id)
+
+    def update(self, order_id: str, size: int) -> bool:
+        self.num_of_writes += 1
+        return super().update(order_id=order_id, size=size)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_live_orders_should_track_added_and_discarded_orders(compact: bool):
+    live_orders = LiveOrders(compact=compact)
+    live_orders.update(
+        live_orders=[
+            ("o1", ("TICK", OrderType.BID, 1)),
+            ("o2", ("TICK", OrderType.ASK, 2)),
+        ]
+    )
+    live_orders.add(order_id="O1", live_order=("TOCK", OrderType.ASK, 3))
+    live_orders.discard(order_id="o2")
+    live_orders.discard(order_id="o3")
+
+    assert "o1" in live_orders
+    assert "o2" not in live_orders
+    assert live_orders.get(order_id="O1") == ("TOCK", OrderType.ASK, 3)
+    assert live_orders.get(order_id="o2") is None
+    assert len(live_orders) == 2
+
+
+def test_compact_live_orders_should_not_collide_on_leading_zero_bytes():
+    live_orders = LiveOrders(compact=True)
+    live_orders.add(order_id="a", live_order=("TICK", OrderType.BID, 1))
+
+    assert "\x00a" not in live_orders
+
+
+@pytest.mark.parametrize("compact_order_ids", [False, True])
+@pytest.mark.parametrize(
+    "order",
+    ["2|o1|a|TICK|S|2.0|1", "2|o2|c", "2|o2|u|5", "3|o3|c"],
+)
+def test_duplicated_and_unknown_ids_should_be_rejected_without_database_writes(
+    capsys, compact_order_ids: bool, order: str
+):
+    database = CountingOrderDatabase()
+    order_book = DatabaseOrderBook(
+        database=database, compact_order_ids=compact_order_ids
+    )
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=order_book, order="1|o3|a|TICK|B|1.1|1")
+    process_order(order_book=order_book, order="2|o3|c")
+    capsys.readouterr()
+
+    process_order(order_book=order_book, order=order)
+
+    assert "ERROR" in capsys.readouterr().err
+    assert database.num_of_writes == 3
+
+
+def test_cancelled_order_id_should_be_reusable(capsys):
+    database = CountingOrderDatabase()
+    order_book = DatabaseOrderBook(database=database)
+    process_order(order_book=order_book, order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=order_book, order="2|o1|c")
+    process_order(order_book=order_book, order="3|o1|a|TICK|S|2.0|1")
+
+    assert "ERROR" not in capsys.readouterr().err
+    assert database.fetch_column(column="order_id") == [("o1",)]
+
+
+@pytest.mark.parametrize("compact_order_ids", [False, True])
+def test_reopened_database_should_reject_known_and_unknown_ids(
+    capsys, tmp_path, compact_order_ids: bool
+):
+    database_path = str(tmp_path / "orders.db")
+    storage = create_db_order_storage(
+        batch_size=16,
+        database_path=database_path,
+        compact_order_ids=compact_order_ids,
+    )
+    process_order(order_book=storage.get_processor(), order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=storage.get_processor(), order="1|o2|a|TICK|S|1.5|1")
+    process_order(order_book=storage.get_processor(), order="2|o2|c")
+    storage.close()
+
+    reopened = create_db_order_storage(
+        database_path=database_path, compact_order_ids=compact_order_ids
+    )
+    processor = reopened.get_processor()
+    process_order(order_book=processor, order="3|o1|a|TICK|B|1.2|1")
+    process_order(order_book=processor, order="3|o2|u|4")
+    assert capsys.readouterr().err.count("ERROR") == 2
+
+    process_order(order_book=processor, order="4|o1|u|4")
+    process_order(order_book=processor, order="4|o2|a|TICK|S|1.5|1")
+    assert "ERROR" not in capsys.readouterr().err
+    reopened.close()
@@ -2,6 +2,7 @@ import re
 
 import pytest
 
+from ...prices import price_to_ticks
 from ...process_order import process_order
 
 
@@ -59,7 +60,7 @@ def test_after_adding_order_then_price_should_be_added_to_order(
     price = 89.12345
     process_order(order_book=order_book, order=f"123|a42|a|ZZZZ|{side}|{price}|1")
 
-    assert price in database.fetch_orders()[0]
+    assert price_to_ticks(price=price) in database.fetch_orders()[0]
 
 
 @pytest.mark.parametrize("side", ["B", "S"])
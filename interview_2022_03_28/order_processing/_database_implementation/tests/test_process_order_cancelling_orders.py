@@ -1,5 +1,6 @@
 import re
 
+from ...prices import price_to_ticks
 from ...process_order import process_order
 
 
@@ -26,7 +27,7 @@ def test_cancelling_non_existing_order_should_not_modify_existing_orders(
     process_order(order_book=order_book, order="789|e11|c")
 
     assert database.fetch_orders() == [
-        (order_id, int(timestamp), ticker, price, size, "BID")
+        (order_id, int(timestamp), ticker, price_to_ticks(price=price), size, "BID")
     ]
 
 
@@ -65,5 +66,12 @@ def test_cancelling_existing_order_should_not_modify_other_orders(order_book, da
     process_order(order_book=order_book, order=f"789|{order_id_to_cancel}|c")
 
     assert database.fetch_orders() == [
-        (id_of_unchanged_order, int(timestamp), ticker, price, size, "BID")
+        (
+            id_of_unchanged_order,
+            int(timestamp),
+            ticker,
+            price_to_ticks(price=price),
+            size,
+            "BID",
+        )
     ]
@@ -1,5 +1,6 @@
 import pytest
 
+from ...prices import price_to_ticks
 from ...process_order import process_order
 
 CORRECT_ORDER_ID = "bid1"
@@ -84,7 +85,7 @@ def test_given_incorrect_order_should_not_modify_existing_orders(
         order_id,
         int(timestamp),
         ticker,
-        price,
+        price_to_ticks(price=price),
         size,
         "BID",
     ) in database.fetch_orders()
@@ -154,7 +155,7 @@ class TestInvalidInputWithCorrectOrderInDatabase:
             order_id,
             int(timestamp),
             ticker,
-            price,
+            price_to_ticks(price=price),
             size,
             "BID",
         ) in database.fetch_orders()
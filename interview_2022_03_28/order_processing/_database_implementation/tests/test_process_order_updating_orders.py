@@ -1,5 +1,6 @@
 import re
 
+from ...prices import price_to_ticks
 from ...process_order import process_order
 
 
@@ -44,7 +45,7 @@ def test_updating_non_existing_order_should_not_modify_other_orders(
         id_of_unchanging_order,
         int(timestamp),
         ticker,
-        price,
+        price_to_ticks(price=price),
         size,
         "BID",
     ) in database.fetch_orders()
@@ -81,7 +82,7 @@ def test_updating_existing_order_should_not_modify_other_orders(order_book, data
         id_of_unchanged_order,
         int(timestamp),
         ticker,
-        price,
+        price_to_ticks(price=price),
         size,
         "BID",
     ) in database.fetch_orders()
@@ -97,3 +98,20 @@ def test_updating_existing_order_should_not_modify_num_of_orders(order_book, dat
     process_order(order_book=order_book, order=f"789|{id_of_updated_order}|u|1001")
 
     assert len(database.fetch_orders()) == 2
+
+
+def test_updating_order_to_its_current_size_should_not_log_error(order_book, capsys):
+    process_order(order_book=order_book, order="123|same|a|AABB|B|1.1|5")
+    process_order(order_book=order_book, order="789|same|u|5")
+
+    assert capsys.readouterr().err == ""
+
+
+def test_updating_cancelled_order_should_log_error(order_book, database, capsys):
+    process_order(order_book=order_book, order="123|gone|a|AABB|B|1.1|5")
+    process_order(order_book=order_book, order="456|gone|c")
+    process_order(order_book=order_book, order="789|gone|u|7")
+
+    error_regex = re.compile("ERROR.*gone")
+    assert error_regex.match(capsys.readouterr().err)
+    assert database.fetch_orders() == []
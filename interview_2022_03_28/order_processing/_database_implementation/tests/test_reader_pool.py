@@ -0,0 +1,119 @@
+import sqlite3
+import threading
+from typing import List
+
+import pytest
+
+from ...process_order import process_order
+from ..database_order_storage_factory import (
+    DeferredWritesReaderPoolError,
+    InMemoryReaderPoolError,
+    create_db_order_storage,
+)
+from ..pooled_best_bid_and_ask_view import PooledBestBidAndAskView
+from ..reader_connection_pool import ReaderConnectionPool
+
+
+@pytest.fixture(name="database_path")
+def fixture_database_path(tmp_path) -> str:
+    return str(tmp_path / "orders.db")
+
+
+def test_pooled_view_should_read_committed_prices(database_path: str):
+    storage = create_db_order_storage(database_path=database_path, num_of_readers=2)
+    processor = storage.get_processor()
+    process_order(order_book=processor, order="1|o1|a|TICK|B|1.1|1")
+    process_order(order_book=processor, order="1|o2|a|TICK|B|1.3|1")
+    process_order(order_book=processor, order="1|o3|a|TICK|S|2.0|1")
+    process_order(order_book=processor, order="1|o4|a|OTHER|S|3.0|1")
+    process_order(order_book=processor, order="2|o2|c")
+
+    price_view = storage.get_price_view()
+    assert isinstance(price_view, PooledBestBidAndAskView)
+    assert price_view.get_best_bid(ticker="TICK") == pytest.approx(1.1)
+    assert price_view.get_best_ask(ticker="TICK") == pytest.approx(2.0)
+    assert price_view.get_best_bid(ticker="OTHER") == 0.0
+    assert price_view.get_best_ask(ticker="UNKNOWN") == 0.0
+
+    best_prices = price_view.get_best_bids_and_asks(tickers=["OTHER", "TICK", "NONE"])
+    assert list(best_prices.bids) == pytest.approx([0.0, 1.1, 0.0])
+    assert list(best_prices.asks) == pytest.approx([3.0, 2.0, 0.0])
+    storage.close()
+
+
+def test_reader_threads_should_query_while_writer_ingests(database_path: str):
+    storage = create_db_order_storage(database_path=database_path, num_of_readers=4)
+    processor = storage.get_processor()
+    price_view = storage.get_price_view()
+    process_order(order_book=processor, order="0|o0|a|TICK|S|100.0|1")
+    stop = threading.Event()
+    errors: List[Exception] = []
+
+    def read_prices() -> None:
+        try:
+            while not stop.is_set():
+                assert price_view.get_best_ask(ticker="TICK") == pytest.approx(100.0)
+                price_view.get_best_bid(ticker="TICK")
+        except Exception as err:  # pylint: disable=broad-except
+            errors.append(err)
+
+    readers = [threading.Thread(target=read_prices) for _ in range(6)]
+    for reader in readers:
+        reader.start()
+    for idx in range(1, 300):
+        process_order(order_book=processor, order=f"1|o{idx}|a|TICK|B|{idx / 10}|1")
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert not errors
+    assert price_view.get_best_bid(ticker="TICK") == pytest.approx(29.9)
+    storage.close()
+
+
+def test_reader_connections_should_be_read_only(database_path: str):
+    storage = create_db_order_storage(database_path=database_path)
+    pool = ReaderConnectionPool(database_path=database_path, num_of_connections=2)
+
+    with pool.connection() as connection:
+        with pytest.raises(sqlite3.OperationalError):
+            connection.execute("delete from orders")
+
+    assert len(pool) == 2
+    pool.close()
+    storage.close()
+
+
+@pytest.mark.parametrize("file_name", ["o#1.db", "o?1.db", "o 1%20.db"])
+def test_reader_pool_should_open_paths_with_uri_characters(tmp_path, file_name: str):
+    database_path = str(tmp_path / file_name)
+    storage = create_db_order_storage(database_path=database_path, num_of_readers=1)
+    process_order(order_book=storage.get_processor(), order="1|o1|a|TICK|B|1.1|1")
+
+    assert storage.get_price_view().get_best_bid(ticker="TICK") == pytest.approx(1.1)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        file_name,
+        file_name + "-shm",
+        file_name + "-wal",
+    ]
+    storage.close()
+
+
+def test_reader_pool_should_require_file_database():
+    with pytest.raises(InMemoryReaderPoolError):
+        create_db_order_storage(num_of_readers=2)
+
+
+@pytest.mark.parametrize(
+    "batch_size, asynchronous", [(1_000, False), (1, True), (1_000, True)]
+)
+def test_reader_pool_should_require_synchronous_unbatched_writes(
+    database_path: str, batch_size: int, asynchronous: bool
+):
+    with pytest.raises(DeferredWritesReaderPoolError):
+        create_db_order_storage(
+            batch_size=batch_size,
+            database_path=database_path,
+            asynchronous=asynchronous,
+            num_of_readers=2,
+        )
@@ -0,0 +1,35 @@
+import sqlite3
+
+from ...process_order import process_order
+from ..concrete_order_database import ConcreteOrderDatabase
+from ..database_order_book import DatabaseOrderBook
+
+
+def test_orders_should_reference_interned_tickers_by_integer_id(tmp_path):
+    database_path = str(tmp_path / "orders.db")
+    order_book = DatabaseOrderBook(
+        database=ConcreteOrderDatabase(database_name=database_path)
+    )
+    for idx, ticker in enumerate(["AAA", "BBB", "AAA", "AAA"]):
+        process_order(order_book=order_book, order=f"1|o{idx}|a|{ticker}|S|1.{idx}|1")
+
+    connection = sqlite3.connect(database=database_path)
+    try:
+        tickers = connection.execute("select name from tickers").fetchall()
+        column_types = {
+            row[0]: row[1]
+            for row in connection.execute(
+                "select name, type from pragma_table_info('orders')"
+            )
+        }
+        query_plan = connection.execute(
+            """explain query plan select price from orders
+            where ticker_id=1 and type=1 order by price limit 1"""
+        ).fetchall()
+    finally:
+        connection.close()
+
+    assert tickers == [("AAA",), ("BBB",)]
+    assert column_types["ticker_id"] == "INTEGER"
+    assert column_types["type"] == "INTEGER"
+    assert "COVERING INDEX orders_by_price" in query_plan[0][-1]
@@ -0,0 +1,15 @@
+from ..best_bid_and_ask_view import BestBidAndAskView
+from ..order_book import OrderBookProcessor
+from ..order_storage import OrderStorage
+from .heap_order_book import HeapOrderBook
+
+
+class HeapOrderStorage(OrderStorage):
+    def __init__(self) -> None:
+        self.__order_book = HeapOrderBook()
+
+    def get_processor(self) -> OrderBookProcessor:
+        return self.__order_book
+
+    def get_price_view(self) -> BestBidAndAskView:
+        return self.__order_book
@@ -0,0 +1,6 @@
+from ..order_storage import OrderStorage
+from .heap_order_storage import HeapOrderStorage
+
+
+def create_heap_order_storage() -> OrderStorage:
+    return HeapOrderStorage()
@@ -0,0 +1,56 @@
+import heapq
+from typing import Dict, List
+
+from ..order import Order
+from ..order_level import OrderLevel
+
+# stale heap entries are compacted once they outnumber live levels by this factor
+COMPACTION_FACTOR = 2
+
+
+class PriceLevelHeap:
+    def __init__(self, descending: bool) -> None:
+        self.__sign = -1 if descending else 1
+        self.__levels: Dict[int, OrderLevel] = {}
+        self.__heap: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.__levels)
+
+    def insert(self, order: Order) -> OrderLevel:
+        level = self.__levels.get(order.price_ticks)
+        if level is None:
+            level = OrderLevel(price_ticks=order.price_ticks)
+            self.__levels[order.price_ticks] = level
+            heapq.heappush(self.__heap, self.__sign * order.price_ticks)
+
+        level.add_order(order=order)
+        return level
+
+    def remove_order(self, level: OrderLevel, order_id: str) -> None:
+        level.remove_order(order_id=order_id)
+        if level.orders:
+            return
+
+        del self.__levels[level.price_ticks]
+
+        if len(self.__heap) > COMPACTION_FACTOR * len(self.__levels) + 1:
+            self.__heap = [self.__sign * price for price in self.__levels]
+            heapq.heapify(self.__heap)
+        else:
+            self.__drop_stale_top()
+
+    def get_best(self) -> int:
+        if not self.__heap:
+            return 0
+        return self.__sign * self.__heap[0]
+
+    def top_levels(self, num_of_levels: int) -> List[OrderLevel]:
+        keys = heapq.nsmallest(
+            num_of_levels, (self.__sign * price for price in self.__levels)
+        )
+        return [self.__levels[self.__sign * key] for key in keys]
+
+    def __drop_stale_top(self) -> None:
+        while self.__heap and self.__sign * self.__heap[0] not in self.__levels:
+            heapq.heappop(self.__heap)
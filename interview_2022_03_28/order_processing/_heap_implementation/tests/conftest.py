@@ -0,0 +1,8 @@
+import pytest
+
+from ..heap_order_book import HeapOrderBook
+
+
+@pytest.fixture(name="heap_order_book")
+def fixture_heap_order_book() -> HeapOrderBook:
+    return HeapOrderBook()
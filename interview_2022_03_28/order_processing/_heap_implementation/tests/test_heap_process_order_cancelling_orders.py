@@ -0,0 +1,106 @@
+import re
+
+import pytest
+
+from ...order import Order, OrderType
+from ...prices import price_to_ticks
+from ...process_order import process_order
+from ..heap_order_book import HeapOrderBook
+
+
+def test_given_empty_book_then_cancelling_order_should_not_add_orders(
+    heap_order_book: HeapOrderBook,
+):
+    process_order(order_book=heap_order_book, order="789|e11|c")
+
+    assert heap_order_book.orders == {}
+
+
+def test_cancelling_non_existing_order_should_log_error(
+    heap_order_book: HeapOrderBook, capsys
+):
+    order_id = "123lol"
+    process_order(order_book=heap_order_book, order=f"789|{order_id}|c")
+
+    error_regex = re.compile(f"ERROR.*{order_id}")
+    assert error_regex.match(capsys.readouterr().err)
+
+
+@pytest.mark.parametrize("side", ["B", "S"])
+def test_cancelling_last_order_of_ticker_should_remove_ticker_from_book(
+    heap_order_book: HeapOrderBook, side: str
+):
+    order_id = "bbaa"
+    ticker = "SCRUB"
+
+    process_order(
+        order_book=heap_order_book, order=f"789|{order_id}|a|{ticker}|{side}|1.2|1"
+    )
+    process_order(order_book=heap_order_book, order=f"789|{order_id}|c")
+
+    assert ticker not in heap_order_book.orders
+
+
+@pytest.mark.parametrize(
+    "side, container, order_type",
+    [("B", "bids", OrderType.BID), ("S", "asks", OrderType.ASK)],
+)
+def test_given_two_orders_with_same_price_cancel_should_remove_proper_order(
+    heap_order_book: HeapOrderBook, side: str, container: str, order_type: OrderType
+):
+    order_id_to_cancel = "cancelled"
+
+    timestamp = 789
+    id_of_unchanged_order = "bbaa"
+    ticker = "XXYY"
+    price = 4.56789
+    size = 8
+
+    process_order(
+        order_book=heap_order_book,
+        order=f"{timestamp}|{id_of_unchanged_order}|a|{ticker}|{side}|{price}|{size}",
+    )
+    process_order(
+        order_book=heap_order_book,
+        order=f"789|{order_id_to_cancel}|a|{ticker}|{side}|{price}|1",
+    )
+    process_order(order_book=heap_order_book, order=f"789|{order_id_to_cancel}|c")
+
+    (best_level,) = heap_order_book.orders[ticker][container].top_levels(
+        num_of_levels=10
+    )
+    assert best_level.total_size == size
+    assert best_level.orders == {
+        id_of_unchanged_order: Order(
+            order_id=id_of_unchanged_order,
+            timestamp=timestamp,
+            ticker=ticker,
+            price_ticks=price_to_ticks(price=price),
+            size=size,
+            order_type=order_type,
+        )
+    }
+
+
+@pytest.mark.parametrize(
+    "side, best_prices",
+    [("B", [32, 30, 28, 26]), ("S", [2, 4, 6, 8])],
+)
+def test_cancelling_best_levels_should_expose_next_best_price(
+    heap_order_book: HeapOrderBook, side: str, best_prices: list
+):
+    ticker = "TICK"
+    get_best = (
+        heap_order_book.get_best_bid if side == "B" else heap_order_book.get_best_ask
+    )
+
+    for idx in range(1, 33):
+        process_order(
+            order_book=heap_order_book, order=f"1|o{idx}|a|{ticker}|{side}|{idx}|1"
+        )
+    for idx in range(1, 33, 2):
+        process_order(order_book=heap_order_book, order=f"2|o{idx}|c")
+
+    for best_price in best_prices:
+        assert get_best(ticker=ticker) == pytest.approx(best_price)
+        process_order(order_book=heap_order_book, order=f"3|o{best_price}|c")
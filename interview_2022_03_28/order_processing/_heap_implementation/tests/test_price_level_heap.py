@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from ...order import Order, OrderType
+from ..price_level_heap import PriceLevelHeap
+
+
+def make_order(order_id: str, price_ticks: int) -> Order:
+    return Order(
+        order_id=order_id,
+        timestamp=1,
+        ticker="TICK",
+        price_ticks=price_ticks,
+        size=1,
+        order_type=OrderType.BID,
+    )
+
+
+def test_given_empty_heap_best_price_should_be_zero():
+    assert PriceLevelHeap(descending=False).get_best() == 0
+
+
+def test_reinserting_price_of_removed_level_should_create_new_level():
+    heap = PriceLevelHeap(descending=False)
+
+    level = heap.insert(order=make_order(order_id="a", price_ticks=5))
+    heap.insert(order=make_order(order_id="b", price_ticks=3))
+    heap.remove_order(level=level, order_id="a")
+    heap.insert(order=make_order(order_id="c", price_ticks=5))
+
+    assert len(heap) == 2
+    assert [level.price_ticks for level in heap.top_levels(num_of_levels=5)] == [3, 5]
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_heap_should_match_sorted_reference_under_random_churn(descending: bool):
+    rng = random.Random(1234)
+    heap = PriceLevelHeap(descending=descending)
+    live_orders = {}
+
+    for idx in range(2_000):
+        if live_orders and rng.random() < 0.45:
+            order_id = rng.choice(list(live_orders))
+            heap.remove_order(level=live_orders.pop(order_id), order_id=order_id)
+        else:
+            order_id = f"o{idx}"
+            live_orders[order_id] = heap.insert(
+                order=make_order(order_id=order_id, price_ticks=rng.randint(1, 50))
+            )
+
+        prices = sorted(
+            {level.price_ticks for level in live_orders.values()}, reverse=descending
+        )
+        assert heap.get_best() == (prices[0] if prices else 0)
+        assert len(heap) == len(prices)
+
+    assert [
+        level.price_ticks for level in heap.top_levels(num_of_levels=len(heap))
+    ] == prices
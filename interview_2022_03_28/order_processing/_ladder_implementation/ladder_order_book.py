@@ -0,0 +1,140 @@
+import itertools
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from ..best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from ..depth_view import DepthView, MarketDepth, PriceLevel
+from ..order import Order, OrderType
+from ..order_book import OrderBookError, OrderBookProcessor
+from ..order_level import OrderLevel
+from ..prices import ticks_to_price
+from .price_ladder import PriceLadder
+
+
+class OrderDoesNotExistError(OrderBookError):
+    pass
+
+
+class InvalidOrderSizeZeroError(OrderBookError):
+    pass
+
+
+class DuplicatedOrderIdError(OrderBookError):
+    pass
+
+
+TickerOrders = Dict[str, Dict[str, PriceLadder]]
+
+
+class LadderOrderBook(OrderBookProcessor, BestBidAndAskView, DepthView):
+    def __init__(self) -> None:
+        self.__orders: TickerOrders = {}
+        self.__ids_to_levels: Dict[str, OrderLevel] = {}
+
+    def add_order(self, order: Order) -> None:
+        if order.size == 0:
+            raise InvalidOrderSizeZeroError(
+                f"Cannot add order with id: {order.order_id} due to size being 0."
+            )
+
+        if order.order_id in self.__ids_to_levels:
+            raise DuplicatedOrderIdError(
+                f"Cannot add order with id: {order.order_id} to book."
+            )
+
+        if order.ticker not in self.__orders:
+            self.__orders[order.ticker] = {}
+            self.__orders[order.ticker]["asks"] = PriceLadder()
+            self.__orders[order.ticker]["bids"] = PriceLadder()
+
+        container_name = _container_from_order_type(order_type=order.order_type)
+        ladder = self.__orders[order.ticker][container_name]
+        self.__ids_to_levels[order.order_id] = ladder.insert(order=order)
+
+    def update(self, order_id: str, size: int) -> None:
+        if order_id not in self.__ids_to_levels:
+            raise OrderDoesNotExistError(
+                f"Cannot update non existing order: {order_id}"
+            )
+
+        self.__ids_to_levels[order_id].update_order(order_id=order_id, size=size)
+
+    def cancel(self, order_id: str) -> None:
+        if order_id not in self.__ids_to_levels:
+            raise OrderDoesNotExistError(
+                f"Cannot cancel non existing order: {order_id}"
+            )
+
+        level = self.__ids_to_levels.pop(order_id)
+        order = level.orders[order_id]
+        ticker_orders = self.__orders[order.ticker]
+        container_name = _container_from_order_type(order_type=order.order_type)
+        ticker_orders[container_name].remove_order(level=level, order_id=order_id)
+
+        if not ticker_orders["asks"] and not ticker_orders["bids"]:
+            del self.__orders[order.ticker]
+
+    def get_best_ask(self, ticker: str) -> float:
+        if ticker not in self.__orders:
+            return 0.0
+        return ticks_to_price(price_ticks=self.__orders[ticker]["asks"].get_minimum())
+
+    def get_best_bid(self, ticker: str) -> float:
+        if ticker not in self.__orders:
+            return 0.0
+        return ticks_to_price(price_ticks=self.__orders[ticker]["bids"].get_maximum())
+
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        if tickers is None:
+            tickers = list(self.__orders)
+
+        bids = array("d")
+        asks = array("d")
+        for ticker in tickers:
+            ticker_orders = self.__orders.get(ticker)
+            if ticker_orders is None:
+                bids.append(0.0)
+                asks.append(0.0)
+            else:
+                bids.append(
+                    ticks_to_price(price_ticks=ticker_orders["bids"].get_maximum())
+                )
+                asks.append(
+                    ticks_to_price(price_ticks=ticker_orders["asks"].get_minimum())
+                )
+
+        return BestBidsAndAsks(tickers=list(tickers), bids=bids, asks=asks)
+
+    def get_depth(self, ticker: str, levels: int) -> MarketDepth:
+        if ticker not in self.__orders:
+            return MarketDepth(bids=[], asks=[])
+
+        return MarketDepth(
+            bids=_top_levels(
+                ladder=self.__orders[ticker]["bids"], levels=levels, descending=True
+            ),
+            asks=_top_levels(
+                ladder=self.__orders[ticker]["asks"], levels=levels, descending=False
+            ),
+        )
+
+    @property
+    def orders(self) -> TickerOrders:
+        return self.__orders
+
+
+def _top_levels(ladder: PriceLadder, levels: int, descending: bool) -> List[PriceLevel]:
+    return [
+        PriceLevel(
+            price=ticks_to_price(price_ticks=level.price_ticks),
+            size=level.total_size,
+            num_of_orders=len(level.orders),
+        )
+        for level in itertools.islice(ladder.levels(descending=descending), levels)
+    ]
+
+
+def _container_from_order_type(order_type: OrderType) -> str:
+    return "asks" if order_type == OrderType.ASK else "bids"
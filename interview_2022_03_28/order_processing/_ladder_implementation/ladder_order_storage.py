@@ -0,0 +1,15 @@
+from ..best_bid_and_ask_view import BestBidAndAskView
+from ..order_book import OrderBookProcessor
+from ..order_storage import OrderStorage
+from .ladder_order_book import LadderOrderBook
+
+
+class LadderOrderStorage(OrderStorage):
+    def __init__(self) -> None:
+        self.__order_book = LadderOrderBook()
+
+    def get_processor(self) -> OrderBookProcessor:
+        return self.__order_book
+
+    def get_price_view(self) -> BestBidAndAskView:
+        return self.__order_book
@@ -0,0 +1,6 @@
+from ..order_storage import OrderStorage
+from .ladder_order_storage import LadderOrderStorage
+
+
+def create_ladder_order_storage() -> OrderStorage:
+    return LadderOrderStorage()
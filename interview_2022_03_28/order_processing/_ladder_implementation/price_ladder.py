@@ -0,0 +1,40 @@
+from typing import Dict, Iterator
+
+from ..order import Order
+from ..order_level import OrderLevel
+from .sorted_ticks import SortedTicks
+
+
+class PriceLadder:
+    def __init__(self) -> None:
+        self.__levels: Dict[int, OrderLevel] = {}
+        self.__prices = SortedTicks()
+
+    def __len__(self) -> int:
+        return len(self.__levels)
+
+    def insert(self, order: Order) -> OrderLevel:
+        level = self.__levels.get(order.price_ticks)
+        if level is None:
+            level = OrderLevel(price_ticks=order.price_ticks)
+            self.__levels[order.price_ticks] = level
+            self.__prices.add(price_ticks=order.price_ticks)
+
+        level.add_order(order=order)
+        return level
+
+    def remove_order(self, level: OrderLevel, order_id: str) -> None:
+        level.remove_order(order_id=order_id)
+        if not level.orders:
+            del self.__levels[level.price_ticks]
+            self.__prices.remove(price_ticks=level.price_ticks)
+
+    def get_minimum(self) -> int:
+        return self.__prices.get_minimum()
+
+    def get_maximum(self) -> int:
+        return self.__prices.get_maximum()
+
+    def levels(self, descending: bool = False) -> Iterator[OrderLevel]:
+        for price_ticks in self.__prices.iterate(descending=descending):
+            yield self.__levels[price_ticks]
@@ -0,0 +1,63 @@
+import bisect
+from typing import Iterator, List
+
+# chunks are split once they grow past twice this length
+CHUNK_LOAD = 1_000
+
+
+class SortedTicks:
+    def __init__(self) -> None:
+        self.__chunks: List[List[int]] = []
+        self.__maxes: List[int] = []
+        self.__len = 0
+
+    def __len__(self) -> int:
+        return self.__len
+
+    def add(self, price_ticks: int) -> None:
+        self.__len += 1
+
+        if not self.__chunks:
+            self.__chunks.append([price_ticks])
+            self.__maxes.append(price_ticks)
+            return
+
+        idx = bisect.bisect_left(self.__maxes, price_ticks)
+        if idx == len(self.__maxes):
+            idx -= 1
+            self.__chunks[idx].append(price_ticks)
+            self.__maxes[idx] = price_ticks
+        else:
+            bisect.insort(self.__chunks[idx], price_ticks)
+
+        chunk = self.__chunks[idx]
+        if len(chunk) > 2 * CHUNK_LOAD:
+            self.__chunks.insert(idx + 1, chunk[CHUNK_LOAD:])
+            del chunk[CHUNK_LOAD:]
+            self.__maxes.insert(idx, chunk[-1])
+
+    def remove(self, price_ticks: int) -> None:
+        idx = bisect.bisect_left(self.__maxes, price_ticks)
+        chunk = self.__chunks[idx]
+        del chunk[bisect.bisect_left(chunk, price_ticks)]
+        self.__len -= 1
+
+        if chunk:
+            self.__maxes[idx] = chunk[-1]
+        else:
+            del self.__chunks[idx]
+            del self.__maxes[idx]
+
+    def get_minimum(self) -> int:
+        return self.__chunks[0][0] if self.__chunks else 0
+
+    def get_maximum(self) -> int:
+        return self.__maxes[-1] if self.__maxes else 0
+
+    def iterate(self, descending: bool = False) -> Iterator[int]:
+        if descending:
+            for chunk in reversed(self.__chunks):
+                yield from reversed(chunk)
+        else:
+            for chunk in self.__chunks:
+                yield from chunk
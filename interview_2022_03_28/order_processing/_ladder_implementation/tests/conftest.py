@@ -0,0 +1,8 @@
+import pytest
+
+from ..ladder_order_book import LadderOrderBook
+
+
+@pytest.fixture(name="ladder_order_book")
+def fixture_ladder_order_book() -> LadderOrderBook:
+    return LadderOrderBook()
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from .. import sorted_ticks
+from ..sorted_ticks import SortedTicks
+
+
+def test_given_empty_ticks_minimum_and_maximum_should_be_zero():
+    ticks = SortedTicks()
+
+    assert ticks.get_minimum() == 0
+    assert ticks.get_maximum() == 0
+    assert list(ticks.iterate()) == []
+
+
+@pytest.mark.parametrize("chunk_load", [2, 7, sorted_ticks.CHUNK_LOAD])
+def test_ticks_should_match_sorted_reference_under_random_churn(
+    monkeypatch, chunk_load: int
+):
+    monkeypatch.setattr(sorted_ticks, "CHUNK_LOAD", chunk_load)
+    rng = random.Random(4321)
+    ticks = SortedTicks()
+    reference = []
+
+    for _ in range(3_000):
+        if reference and rng.random() < 0.4:
+            price_ticks = rng.choice(reference)
+            reference.remove(price_ticks)
+            ticks.remove(price_ticks=price_ticks)
+        else:
+            price_ticks = rng.randint(1, 500)
+            reference.append(price_ticks)
+            ticks.add(price_ticks=price_ticks)
+
+        assert ticks.get_minimum() == (min(reference) if reference else 0)
+        assert ticks.get_maximum() == (max(reference) if reference else 0)
+
+    reference.sort()
+    assert len(ticks) == len(reference)
+    assert list(ticks.iterate()) == reference
+    assert list(ticks.iterate(descending=True)) == reference[::-1]
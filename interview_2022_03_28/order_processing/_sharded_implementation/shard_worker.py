@@ -0,0 +1,81 @@
+import itertools
+from multiprocessing.connection import Connection
+from typing import Any, Callable, NamedTuple
+
+from interview_2022_03_28.utility import log_err
+
+from ..order_book import OrderBookError
+from ..order_storage import OrderStorage
+from ..process_orders import ProcessingSummary, parse_and_apply_orders
+
+ADD = "a"
+UPDATE = "u"
+CANCEL = "c"
+BEST_ASK = "best_ask"
+BEST_BID = "best_bid"
+BEST_PRICES = "best_prices"
+SUMMARY = "summary"
+STOP = "stop"
+QUERIES = (BEST_ASK, BEST_BID, BEST_PRICES, SUMMARY)
+
+
+class ShardQueryFailure(NamedTuple):
+    error: str
+
+
+def run_shard(
+    connection: Connection, create_storage: Callable[[], OrderStorage]
+) -> None:
+    storage = create_storage()
+    processor = storage.get_processor()
+    price_view = storage.get_price_view()
+    summary = ProcessingSummary()
+
+    while True:
+        for is_order_line, commands in itertools.groupby(
+            connection.recv(), key=_is_order_line
+        ):
+            if is_order_line:
+                try:
+                    summary.add(
+                        parse_and_apply_orders(order_book=processor, orders=commands)
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    log_err(f"ERROR: Shard cannot apply order lines: {err!r}")
+                continue
+
+            for command in commands:
+                kind = command[0]
+                try:
+                    if kind == ADD:
+                        processor.add_order(order=command[1])
+                    elif kind == UPDATE:
+                        processor.update(order_id=command[1], size=command[2])
+                    elif kind == CANCEL:
+                        processor.cancel(order_id=command[1])
+                    elif kind == BEST_ASK:
+                        connection.send(price_view.get_best_ask(ticker=command[1]))
+                    elif kind == BEST_BID:
+                        connection.send(price_view.get_best_bid(ticker=command[1]))
+                    elif kind == BEST_PRICES:
+                        connection.send(
+                            price_view.get_best_bids_and_asks(tickers=command[1])
+                        )
+                    elif kind == SUMMARY:
+                        connection.send(summary)
+                        summary = ProcessingSummary()
+                    elif kind == STOP:
+                        storage.close()
+                        connection.close()
+                        return
+                except Exception as err:  # pylint: disable=broad-except
+                    if kind in QUERIES:
+                        connection.send(ShardQueryFailure(error=repr(err)))
+                    elif isinstance(err, OrderBookError):
+                        log_err("ERROR: " + str(err))
+                    else:
+                        log_err(f"ERROR: Shard cannot apply {command!r}: {err!r}")
+
+
+def _is_order_line(command: Any) -> bool:
+    return isinstance(command, str)
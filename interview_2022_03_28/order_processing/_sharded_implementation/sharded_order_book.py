@@ -0,0 +1,269 @@
+import multiprocessing
+import zlib
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from ..order import Order
+from ..order_book import OrderBookError, OrderBookProcessor
+from ..order_storage import OrderStorage
+from ..process_orders import (
+    OrderLineProcessor,
+    ProcessingSummary,
+    parse_and_apply_orders,
+)
+from .shard_worker import (
+    ADD,
+    BEST_ASK,
+    BEST_BID,
+    BEST_PRICES,
+    CANCEL,
+    STOP,
+    SUMMARY,
+    UPDATE,
+    ShardQueryFailure,
+    run_shard,
+)
+
+
+class OrderDoesNotExistError(OrderBookError):
+    pass
+
+
+class InvalidOrderSizeZeroError(OrderBookError):
+    pass
+
+
+class DuplicatedOrderIdError(OrderBookError):
+    pass
+
+
+class ShardStoppedError(Exception):
+    pass
+
+
+class ShardQueryError(Exception):
+    pass
+
+
+Command = Union[str, Tuple]
+
+
+class ShardedOrderBook(OrderBookProcessor, BestBidAndAskView, OrderLineProcessor):
+    def __init__(
+        self,
+        num_of_shards: int,
+        create_shard_storage: Callable[[], OrderStorage],
+        batch_size: int,
+    ) -> None:
+        self.__batch_size = batch_size
+        self.__ids_to_shards: Dict[str, int] = {}
+        self.__pending: List[List[Command]] = [[] for _ in range(num_of_shards)]
+        self.__connections = []
+        self.__workers = []
+
+        for _ in range(num_of_shards):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            worker = multiprocessing.Process(
+                target=run_shard,
+                args=(child_connection, create_shard_storage),
+                daemon=True,
+            )
+            worker.start()
+            child_connection.close()
+
+            self.__connections.append(parent_connection)
+            self.__workers.append(worker)
+
+    def __del__(self) -> None:
+        self.close()
+
+    def add_order(self, order: Order) -> None:
+        if order.size == 0:
+            raise InvalidOrderSizeZeroError(
+                f"Cannot add order with id: {order.order_id} due to size being 0."
+            )
+
+        if order.order_id in self.__ids_to_shards:
+            raise DuplicatedOrderIdError(
+                f"Cannot add order with id: {order.order_id} to book."
+            )
+
+        shard = self.__shard_of(ticker=order.ticker)
+        self.__ids_to_shards[order.order_id] = shard
+        self.__send(shard=shard, command=(ADD, order))
+
+    def update(self, order_id: str, size: int) -> None:
+        if order_id not in self.__ids_to_shards:
+            raise OrderDoesNotExistError(
+                f"Cannot update non existing order: {order_id}"
+            )
+
+        self.__send(
+            shard=self.__ids_to_shards[order_id], command=(UPDATE, order_id, size)
+        )
+
+    def cancel(self, order_id: str) -> None:
+        if order_id not in self.__ids_to_shards:
+            raise OrderDoesNotExistError(
+                f"Cannot cancel non existing order: {order_id}"
+            )
+
+        self.__send(
+            shard=self.__ids_to_shards.pop(order_id), command=(CANCEL, order_id)
+        )
+
+    def process_order_lines(
+        self, orders: Iterable[Union[str, bytes]]
+    ) -> ProcessingSummary:
+        summary = parse_and_apply_orders(
+            order_book=self, orders=self.__route_add_lines(orders=orders)
+        )
+
+        for shard in range(self.num_of_shards):
+            self.__pending[shard].append((SUMMARY,))
+            self.__flush(shard=shard)
+        for shard in range(self.num_of_shards):
+            summary.add(self.__receive(shard=shard))
+        return summary
+
+    def get_best_ask(self, ticker: str) -> float:
+        return self.__query(ticker=ticker, command=(BEST_ASK, ticker))
+
+    def get_best_bid(self, ticker: str) -> float:
+        return self.__query(ticker=ticker, command=(BEST_BID, ticker))
+
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        shard_tickers: List[Optional[List[str]]] = [None] * self.num_of_shards
+        if tickers is not None:
+            tickers_by_shard: List[List[str]] = [[] for _ in range(self.num_of_shards)]
+            for ticker in tickers:
+                tickers_by_shard[self.__shard_of(ticker=ticker)].append(ticker)
+            shard_tickers = list(tickers_by_shard)
+
+        for shard, selected_tickers in enumerate(shard_tickers):
+            self.__pending[shard].append((BEST_PRICES, selected_tickers))
+            self.__flush(shard=shard)
+
+        shard_prices = [
+            self.__receive(shard=shard) for shard in range(self.num_of_shards)
+        ]
+
+        if tickers is None:
+            result = BestBidsAndAsks(tickers=[], bids=array("d"), asks=array("d"))
+            for prices in shard_prices:
+                result.tickers.extend(prices.tickers)
+                result.bids.extend(prices.bids)
+                result.asks.extend(prices.asks)
+            return result
+
+        best_prices = {
+            ticker: (bid, ask)
+            for prices in shard_prices
+            for ticker, bid, ask in zip(prices.tickers, prices.bids, prices.asks)
+        }
+        return BestBidsAndAsks(
+            tickers=list(tickers),
+            bids=array("d", (best_prices[ticker][0] for ticker in tickers)),
+            asks=array("d", (best_prices[ticker][1] for ticker in tickers)),
+        )
+
+    def close(self) -> None:
+        errors = []
+        for shard, connection in enumerate(self.__connections):
+            self.__pending[shard].append((STOP,))
+            try:
+                self.__flush(shard=shard)
+            except ShardStoppedError as err:
+                errors.append(err)
+            connection.close()
+
+        for worker in self.__workers:
+            worker.join()
+
+        self.__connections = []
+        self.__workers = []
+        if errors:
+            raise errors[0]
+
+    @property
+    def num_of_shards(self) -> int:
+        return len(self.__pending)
+
+    def __shard_of(self, ticker: str) -> int:
+        return zlib.crc32(ticker.encode()) % len(self.__pending)
+
+    def __route_add_lines(
+        self, orders: Iterable[Union[str, bytes]]
+    ) -> Iterator[Union[str, bytes]]:
+        for order in orders:
+            if isinstance(order, bytes):
+                try:
+                    line = order.decode()
+                except UnicodeDecodeError:
+                    yield order
+                    continue
+            else:
+                line = order
+
+            fields = line.split("|", 4)
+            if len(fields) < 4 or fields[2] != "a":
+                yield line
+                continue
+
+            order_id = fields[1]
+            shard = self.__shard_of(ticker=fields[3])
+            if self.__ids_to_shards.setdefault(order_id, shard) != shard:
+                yield line
+                continue
+
+            self.__send(shard=shard, command=line)
+
+    def __send(self, shard: int, command: Command) -> None:
+        pending = self.__pending[shard]
+        pending.append(command)
+        if len(pending) >= self.__batch_size:
+            self.__flush(shard=shard)
+
+    def __query(self, ticker: str, command: Tuple) -> float:
+        shard = self.__shard_of(ticker=ticker)
+        self.__pending[shard].append(command)
+        self.__flush(shard=shard)
+        return self.__receive(shard=shard)
+
+    def __flush(self, shard: int) -> None:
+        try:
+            self.__connections[shard].send(self.__pending[shard])
+        except OSError as err:
+            raise self.__stopped_error(shard=shard) from err
+        self.__pending[shard] = []
+
+    def __receive(self, shard: int) -> Any:
+        try:
+            result = self.__connections[shard].recv()
+        except (EOFError, OSError) as err:
+            raise self.__stopped_error(shard=shard) from err
+
+        if isinstance(result, ShardQueryFailure):
+            raise ShardQueryError(f"Shard {shard} failed to answer: {result.error}")
+        return result
+
+    def __stopped_error(self, shard: int) -> ShardStoppedError:
+        worker = self.__workers[shard]
+        worker.join(timeout=1.0)
+        return ShardStoppedError(
+            f"Shard {shard} (pid {worker.pid}) stopped with exit code {worker.exitcode}."
+        )
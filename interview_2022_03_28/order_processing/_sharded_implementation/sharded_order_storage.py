@@ -0,0 +1,29 @@
+from typing import Callable
+
+from ..best_bid_and_ask_view import BestBidAndAskView
+from ..order_book import OrderBookProcessor
+from ..order_storage import OrderStorage
+from .sharded_order_book import ShardedOrderBook
+
+
+class ShardedOrderStorage(OrderStorage):
+    def __init__(
+        self,
+        num_of_shards: int,
+        create_shard_storage: Callable[[], OrderStorage],
+        batch_size: int,
+    ) -> None:
+        self.__order_book = ShardedOrderBook(
+            num_of_shards=num_of_shards,
+            create_shard_storage=create_shard_storage,
+            batch_size=batch_size,
+        )
+
+    def get_processor(self) -> OrderBookProcessor:
+        return self.__order_book
+
+    def get_price_view(self) -> BestBidAndAskView:
+        return self.__order_book
+
+    def close(self) -> None:
+        self.__order_book.close()
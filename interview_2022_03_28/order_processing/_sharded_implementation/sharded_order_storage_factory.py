@@ -0,0 +1,20 @@
+import os
+from typing import Callable
+
+from .._tree_implementation.tree_order_storage_factory import (
+    create_tree_order_storage,
+)
+from ..order_storage import OrderStorage
+from .sharded_order_storage import ShardedOrderStorage
+
+
+def create_sharded_order_storage(
+    num_of_shards: int = os.cpu_count() or 1,
+    create_shard_storage: Callable[[], OrderStorage] = create_tree_order_storage,
+    batch_size: int = 1_000,
+) -> OrderStorage:
+    return ShardedOrderStorage(
+        num_of_shards=num_of_shards,
+        create_shard_storage=create_shard_storage,
+        batch_size=batch_size,
+    )
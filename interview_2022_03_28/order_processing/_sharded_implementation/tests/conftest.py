@@ -0,0 +1,17 @@
+from typing import Iterator
+
+import pytest
+
+from ..._tree_implementation.tree_order_storage_factory import (
+    create_tree_order_storage,
+)
+from ..sharded_order_book import ShardedOrderBook
+
+
+@pytest.fixture(name="sharded_order_book")
+def fixture_sharded_order_book() -> Iterator[ShardedOrderBook]:
+    order_book = ShardedOrderBook(
+        num_of_shards=2, create_shard_storage=create_tree_order_storage, batch_size=4
+    )
+    yield order_book
+    order_book.close()
@@ -0,0 +1,186 @@
+import os
+import re
+from typing import List, Optional, Sequence, Union
+
+import pytest
+
+from ...best_bid_and_ask import get_best_bid_and_ask
+from ...best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from ...order import Order
+from ...order_book import OrderBookProcessor
+from ...order_storage import OrderStorage
+from ...process_order import process_order
+from ...process_orders import process_orders
+from ..sharded_order_book import (
+    ShardedOrderBook,
+    ShardQueryError,
+    ShardStoppedError,
+)
+
+TICKERS = [f"TICK{idx}" for idx in range(8)]
+
+
+class FaultyOrderBook(OrderBookProcessor, BestBidAndAskView):
+    def __init__(self) -> None:
+        self.__num_of_orders = 0
+
+    def add_order(self, order: Order) -> None:
+        if order.ticker == "CRASH":
+            os._exit(3)  # pylint: disable=protected-access
+        if order.ticker == "FAULTY":
+            raise RuntimeError(f"Cannot store order {order.order_id}")
+        self.__num_of_orders += 1
+
+    def cancel(self, order_id: str) -> None:
+        pass
+
+    def update(self, order_id: str, size: int) -> None:
+        pass
+
+    def get_best_ask(self, ticker: str) -> float:
+        raise RuntimeError(f"No asks for {ticker}")
+
+    def get_best_bid(self, ticker: str) -> float:
+        return float(self.__num_of_orders)
+
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        raise NotImplementedError
+
+
+class FaultyOrderStorage(OrderStorage):
+    def __init__(self) -> None:
+        self.__order_book = FaultyOrderBook()
+
+    def get_processor(self) -> OrderBookProcessor:
+        return self.__order_book
+
+    def get_price_view(self) -> BestBidAndAskView:
+        return self.__order_book
+
+
+@pytest.mark.parametrize("check_type", ["best_ask", "best_bid"])
+def test_given_non_existing_ticker_should_return_zero(
+    sharded_order_book: ShardedOrderBook, check_type: str
+):
+    result = get_best_bid_and_ask(order_book=sharded_order_book, ticker="NONEXT")
+    assert result[check_type] == pytest.approx(0)
+
+
+def test_each_ticker_should_be_answered_by_its_own_shard(
+    sharded_order_book: ShardedOrderBook,
+):
+    for idx, ticker in enumerate(TICKERS):
+        process_order(
+            order_book=sharded_order_book, order=f"1|b{idx}|a|{ticker}|B|{idx + 1}.5|1"
+        )
+        process_order(
+            order_book=sharded_order_book, order=f"1|s{idx}|a|{ticker}|S|{idx + 2}.5|1"
+        )
+
+    for idx, ticker in enumerate(TICKERS):
+        result = get_best_bid_and_ask(order_book=sharded_order_book, ticker=ticker)
+        assert result["best_bid"] == pytest.approx(idx + 1.5)
+        assert result["best_ask"] == pytest.approx(idx + 2.5)
+
+
+def test_cancel_should_be_routed_to_shard_owning_order(
+    sharded_order_book: ShardedOrderBook,
+):
+    ticker = "SCRUB"
+
+    process_order(order_book=sharded_order_book, order=f"1|best|a|{ticker}|S|1.5|1")
+    process_order(order_book=sharded_order_book, order=f"1|next|a|{ticker}|S|2.5|1")
+    process_order(order_book=sharded_order_book, order="2|best|c")
+
+    assert sharded_order_book.get_best_ask(ticker=ticker) == pytest.approx(2.5)
+
+
+@pytest.mark.parametrize(
+    "order", ["789|unknown|c", "789|unknown|u|10"], ids=["cancel", "update"]
+)
+def test_modifying_non_existing_order_should_log_error(
+    sharded_order_book: ShardedOrderBook, capsys, order: str
+):
+    process_order(order_book=sharded_order_book, order=order)
+
+    error_regex = re.compile("ERROR.*unknown")
+    assert error_regex.match(capsys.readouterr().err)
+
+
+def test_order_with_duplicated_id_should_not_be_added_to_any_shard(
+    sharded_order_book: ShardedOrderBook, capsys
+):
+    for idx, ticker in enumerate(TICKERS):
+        process_order(
+            order_book=sharded_order_book, order=f"1|dup|a|{ticker}|B|{idx + 1}|1"
+        )
+
+    assert "ERROR" in capsys.readouterr().err
+    assert sharded_order_book.get_best_bid(ticker=TICKERS[0]) == pytest.approx(1)
+    for ticker in TICKERS[1:]:
+        assert sharded_order_book.get_best_bid(ticker=ticker) == pytest.approx(0)
+
+
+def test_failing_shard_write_should_not_stop_shard():
+    order_book = ShardedOrderBook(
+        num_of_shards=1, create_shard_storage=FaultyOrderStorage, batch_size=4
+    )
+    process_order(order_book=order_book, order="1|o1|a|FAULTY|B|1.0|1")
+    process_order(order_book=order_book, order="1|o2|a|TICK|B|1.0|1")
+
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(1.0)
+    order_book.close()
+
+
+def test_failing_shard_query_should_raise_and_keep_shard_running():
+    order_book = ShardedOrderBook(
+        num_of_shards=1, create_shard_storage=FaultyOrderStorage, batch_size=4
+    )
+
+    with pytest.raises(ShardQueryError, match="Shard 0.*No asks for TICK"):
+        order_book.get_best_ask(ticker="TICK")
+    assert order_book.get_best_bid(ticker="TICK") == pytest.approx(0.0)
+    order_book.close()
+
+
+def test_stopped_shard_should_be_named_in_error():
+    order_book = ShardedOrderBook(
+        num_of_shards=1, create_shard_storage=FaultyOrderStorage, batch_size=4
+    )
+    process_order(order_book=order_book, order="1|o1|a|CRASH|B|1.0|1")
+
+    with pytest.raises(ShardStoppedError, match="Shard 0.*exit code 3"):
+        order_book.get_best_bid(ticker="TICK")
+    with pytest.raises(ShardStoppedError):
+        order_book.close()
+
+
+def test_order_lines_should_be_routed_to_shards_and_summarised(
+    sharded_order_book: ShardedOrderBook,
+):
+    orders: List[Union[str, bytes]] = [
+        f"1|b{idx}|a|{ticker}|B|{idx + 1}.5|1\n" for idx, ticker in enumerate(TICKERS)
+    ]
+    orders += [
+        b"2|b1|c\n",
+        "2|b2|u|7\n",
+        b"3|bad|a|TICK3|B|abc|1\n",
+        b"\xff|x|c\n",
+        "5|unknown|c",
+    ]
+    orders += [f"4|b0|a|{ticker}|S|9.0|1" for ticker in TICKERS[1:]]
+
+    summary = process_orders(order_book=sharded_order_book, orders=orders)
+
+    assert (summary.applied, summary.rejected) == (10, 2)
+    assert summary.errors == {"DuplicatedOrderIdError": 7, "OrderDoesNotExistError": 1}
+    best_prices = sharded_order_book.get_best_bids_and_asks(tickers=TICKERS)
+    assert list(best_prices.bids) == pytest.approx(
+        [1.5, 0.0] + [idx + 1.5 for idx in range(2, 8)]
+    )
+    assert list(best_prices.asks) == pytest.approx([0.0] * 8)
+
+    process_order(order_book=sharded_order_book, order="6|b2|c")
+    assert sharded_order_book.get_best_bid(ticker="TICK2") == pytest.approx(0.0)
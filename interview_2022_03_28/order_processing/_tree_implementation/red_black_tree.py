@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import math
-from enum import Enum, auto, unique
-from typing import Optional
+from typing import Iterator, Optional
 
 from ..order import Order
 from ..order_book import OrderBookError
@@ -16,70 +14,104 @@ class OrderNotFoundInNodeOrders(OrderBookError):
     pass
 
 
-@unique
-class NodeColor(Enum):
-    RED = auto()
-    BLACK = auto()
+RED = 0
+BLACK = 1
 
 
 class RedBlackNode:
+    __slots__ = (
+        "color",
+        "parent",
+        "left",
+        "right",
+        "price_ticks",
+        "orders",
+        "total_size",
+    )
+
     def __init__(self, order: Order, parent: Optional[RedBlackNode]) -> None:
-        self.color: NodeColor = NodeColor.RED
+        self.color = RED
         self.parent: Optional[RedBlackNode] = parent
         self.left: Optional[RedBlackNode] = None
         self.right: Optional[RedBlackNode] = None
-        self.price = order.price
+        self.price_ticks = order.price_ticks
 
         self.orders = {}
         self.orders[order.order_id] = order
+        self.total_size = order.size
+
+    def add_order(self, order: Order) -> None:
+        self.orders[order.order_id] = order
+        self.total_size += order.size
+
+    def update_order(self, order_id: str, size: int) -> None:
+        order = self.orders[order_id]
+        self.total_size += size - order.size
+        order.size = size
+
+    def remove_order(self, order_id: str) -> None:
+        self.total_size -= self.orders.pop(order_id).size
 
 
 class RedBlackTree:
     def __init__(self) -> None:
         self.root: Optional[RedBlackNode] = None
+        self.__minimum: Optional[RedBlackNode] = None
+        self.__maximum: Optional[RedBlackNode] = None
+        self.__num_of_levels = 0
+
+    def __len__(self) -> int:
+        return self.__num_of_levels
 
-    def insert(self, order: Order) -> None:
+    def insert(self, order: Order) -> RedBlackNode:
         parent: Optional[RedBlackNode] = None
         current = self.root
 
         # find parent for new node
         while current is not None:
             parent = current
-            if order.price < current.price:
+            if order.price_ticks < current.price_ticks:
                 current = current.left
-            elif order.price > current.price:
+            elif order.price_ticks > current.price_ticks:
                 current = current.right
             else:
-                current.orders[order.order_id] = order
-                return
+                current.add_order(order=order)
+                return current
+
+        new_node = RedBlackNode(order=order, parent=parent)
+        current_node = new_node
+        self.__num_of_levels += 1
 
-        current_node = RedBlackNode(order=order, parent=parent)
+        if self.__minimum is None or order.price_ticks < self.__minimum.price_ticks:
+            self.__minimum = new_node
+        if self.__maximum is None or order.price_ticks > self.__maximum.price_ticks:
+            self.__maximum = new_node
 
         if parent is None:
             self.root = current_node
-            return
+            return new_node
 
         # set new node as child to the parent
         while parent is not None:
-            if current_node.price < parent.price:
+            if current_node.price_ticks < parent.price_ticks:
                 parent.left = current_node
             else:
                 parent.right = current_node
 
             # loop?
-            if parent.color == NodeColor.BLACK:
+            if parent.color == BLACK:
                 # insertion case 1: parent is black
-                return
+                return new_node
 
             grandparent = parent.parent
 
             if grandparent is None:
                 # insertion case 4: parent is red and root
-                parent.color = NodeColor.BLACK
-                return
+                parent.color = BLACK
+                return new_node
 
             uncle = find_brother(node=parent)
-            if uncle is None or uncle.color == NodeColor.BLACK:
+            if uncle is None or uncle.color == BLACK:
                 # insertion case 5 and 6: parent is red, uncle is black
                 if uncle is grandparent.right and current_node is parent.right:
                     # insertion case 5: parent is red, uncle is black, current_node is right inner grandchild of grandparent
@@ -97,44 +129,62 @@ class RedBlackTree:
                     self.__rotate_right(parent=grandparent)
                 else:
                     self.__rotate_left(parent=grandparent)
-                parent.color = NodeColor.BLACK
-                grandparent.color = NodeColor.RED
+                parent.color = BLACK
+                grandparent.color = RED
 
-                return
+                return new_node
 
             # insertion case 2: parent is red, uncle is red
-            parent.color = NodeColor.BLACK
-            uncle.color = NodeColor.BLACK
-            grandparent.color = NodeColor.RED
+            parent.color = BLACK
+            uncle.color = BLACK
+            grandparent.color = RED
             current_node = grandparent
             parent = current_node.parent
 
         # insertion case 3: current_node is root and red
+        return new_node
 
     def update(self, order: Order) -> None:
-        node_to_update = find(node=self.root, price=order.price)
+        node_to_update = find(node=self.root, price_ticks=order.price_ticks)
         if node_to_update is None:
             raise NodeNotFoundInTree(
-                f"Cannot update size of nonexistent order: {order.order_id} with price: {order.price}"
+                f"Cannot update size of nonexistent order: {order.order_id} with price ticks: {order.price_ticks}"
             )
 
         if order.order_id not in node_to_update.orders:
             raise OrderNotFoundInNodeOrders(
-                f"Cannot update size of nonexistent order: {order.order_id} with price {order.price}"
+                f"Cannot update size of nonexistent order: {order.order_id} with price ticks: {order.price_ticks}"
             )
 
-        node_to_update.orders[order.order_id].size = order.size
+        node_to_update.update_order(order_id=order.order_id, size=order.size)
 
     def delete(self, order: Order) -> None:
-        node_to_remove = find(node=self.root, price=order.price)
+        node_to_remove = find(node=self.root, price_ticks=order.price_ticks)
         if node_to_remove is None:
             raise NodeNotFoundInTree(
-                f"Cannot remove nonexistent order: {order.order_id} with price: {order.price}"
+                f"Cannot remove nonexistent order: {order.order_id} with price ticks: {order.price_ticks}"
             )
 
-        if len(node_to_remove.orders) > 1:
-            del node_to_remove.orders[order.order_id]
-            return
+        if order.order_id not in node_to_remove.orders:
+            raise OrderNotFoundInNodeOrders(
+                f"Cannot remove nonexistent order: {order.order_id} with price ticks: {order.price_ticks}"
+            )
+
+        self.remove_order(level=node_to_remove, order_id=order.order_id)
+
+    def remove_order(self, level: RedBlackNode, order_id: str) -> None:
+        level.remove_order(order_id=order_id)
+        if not level.orders:
+            self.__remove_node(node_to_remove=level)
+
+    def __remove_node(self, node_to_remove: RedBlackNode) -> None:
+        self.__num_of_levels -= 1
+
+        # extremes have at most one child, so they are never moved by the removal below
+        if node_to_remove is self.__minimum:
+            self.__minimum = successor(node=node_to_remove)
+        if node_to_remove is self.__maximum:
+            self.__maximum = predecessor(node=node_to_remove)
 
         current_node = node_to_remove
         current_node_original_color = current_node.color
@@ -162,100 +212,102 @@ class RedBlackTree:
             current_node.left.parent = current_node
             current_node.color = node_to_remove.color
 
-        if current_node_original_color == NodeColor.BLACK:
+        if current_node_original_color == BLACK:
             self.fix_delete(node=child)
 
     def fix_delete(self, node: RedBlackNode) -> None:
-        while (
-            node is not None and node is not self.root and node.color == NodeColor.BLACK
-        ):
+        while node is not None and node is not self.root and node.color == BLACK:
             if node is node.parent.left:
                 sibling = node.parent.right
-                if sibling is not None and sibling.color == NodeColor.RED:
-                    sibling.color = NodeColor.BLACK
-                    node.parent.color = NodeColor.RED
+                if sibling is not None and sibling.color == RED:
+                    sibling.color = BLACK
+                    node.parent.color = RED
                     self.__rotate_left(parent=node.parent)
                     sibling = node.parent.right
                 if (
                     sibling is not None
-                    and (sibling.left is None or sibling.left.color == NodeColor.BLACK)
-                    and (
-                        sibling.right is None or sibling.right.color == NodeColor.BLACK
-                    )
+                    and (sibling.left is None or sibling.left.color == BLACK)
+                    and (sibling.right is None or sibling.right.color == BLACK)
                 ):
-                    sibling.color = NodeColor.RED
+                    sibling.color = RED
                     node = node.parent
                 else:
                     if (
                         sibling is not None
                         and sibling.right is not None
-                        and sibling.right.color == NodeColor.BLACK
+                        and sibling.right.color == BLACK
                     ):
-                        sibling.left.color = NodeColor.BLACK
-                        sibling.color = NodeColor.RED
+                        sibling.left.color = BLACK
+                        sibling.color = RED
                         self.__rotate_right(parent=sibling)
                         sibling = node.parent.right
 
                     if sibling is not None:
                         sibling.color = node.parent.color
                         if sibling.right is not None:
-                            sibling.right.color = NodeColor.BLACK
-                    node.parent.color = NodeColor.BLACK
+                            sibling.right.color = BLACK
+                    node.parent.color = BLACK
                     self.__rotate_left(parent=node.parent)
                     node = self.root
             else:
                 sibling = node.parent.left
-                if sibling is not None and sibling.color == NodeColor.RED:
-                    sibling.color = NodeColor.BLACK
-                    node.parent.color = NodeColor.RED
+                if sibling is not None and sibling.color == RED:
+                    sibling.color = BLACK
+                    node.parent.color = RED
                     self.__rotate_right(parent=node.parent)
                     sibling = node.parent.left
 
                 if (
                     sibling is not None
-                    and (sibling.left is None or sibling.left.color == NodeColor.BLACK)
-                    and (
-                        sibling.right is None or sibling.right.color == NodeColor.BLACK
-                    )
+                    and (sibling.left is None or sibling.left.color == BLACK)
+                    and (sibling.right is None or sibling.right.color == BLACK)
                 ):
-                    sibling.color = NodeColor.RED
+                    sibling.color = RED
                     node = node.parent
                 else:
                     if (
                         sibling is not None
                         and sibling.left is not None
-                        and sibling.left.color == NodeColor.BLACK
+                        and sibling.left.color == BLACK
                     ):
-                        sibling.right.color = NodeColor.BLACK
-                        sibling.color = NodeColor.RED
+                        sibling.right.color = BLACK
+                        sibling.color = RED
                         self.__rotate_left(parent=sibling)
                         sibling = node.parent.left
 
                     if sibling is not None:
                         sibling.color = node.parent.color
                         if sibling.left is not None:
-                            sibling.left.color = NodeColor.BLACK
-                    node.parent.color = NodeColor.BLACK
+                            sibling.left.color = BLACK
+                    node.parent.color = BLACK
                     self.__rotate_right(parent=node.parent)
                     node = self.root
         if node is not None:
-            node.color = NodeColor.BLACK
+            node.color = BLACK
 
-    def get_minimum(self) -> float:
-        min_node = minimal_node(root=self.root)
+    def get_minimum(self) -> int:
+        if self.__minimum is None:
+            return 0
 
-        if min_node is None:
-            return 0.0
+        return self.__minimum.price_ticks
 
-        return min_node.price
+    def get_maximum(self) -> int:
+        if self.__maximum is None:
+            return 0
 
-    def get_maximum(self) -> float:
-        max_node = maximal_node(root=self.root)
+        return self.__maximum.price_ticks
 
-        if max_node is None:
-            return 0.0
-
-        return max_node.price
+    def levels(self, descending: bool = False) -> Iterator[RedBlackNode]:
+        if descending:
+            level = self.__maximum
+            while level is not None:
+                yield level
+                level = predecessor(node=level)
+        else:
+            level = self.__minimum
+            while level is not None:
+                yield level
+                level = successor(node=level)
 
     def __transplant(self, parent, child):
         if parent.parent is None:
@@ -361,14 +413,11 @@ class RedBlackTree:
         print_tree(root=self.root)
 
 
-def find(node: RedBlackNode, price: float) -> RedBlackNode:
-    if node is None or math.isclose(node.price, price):
-        return node
+def find(node: RedBlackNode, price_ticks: int) -> RedBlackNode:
+    while node is not None and node.price_ticks != price_ticks:
+        node = node.right if node.price_ticks < price_ticks else node.left
 
-    if node.price < price:
-        return find(node=node.right, price=price)
-
-    return find(node=node.left, price=price)
+    return node
 
 
 def find_brother(node) -> RedBlackNode:
@@ -401,14 +450,34 @@ def maximal_node(root) -> RedBlackNode:
     return current
 
 
+def successor(node: RedBlackNode) -> Optional[RedBlackNode]:
+    if node.right is not None:
+        return minimal_node(root=node.right)
+
+    while node.parent is not None and node is node.parent.right:
+        node = node.parent
+
+    return node.parent
+
+
+def predecessor(node: RedBlackNode) -> Optional[RedBlackNode]:
+    if node.left is not None:
+        return maximal_node(root=node.left)
+
+    while node.parent is not None and node is node.parent.left:
+        node = node.parent
+
+    return node.parent
+
+
 def print_tree(root: RedBlackNode, level=0):
     if root is not None:
         print_tree(root.left, level + 1)
         print(
             "-" * 4 * level
             + ">"
-            + str(root.price)
-            + ("R" if root.color == NodeColor.RED else "B")
+            + str(root.price_ticks)
+            + ("R" if root.color == RED else "B")
         )
         print_tree(root.right, level + 1)
 
@@ -445,8 +514,10 @@ def swap_parent_and_child(*, parent: RedBlackNode, child: RedBlackNode) -> None:
     child.parent = grandparent
     parent.color, child.color = child.color, parent.color
 
-    print(f"parent {parent.price} has left: {parent.left} and right: {parent.right}")
-    print(f"child {child.price} has left: {child.left} and right: {child.right}")
+    print(
+        f"parent {parent.price_ticks} has left: {parent.left} and right: {parent.right}"
+    )
+    print(f"child {child.price_ticks} has left: {child.left} and right: {child.right}")
 
 
 def remove_node_from_parent(node: RedBlackNode, /) -> None:
@@ -8,7 +8,7 @@ class Node:
         self.right = None
         self.color = 1
 
-        self.price = order.price
+        self.price = order.price_ticks
 
         self.orders = {}
         self.orders[order.order_id] = order
@@ -115,10 +115,10 @@ class RedBlackTree:
     def delete_node_helper(self, node, order: Order):
         z = None
         while node is not None:
-            if node.price == order.price:
+            if node.price == order.price_ticks:
                 z = node
 
-            if node.price <= order.price:
+            if node.price <= order.price_ticks:
                 node = node.right
             else:
                 node = node.left
@@ -340,9 +340,13 @@ class RedBlackTree:
         self.delete_node_helper(self.root, order=order)
 
     def update(self, order: Order) -> None:
-        node_to_remove = self.search_tree_helper(node=self.root, price=order.price)
+        node_to_remove = self.search_tree_helper(
+            node=self.root, price=order.price_ticks
+        )
         if node_to_remove is None:
-            raise RuntimeError(f"BLAX NODE NOT FOUND TO UPDATE price {order.price}")
+            raise RuntimeError(
+                f"BLAX NODE NOT FOUND TO UPDATE price {order.price_ticks}"
+            )
 
         node_to_remove.orders[order.order_id].size = order.size
 
@@ -0,0 +1,16 @@
+import pytest
+
+from ...prices import InvalidPriceError, price_to_ticks, ticks_to_price
+
+
+@pytest.mark.parametrize("price", [0.0, 1.5, 7.77777, 99.99999])
+def test_price_should_survive_round_trip_through_ticks(price: float):
+    assert ticks_to_price(price_ticks=price_to_ticks(price=price)) == pytest.approx(
+        price
+    )
+
+
+@pytest.mark.parametrize("price", [float("inf"), float("-inf"), float("nan"), 1e305])
+def test_non_finite_price_should_not_be_converted_to_ticks(price: float):
+    with pytest.raises(InvalidPriceError):
+        price_to_ticks(price=price)
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from ...order import Order, OrderType
+from ..red_black_tree import RedBlackTree, maximal_node, minimal_node
+
+
+def create_order(order_id: str, price_ticks: int) -> Order:
+    return Order(
+        order_id=order_id,
+        timestamp=1,
+        ticker="TICK",
+        price_ticks=price_ticks,
+        size=1,
+        order_type=OrderType.BID,
+    )
+
+
+def walked_minimum(tree: RedBlackTree) -> int:
+    node = minimal_node(root=tree.root)
+    return 0 if node is None else node.price_ticks
+
+
+def walked_maximum(tree: RedBlackTree) -> int:
+    node = maximal_node(root=tree.root)
+    return 0 if node is None else node.price_ticks
+
+
+def test_empty_tree_should_have_zero_extremes():
+    tree = RedBlackTree()
+
+    assert tree.get_minimum() == 0
+    assert tree.get_maximum() == 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cached_extremes_should_match_tree_walk_after_inserts_and_deletes(seed: int):
+    randomizer = random.Random(seed)
+    tree = RedBlackTree()
+    live_orders = []
+
+    for idx in range(500):
+        if live_orders and randomizer.random() < 0.4:
+            order = live_orders.pop(randomizer.randrange(len(live_orders)))
+            tree.delete(order=order)
+        else:
+            order = create_order(
+                order_id=str(idx), price_ticks=randomizer.randint(1, 60)
+            )
+            tree.insert(order=order)
+            live_orders.append(order)
+
+        assert tree.get_minimum() == walked_minimum(tree=tree)
+        assert tree.get_maximum() == walked_maximum(tree=tree)
@@ -0,0 +1,53 @@
+import pytest
+
+from ...best_bid_and_ask import get_best_bids_and_asks
+from ...process_order import process_order
+from ..tree_order_book import TreeOrderBook
+
+
+def add_orders(tree_order_book: TreeOrderBook) -> None:
+    for idx, (ticker, side, price) in enumerate(
+        [
+            ("AAA", "B", 10.1),
+            ("AAA", "B", 10.2),
+            ("AAA", "S", 10.5),
+            ("BBB", "S", 3.3),
+            ("BBB", "S", 3.1),
+            ("CCC", "B", 7.7),
+            ("DDD", "B", 1.0),
+        ]
+    ):
+        process_order(
+            order_book=tree_order_book, order=f"1|o{idx}|a|{ticker}|{side}|{price}|1"
+        )
+    process_order(order_book=tree_order_book, order="2|o6|c")
+
+
+def test_best_bids_and_asks_of_all_tickers_should_match_single_queries(
+    tree_order_book: TreeOrderBook,
+):
+    add_orders(tree_order_book=tree_order_book)
+
+    best_prices = get_best_bids_and_asks(order_book=tree_order_book)
+
+    assert sorted(best_prices.tickers) == ["AAA", "BBB", "CCC"]
+    assert list(best_prices.bids) == [
+        tree_order_book.get_best_bid(ticker=ticker) for ticker in best_prices.tickers
+    ]
+    assert list(best_prices.asks) == [
+        tree_order_book.get_best_ask(ticker=ticker) for ticker in best_prices.tickers
+    ]
+
+
+def test_best_bids_and_asks_should_follow_requested_tickers(
+    tree_order_book: TreeOrderBook,
+):
+    add_orders(tree_order_book=tree_order_book)
+
+    best_prices = get_best_bids_and_asks(
+        order_book=tree_order_book, tickers=["CCC", "NONEXT", "AAA", "BBB", "DDD"]
+    )
+
+    assert best_prices.tickers == ["CCC", "NONEXT", "AAA", "BBB", "DDD"]
+    assert list(best_prices.bids) == pytest.approx([7.7, 0.0, 10.2, 0.0, 0.0])
+    assert list(best_prices.asks) == pytest.approx([0.0, 0.0, 10.5, 3.1, 0.0])
@@ -0,0 +1,88 @@
+import random
+import threading
+from typing import List
+
+import pytest
+
+from ...process_order import process_order
+from ...top_of_book_snapshot import TopOfBookSnapshot
+from ..tree_order_storage_factory import create_tree_order_storage
+
+
+def test_concurrent_storage_should_read_prices_from_snapshot():
+    storage = create_tree_order_storage(concurrent=True)
+    processor = storage.get_processor()
+    process_order(order_book=processor, order="1|b1|a|TICK|B|10.1|5")
+    process_order(order_book=processor, order="1|s1|a|TICK|S|10.5|5")
+    process_order(order_book=processor, order="1|s2|a|OTHER|S|3.5|5")
+    process_order(order_book=processor, order="2|s2|c")
+
+    price_view = storage.get_price_view()
+    assert isinstance(price_view, TopOfBookSnapshot)
+    assert price_view.get_best_bid(ticker="TICK") == pytest.approx(10.1)
+    assert price_view.get_best_ask(ticker="TICK") == pytest.approx(10.5)
+    assert price_view.get_best_ask(ticker="OTHER") == 0.0
+
+    best_prices = price_view.get_best_bids_and_asks()
+    assert best_prices.tickers == ["TICK"]
+    assert list(best_prices.bids) == pytest.approx([10.1])
+    assert list(best_prices.asks) == pytest.approx([10.5])
+
+
+def test_snapshot_should_match_tree_under_random_churn():
+    rng = random.Random(2022)
+    storage = create_tree_order_storage(concurrent=True)
+    processor = storage.get_processor()
+    tickers = ["AAA", "BBB", "CCC"]
+    live_ids: List[str] = []
+
+    for idx in range(2_000):
+        if live_ids and rng.random() < 0.4:
+            order_id = live_ids.pop(rng.randrange(len(live_ids)))
+            process_order(order_book=processor, order=f"{idx}|{order_id}|c")
+        else:
+            side = rng.choice(["B", "S"])
+            price = rng.randint(1, 40) / 4
+            ticker = rng.choice(tickers)
+            process_order(
+                order_book=processor, order=f"{idx}|o{idx}|a|{ticker}|{side}|{price}|1"
+            )
+            live_ids.append(f"o{idx}")
+
+        snapshot = storage.get_price_view().get_best_bids_and_asks(tickers=tickers)
+        expected = processor.get_best_bids_and_asks(tickers=tickers)
+        assert snapshot == expected
+
+
+def test_readers_should_only_see_published_prices_while_writer_adds_orders():
+    storage = create_tree_order_storage(concurrent=True)
+    processor = storage.get_processor()
+    price_view = storage.get_price_view()
+    stop = threading.Event()
+    errors: List[str] = []
+
+    def read_prices() -> None:
+        previous_bid = 0.0
+        while not stop.is_set():
+            best_bid = price_view.get_best_bid(ticker="TICK")
+            if best_bid < previous_bid:
+                errors.append(f"Best bid went back from {previous_bid} to {best_bid}")
+            previous_bid = best_bid
+
+    readers = [threading.Thread(target=read_prices) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for idx in range(1, 3_000):
+        process_order(order_book=processor, order=f"1|o{idx}|a|TICK|B|{idx / 100}|1")
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert not errors
+    assert price_view.get_best_bid(ticker="TICK") == pytest.approx(29.99)
+
+
+def test_default_storage_should_read_prices_from_tree():
+    storage = create_tree_order_storage()
+
+    assert storage.get_price_view() is storage.get_processor()
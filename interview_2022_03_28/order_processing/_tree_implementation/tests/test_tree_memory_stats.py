@@ -0,0 +1,50 @@
+from ...process_order import process_order
+from ..tree_order_book import TreeOrderBook
+
+
+def test_empty_book_should_report_no_memory_usage(tree_order_book: TreeOrderBook):
+    stats = tree_order_book.memory_stats()
+
+    assert stats.live_orders == 0
+    assert stats.price_levels == 0
+    assert stats.tickers == 0
+    assert stats.approximate_bytes == 0
+
+
+def test_stats_should_count_live_orders_levels_and_tickers(
+    tree_order_book: TreeOrderBook,
+):
+    process_order(order_book=tree_order_book, order="1|a1|a|AAAA|B|1.1|1")
+    process_order(order_book=tree_order_book, order="1|a2|a|AAAA|B|1.1|1")
+    process_order(order_book=tree_order_book, order="1|a3|a|AAAA|S|2.2|1")
+    process_order(order_book=tree_order_book, order="1|b1|a|BBBB|S|3.3|1")
+
+    stats = tree_order_book.memory_stats()
+
+    assert stats.live_orders == 4
+    assert stats.price_levels == 3
+    assert stats.tickers == 2
+    assert set(stats.approximate_bytes_per_ticker) == {"AAAA", "BBBB"}
+    assert (
+        stats.approximate_bytes_per_ticker["AAAA"]
+        > stats.approximate_bytes_per_ticker["BBBB"]
+        > 0
+    )
+
+
+def test_cancelled_orders_and_empty_tickers_should_be_reclaimed(
+    tree_order_book: TreeOrderBook,
+):
+    for idx in range(100):
+        process_order(
+            order_book=tree_order_book, order=f"1|o{idx}|a|T{idx % 10}|B|{idx + 1}|1"
+        )
+    for idx in range(100):
+        process_order(order_book=tree_order_book, order=f"2|o{idx}|c")
+
+    stats = tree_order_book.memory_stats()
+
+    assert stats.live_orders == 0
+    assert stats.price_levels == 0
+    assert stats.tickers == 0
+    assert tree_order_book.orders == {}
@@ -3,6 +3,7 @@ import re
 import pytest
 
 from ...order import Order, OrderType
+from ...prices import price_to_ticks
 from ...process_order import process_order
 from ..tree_order_book import TreeOrderBook
 
@@ -22,7 +23,7 @@ def test_after_adding_one_order_root_should_contain_its_data(
     order_type: OrderType,
 ):
     order_id = "LOL"
-    timestamp = "123"
+    timestamp = 123
     ticker = "ZZZZ"
     price = 54321.1
     size = 1337
@@ -39,7 +40,7 @@ def test_after_adding_one_order_root_should_contain_its_data(
             order_id=order_id,
             timestamp=timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=size,
             order_type=order_type,
         )
@@ -56,7 +57,7 @@ def test_after_adding_two_orders_in_ascending_order_root_should_have_lower_price
     ticker = "ZZZZ"
 
     order_id = "FIRST"
-    timestamp = "123"
+    timestamp = 123
     lower_price = 1.0
     size = 88
 
@@ -75,7 +76,7 @@ def test_after_adding_two_orders_in_ascending_order_root_should_have_lower_price
             order_id=order_id,
             timestamp=timestamp,
             ticker=ticker,
-            price=lower_price,
+            price_ticks=price_to_ticks(price=lower_price),
             size=size,
             order_type=order_type,
         )
@@ -92,7 +93,7 @@ def test_after_adding_two_orders_in_ascending_order_right_child_should_have_high
     ticker = "ZZZZ"
 
     order_id = "SECOND"
-    timestamp = "456"
+    timestamp = 456
     higher_price = 100.0
     size = 88
 
@@ -111,7 +112,7 @@ def test_after_adding_two_orders_in_ascending_order_right_child_should_have_high
             order_id=order_id,
             timestamp=timestamp,
             ticker=ticker,
-            price=higher_price,
+            price_ticks=price_to_ticks(price=higher_price),
             size=size,
             order_type=order_type,
         )
@@ -128,7 +129,7 @@ def test_after_two_orders_in_descending_order_root_should_have_higher_price(
     ticker = "ZZZZ"
 
     order_id = "FIRST"
-    timestamp = "123"
+    timestamp = 123
     higher_price = 100.0
     size = 88
 
@@ -147,7 +148,7 @@ def test_after_two_orders_in_descending_order_root_should_have_higher_price(
             order_id=order_id,
             timestamp=timestamp,
             ticker=ticker,
-            price=higher_price,
+            price_ticks=price_to_ticks(price=higher_price),
             size=size,
             order_type=order_type,
         )
@@ -164,7 +165,7 @@ def test_after_two_orders_in_descending_order_left_child_should_have_lower_price
     ticker = "ZZZZ"
 
     order_id = "SECOND"
-    timestamp = "123"
+    timestamp = 123
     lower_price = 1.0
     size = 88
 
@@ -183,7 +184,7 @@ def test_after_two_orders_in_descending_order_left_child_should_have_lower_price
             order_id=order_id,
             timestamp=timestamp,
             ticker=ticker,
-            price=lower_price,
+            price_ticks=price_to_ticks(price=lower_price),
             size=size,
             order_type=order_type,
         )
@@ -229,11 +230,11 @@ def test_root_should_contain_all_orders_of_same_price(
 
     first_order_id = "X"
     first_size = 100
-    first_timestamp = "1000"
+    first_timestamp = 1000
 
     second_order_id = "Y"
     second_size = 200
-    second_timestamp = "2000"
+    second_timestamp = 2000
 
     first_order = (
         f"{first_timestamp}|{first_order_id}|a|{ticker}|{side}|{price}|{first_size}"
@@ -252,7 +253,7 @@ def test_root_should_contain_all_orders_of_same_price(
             order_id=first_order_id,
             timestamp=first_timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=first_size,
             order_type=order_type,
         ),
@@ -260,7 +261,7 @@ def test_root_should_contain_all_orders_of_same_price(
             order_id=second_order_id,
             timestamp=second_timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=second_size,
             order_type=order_type,
         ),
@@ -279,11 +280,11 @@ def test_given_root_with_lower_price_then_right_child_should_contain_all_orders_
 
     first_order_id = "X"
     first_size = 100
-    first_timestamp = "1000"
+    first_timestamp = 1000
 
     second_order_id = "Y"
     second_size = 200
-    second_timestamp = "2000"
+    second_timestamp = 2000
 
     first_order = (
         f"{first_timestamp}|{first_order_id}|a|{ticker}|{side}|{price}|{first_size}"
@@ -303,7 +304,7 @@ def test_given_root_with_lower_price_then_right_child_should_contain_all_orders_
             order_id=first_order_id,
             timestamp=first_timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=first_size,
             order_type=order_type,
         ),
@@ -311,7 +312,7 @@ def test_given_root_with_lower_price_then_right_child_should_contain_all_orders_
             order_id=second_order_id,
             timestamp=second_timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=second_size,
             order_type=order_type,
         ),
@@ -330,11 +331,11 @@ def test_given_root_with_lower_price_then_left_child_should_contain_all_orders_o
 
     first_order_id = "X"
     first_size = 100
-    first_timestamp = "1000"
+    first_timestamp = 1000
 
     second_order_id = "Y"
     second_size = 200
-    second_timestamp = "2000"
+    second_timestamp = 2000
 
     first_order = (
         f"{first_timestamp}|{first_order_id}|a|{ticker}|{side}|{price}|{first_size}"
@@ -354,7 +355,7 @@ def test_given_root_with_lower_price_then_left_child_should_contain_all_orders_o
             order_id=first_order_id,
             timestamp=first_timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=first_size,
             order_type=order_type,
         ),
@@ -362,7 +363,7 @@ def test_given_root_with_lower_price_then_left_child_should_contain_all_orders_o
             order_id=second_order_id,
             timestamp=second_timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=second_size,
             order_type=order_type,
         ),
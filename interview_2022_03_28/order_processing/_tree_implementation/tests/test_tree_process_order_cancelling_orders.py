@@ -3,7 +3,9 @@ import re
 import pytest
 
 from ...order import Order, OrderType
+from ...prices import price_to_ticks
 from ...process_order import process_order
+from ..red_black_tree import find
 from ..tree_order_book import TreeOrderBook
 
 
@@ -25,7 +27,7 @@ def test_cancelling_non_existing_order_should_not_modify_existing_orders(
     container_name: str,
     order_type: OrderType,
 ):
-    timestamp = "789"
+    timestamp = 789
     order_id = "bbaa"
     ticker = "XXYY"
     price = 4.56789
@@ -44,7 +46,7 @@ def test_cancelling_non_existing_order_should_not_modify_existing_orders(
             order_id=order_id,
             timestamp=timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=size,
             order_type=order_type,
         )
@@ -61,9 +63,9 @@ def test_cancelling_non_existing_order_should_log_error(
     assert error_regex.match(capsys.readouterr().err)
 
 
-@pytest.mark.parametrize("side, container", [("B", "bids"), ("S", "asks")])
-def test_cancelling_existing_order_should_remove_it_from_tree(
-    tree_order_book: TreeOrderBook, side: str, container: str
+@pytest.mark.parametrize("side", ["B", "S"])
+def test_cancelling_last_order_of_ticker_should_remove_ticker_from_book(
+    tree_order_book: TreeOrderBook, side: str
 ):
     order_id = "bbaa"
     ticker = "SCRUB"
@@ -73,7 +75,7 @@ def test_cancelling_existing_order_should_remove_it_from_tree(
     )
     process_order(order_book=tree_order_book, order=f"789|{order_id}|c")
 
-    assert tree_order_book.orders[ticker][container].root is None
+    assert ticker not in tree_order_book.orders
 
 
 @pytest.mark.parametrize(
@@ -85,7 +87,7 @@ def test_cancelling_existing_order_should_not_modify_other_orders(
 ):
     order_id_to_cancel = "cancelled"
 
-    timestamp = "789"
+    timestamp = 789
     id_of_unchanged_order = "bbaa"
     ticker = "XXYY"
     price = 4.56789
@@ -108,7 +110,7 @@ def test_cancelling_existing_order_should_not_modify_other_orders(
             order_id=id_of_unchanged_order,
             timestamp=timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=size,
             order_type=order_type,
         )
@@ -124,7 +126,7 @@ def test_given_two_orders_with_same_price_cancel_should_remove_proper_order(
 ):
     order_id_to_cancel = "cancelled"
 
-    timestamp = "789"
+    timestamp = 789
     id_of_unchanged_order = "bbaa"
     ticker = "XXYY"
     price = 4.56789
@@ -147,8 +149,68 @@ def test_given_two_orders_with_same_price_cancel_should_remove_proper_order(
             order_id=id_of_unchanged_order,
             timestamp=timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=size,
             order_type=order_type,
         )
     }
+
+
+@pytest.mark.parametrize("side, container", [("B", "bids"), ("S", "asks")])
+def test_cancel_should_remove_order_only_from_level_of_exactly_same_price(
+    tree_order_book: TreeOrderBook, side: str, container: str
+):
+    ticker = "TICK"
+
+    process_order(
+        order_book=tree_order_book, order=f"1|lower|a|{ticker}|{side}|1.00001|1"
+    )
+    process_order(
+        order_book=tree_order_book, order=f"1|higher|a|{ticker}|{side}|1.00002|1"
+    )
+    process_order(order_book=tree_order_book, order="2|lower|c")
+
+    tree_root = tree_order_book.orders[ticker][container].root
+    assert tree_root is not None
+    assert tree_root.left is None and tree_root.right is None
+    assert tree_root.price_ticks == price_to_ticks(price=1.00002)
+    assert list(tree_root.orders) == ["higher"]
+
+
+def test_cancelling_already_cancelled_order_should_log_error(
+    tree_order_book: TreeOrderBook, capsys
+):
+    order_id = "twice"
+
+    process_order(order_book=tree_order_book, order=f"1|{order_id}|a|TICK|B|1.2|1")
+    process_order(order_book=tree_order_book, order=f"2|{order_id}|c")
+    capsys.readouterr()
+    process_order(order_book=tree_order_book, order=f"3|{order_id}|c")
+
+    error_regex = re.compile(f"ERROR.*{order_id}")
+    assert error_regex.match(capsys.readouterr().err)
+
+
+@pytest.mark.parametrize("side, container", [("B", "bids"), ("S", "asks")])
+def test_orders_should_stay_reachable_after_levels_are_rebalanced(
+    tree_order_book: TreeOrderBook, side: str, container: str
+):
+    ticker = "TICK"
+
+    for idx in range(1, 33):
+        process_order(
+            order_book=tree_order_book, order=f"1|o{idx}|a|{ticker}|{side}|{idx}|1"
+        )
+    for idx in range(1, 33, 2):
+        process_order(order_book=tree_order_book, order=f"2|o{idx}|c")
+    for idx in range(2, 33, 2):
+        process_order(order_book=tree_order_book, order=f"3|o{idx}|u|{idx + 100}")
+
+    tree = tree_order_book.orders[ticker][container]
+    for idx in range(1, 33):
+        level = find(node=tree.root, price_ticks=price_to_ticks(price=idx))
+        if idx % 2:
+            assert level is None
+        else:
+            assert level is not None
+            assert level.orders[f"o{idx}"].size == idx + 100
@@ -1,6 +1,7 @@
 import pytest
 
 from ...order import Order, OrderType
+from ...prices import price_to_ticks
 from ...process_order import process_order
 from ..tree_order_book import TreeOrderBook
 
@@ -25,10 +26,22 @@ INCORRECT_INPUTS = [
     "123|z42|a|ZZZZ|S|3.3|0",
     "123|z42|a|ZZZZ|B|3.3|-1",
     "123|z42|a|ZZZZ|S|3.3|-1",
+    "123|z42|a|ZZZZ|B|abc|1",
+    "123|z42|a|ZZZZ|S||1",
+    "123|z42|a|ZZZZ|B|inf|1",
+    "123|z42|a|ZZZZ|S|-inf|1",
+    "123|z42|a|ZZZZ|B|nan|1",
+    "123|z42|a|ZZZZ|S|1e400|1",
+    "123|z42|a|ZZZZ|B|1e305|1",
     "aaa|z42|a|ZZZZ|S|3.3|1",
     "1aa|z42|a|ZZZZ|S|3.3|1",
     "aa1|z42|a|ZZZZ|S|3.3|1",
     "1a1|z42|a|ZZZZ|S|3.3|1",
+    "\u00b2|z42|a|ZZZZ|S|3.3|1",
+    "123|z42|a|ZZZZ|B|3.3|\u00b2",
+    "\u00b2|z42|c",
+    "\u00b2|z42|u|1",
+    "123|z42|u|\u00b2",
     "123|#1|a|ZZZZ|S|3.3|1",
     "123|#id|a|ZZZZ|S|3.3|1",
     "123|1#|a|ZZZZ|S|3.3|1",
@@ -72,7 +85,7 @@ def test_given_incorrect_order_should_not_add_orders(
 def test_given_incorrect_order_should_not_modify_existing_orders(
     tree_order_book: TreeOrderBook, incorrect_order: str
 ):
-    timestamp = "123"
+    timestamp = 123
     order_id = "correctid"
     ticker = "KCIT"
     price = 8.54321
@@ -93,7 +106,7 @@ def test_given_incorrect_order_should_not_modify_existing_orders(
             order_id=order_id,
             timestamp=timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=size,
             order_type=OrderType.BID,
         )
@@ -142,7 +155,7 @@ class TestInvalidInputWithCorrectOrderInDatabase:
     def test_given_incorrect_order_should_not_modify_existing_orders(
         tree_order_book: TreeOrderBook, incorrect_order: str
     ):
-        timestamp = "123"
+        timestamp = 123
         order_id = "correctid"
         ticker = "KCIT"
         price = 8.54321
@@ -163,7 +176,7 @@ class TestInvalidInputWithCorrectOrderInDatabase:
                 order_id=order_id,
                 timestamp=timestamp,
                 ticker=ticker,
-                price=price,
+                price_ticks=price_to_ticks(price=price),
                 size=size,
                 order_type=OrderType.BID,
             )
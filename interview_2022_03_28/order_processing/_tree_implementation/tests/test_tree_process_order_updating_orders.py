@@ -3,6 +3,7 @@ import re
 import pytest
 
 from ...order import Order, OrderType
+from ...prices import price_to_ticks
 from ...process_order import process_order
 from ..tree_order_book import TreeOrderBook
 
@@ -34,7 +35,7 @@ def test_updating_non_existing_order_should_not_modify_other_orders(
 ):
     id_of_updated_order = "upd11"
 
-    timestamp = "789"
+    timestamp = 789
     id_of_unchanged_order = "bbaa"
     ticker = "XXYY"
     price = 4.56789
@@ -54,7 +55,7 @@ def test_updating_non_existing_order_should_not_modify_other_orders(
             order_id=id_of_unchanged_order,
             timestamp=timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=size,
             order_type=order_type,
         )
@@ -70,7 +71,7 @@ def test_updating_existing_order_should_not_modify_other_orders(
 ):
     id_of_updated_order = "updated"
 
-    timestamp = "789"
+    timestamp = 789
     id_of_unchanging_order = "bbaa"
     ticker = "XXYY"
     price = 4.56789
@@ -95,7 +96,7 @@ def test_updating_existing_order_should_not_modify_other_orders(
             order_id=id_of_unchanging_order,
             timestamp=timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=size,
             order_type=order_type,
         )
@@ -114,7 +115,7 @@ def test_updating_existing_order_should_change_its_size(
 
     order_id = "bbaa"
     price = 1.2
-    timestamp = "789"
+    timestamp = 789
 
     process_order(
         order_book=tree_order_book,
@@ -129,7 +130,7 @@ def test_updating_existing_order_should_change_its_size(
             order_id=order_id,
             timestamp=timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=new_size,
             order_type=order_type,
         )
@@ -147,11 +148,11 @@ def test_given_two_orders_with_same_price_updating_one_of_them_should_change_onl
     price = 1.2
 
     first_order_id = "bbaa"
-    first_timestamp = "789"
+    first_timestamp = 789
     first_size = 100
 
     second_order_id = "bbcc"
-    second_timestamp = "456"
+    second_timestamp = 456
     second_old_size = 200
     second_new_size = 2000
 
@@ -174,7 +175,7 @@ def test_given_two_orders_with_same_price_updating_one_of_them_should_change_onl
             order_id=first_order_id,
             timestamp=first_timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=first_size,
             order_type=order_type,
         ),
@@ -182,7 +183,7 @@ def test_given_two_orders_with_same_price_updating_one_of_them_should_change_onl
             order_id=second_order_id,
             timestamp=second_timestamp,
             ticker=ticker,
-            price=price,
+            price_ticks=price_to_ticks(price=price),
             size=second_new_size,
             order_type=order_type,
         ),
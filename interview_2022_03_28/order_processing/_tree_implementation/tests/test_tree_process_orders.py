@@ -0,0 +1,87 @@
+import pytest
+
+from ...process_orders import process_orders
+from ..tree_order_book import TreeOrderBook
+
+ORDERS = [
+    "1|first|a|ZZZZ|B|1.5|10",
+    "2|second|a|ZZZZ|S|2.5|20",
+    "3|first|u|15",
+    "4|second|c",
+    "5|first|a|YYYY|B|1.5|10",
+    "6|unknown|c",
+    "7|unknown|u|1",
+    "8|#bad|c",
+    "garbage",
+]
+
+
+def test_summary_should_count_applied_rejected_and_errors_by_kind(
+    tree_order_book: TreeOrderBook,
+):
+    summary = process_orders(order_book=tree_order_book, orders=ORDERS)
+
+    assert summary.applied == 4
+    assert summary.rejected == 2
+    assert summary.errors == {
+        "DuplicatedOrderIdError": 1,
+        "OrderDoesNotExistError": 2,
+    }
+    assert summary.processed == len(ORDERS)
+
+
+def test_batch_should_leave_book_in_same_state_as_single_calls(
+    tree_order_book: TreeOrderBook,
+):
+    process_orders(order_book=tree_order_book, orders=ORDERS)
+
+    tree_root = tree_order_book.orders["ZZZZ"]["bids"].root
+    assert tree_root is not None
+    assert tree_root.orders["first"].size == 15
+    assert tree_order_book.orders["ZZZZ"]["asks"].root is None
+    assert tree_order_book.get_best_bid(ticker="ZZZZ") == pytest.approx(1.5)
+
+
+def test_should_consume_text_file(tree_order_book: TreeOrderBook, tmp_path):
+    order_log = tmp_path / "orders.log"
+    order_log.write_text("\n".join(ORDERS) + "\n")
+
+    with open(order_log, encoding="utf-8") as orders:
+        summary = process_orders(order_book=tree_order_book, orders=orders)
+
+    assert summary.applied == 4
+    assert summary.rejected == 2
+
+
+def test_should_consume_binary_file(tree_order_book: TreeOrderBook, tmp_path):
+    order_log = tmp_path / "orders.log"
+    order_log.write_bytes("\r\n".join(ORDERS).encode())
+
+    with open(order_log, "rb") as orders:
+        summary = process_orders(order_book=tree_order_book, orders=orders)
+
+    assert summary.applied == 4
+    assert summary.rejected == 2
+    assert tree_order_book.get_best_bid(ticker="YYYY") == pytest.approx(0)
+
+
+def test_corrupt_lines_should_be_rejected_without_stopping_batch(
+    tree_order_book: TreeOrderBook,
+):
+    orders = [
+        b"1|first|a|ZZZZ|B|1.5|10\n",
+        b"2|second|a|ZZZZ|B|\xff\xfe|10\n",
+        b"3|third|a|ZZZZ|B|abc|10\n",
+        b"4|fourth|a|ZZZZ|B|inf|10\n",
+        b"5|fifth|a|ZZZZ|B|nan|10\n",
+        "\u00b2|seventh|a|ZZZZ|B|1.8|10\n".encode(),
+        "7|eighth|a|ZZZZ|B|1.8|\u00b2\n".encode(),
+        "8|first|u|\u00b2\n".encode(),
+        b"6|sixth|a|ZZZZ|B|1.7|10\n",
+    ]
+
+    summary = process_orders(order_book=tree_order_book, orders=orders)
+
+    assert summary.applied == 2
+    assert summary.rejected == 7
+    assert tree_order_book.get_best_bid(ticker="ZZZZ") == pytest.approx(1.7)
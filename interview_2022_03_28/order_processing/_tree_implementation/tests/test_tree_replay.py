@@ -0,0 +1,51 @@
+import pytest
+
+from ...replay import replay_order_log
+from ..tree_order_storage import TreeOrderStorage
+
+
+def test_replay_should_apply_all_orders_from_log(tmp_path):
+    order_log = tmp_path / "orders.log"
+    order_log.write_text("1|a1|a|ZZZZ|B|1.5|10\n2|a2|a|ZZZZ|S|2.5|20\n3|a1|c\n")
+    storage = TreeOrderStorage()
+
+    report = replay_order_log(storage=storage, path=str(order_log))
+
+    assert report.summary.applied == 3
+    assert storage.get_price_view().get_best_bid(ticker="ZZZZ") == pytest.approx(0)
+    assert storage.get_price_view().get_best_ask(ticker="ZZZZ") == pytest.approx(2.5)
+
+
+def test_replay_should_report_throughput(tmp_path):
+    order_log = tmp_path / "orders.log"
+    order_log.write_text("1|a1|a|ZZZZ|B|1.5|10\n2|#bad|c\n")
+
+    report = replay_order_log(storage=TreeOrderStorage(), path=str(order_log))
+
+    assert report.summary.processed == 2
+    assert report.messages_per_second > 0
+
+
+def test_replay_of_empty_log_should_not_process_anything(tmp_path):
+    order_log = tmp_path / "orders.log"
+    order_log.write_bytes(b"")
+
+    report = replay_order_log(storage=TreeOrderStorage(), path=str(order_log))
+
+    assert report.summary.processed == 0
+    assert report.messages_per_second == 0
+
+
+def test_replay_should_skip_corrupt_records(tmp_path):
+    order_log = tmp_path / "orders.log"
+    order_log.write_bytes(
+        b"1|a1|a|ZZZZ|B|1.5|10\n2|a2|a|ZZZZ|S|\xff|20\n3|a3|a|ZZZZ|S|nan|20\n"
+        b"4|a4|a|ZZZZ|S|2.5|20\n"
+    )
+    storage = TreeOrderStorage()
+
+    report = replay_order_log(storage=storage, path=str(order_log))
+
+    assert report.summary.applied == 2
+    assert report.summary.rejected == 2
+    assert storage.get_price_view().get_best_ask(ticker="ZZZZ") == pytest.approx(2.5)
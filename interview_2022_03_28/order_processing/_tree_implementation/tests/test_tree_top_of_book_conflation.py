@@ -0,0 +1,130 @@
+from typing import List
+
+import pytest
+
+from ...process_order import process_order
+from ...top_of_book_conflation import ConflatedTopOfBookPublisher
+from ...top_of_book_feed import TopOfBook
+from ..tree_order_book import TreeOrderBook
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_updates_within_window_should_be_conflated_to_latest_per_ticker(
+    tree_order_book: TreeOrderBook,
+):
+    events = []
+    publisher = ConflatedTopOfBookPublisher(listener=events.append, max_updates=100)
+    tree_order_book.subscribe(listener=publisher)
+
+    for idx, price in enumerate([10.0, 10.1, 10.2, 10.3]):
+        process_order(order_book=tree_order_book, order=f"1|a{idx}|a|AAA|B|{price}|1")
+    process_order(order_book=tree_order_book, order="1|b0|a|BBB|S|5.0|1")
+    process_order(order_book=tree_order_book, order="1|b1|a|BBB|S|4.0|1")
+
+    assert events == []
+    assert publisher.num_of_pending == 2
+    assert publisher.flush() == 2
+    assert events == [
+        TopOfBook(ticker="AAA", best_bid=pytest.approx(10.3), best_ask=0.0),
+        TopOfBook(ticker="BBB", best_bid=0.0, best_ask=pytest.approx(4.0)),
+    ]
+
+
+def test_window_should_close_after_max_updates(tree_order_book: TreeOrderBook):
+    events = []
+    publisher = ConflatedTopOfBookPublisher(listener=events.append, max_updates=3)
+    tree_order_book.subscribe(listener=publisher)
+
+    for idx in range(7):
+        process_order(
+            order_book=tree_order_book, order=f"1|a{idx}|a|AAA|B|{10 + idx}|1"
+        )
+
+    assert [event.best_bid for event in events] == pytest.approx([12.0, 15.0])
+    assert publisher.num_of_pending == 1
+
+
+def test_window_should_close_after_max_delay(tree_order_book: TreeOrderBook):
+    events = []
+    clock = FakeClock()
+    publisher = ConflatedTopOfBookPublisher(
+        listener=events.append, max_delay_seconds=0.5, clock=clock
+    )
+    tree_order_book.subscribe(listener=publisher)
+
+    process_order(order_book=tree_order_book, order="1|a0|a|AAA|B|10.0|1")
+    clock.now = 0.4
+    process_order(order_book=tree_order_book, order="1|a1|a|AAA|B|10.1|1")
+    assert events == []
+
+    clock.now = 0.5
+    process_order(order_book=tree_order_book, order="1|a2|a|AAA|B|10.2|1")
+    assert [event.best_bid for event in events] == pytest.approx([10.2])
+
+
+def test_ticker_returning_to_published_state_should_not_be_republished(
+    tree_order_book: TreeOrderBook,
+):
+    events = []
+    publisher = ConflatedTopOfBookPublisher(listener=events.append)
+    tree_order_book.subscribe(listener=publisher)
+
+    process_order(order_book=tree_order_book, order="1|a0|a|AAA|B|10.0|1")
+    publisher.flush()
+    process_order(order_book=tree_order_book, order="2|a1|a|AAA|B|10.5|1")
+    process_order(order_book=tree_order_book, order="3|a1|c")
+    process_order(order_book=tree_order_book, order="4|b0|a|BBB|S|1.0|1")
+    process_order(order_book=tree_order_book, order="5|b0|c")
+
+    assert publisher.flush() == 0
+    assert len(events) == 1
+
+    process_order(order_book=tree_order_book, order="6|a0|c")
+
+    assert publisher.flush() == 1
+    assert events[-1] == TopOfBook(ticker="AAA", best_bid=0.0, best_ask=0.0)
+
+
+def test_poll_should_publish_quiet_ticker_once_window_expires(
+    tree_order_book: TreeOrderBook,
+):
+    events: List[TopOfBook] = []
+    clock = FakeClock()
+    publisher = ConflatedTopOfBookPublisher(
+        listener=events.append, max_delay_seconds=0.5, clock=clock
+    )
+    tree_order_book.subscribe(listener=publisher)
+    assert publisher.deadline is None
+
+    clock.now = 1.0
+    process_order(order_book=tree_order_book, order="1|a0|a|AAA|B|10.0|1")
+    assert publisher.deadline == pytest.approx(1.5)
+
+    clock.now = 1.4
+    assert publisher.poll() == 0
+    assert events == []
+
+    clock.now = 1.5
+    assert publisher.poll() == 1
+    assert [event.best_bid for event in events] == pytest.approx([10.0])
+    assert publisher.deadline is None
+    assert publisher.poll() == 0
+
+
+def test_poll_without_time_window_should_not_publish(tree_order_book: TreeOrderBook):
+    events: List[TopOfBook] = []
+    publisher = ConflatedTopOfBookPublisher(listener=events.append, max_updates=10)
+    tree_order_book.subscribe(listener=publisher)
+
+    process_order(order_book=tree_order_book, order="1|a0|a|AAA|B|10.0|1")
+
+    assert publisher.poll() == 0
+    assert publisher.deadline is None
+    assert publisher.num_of_pending == 1
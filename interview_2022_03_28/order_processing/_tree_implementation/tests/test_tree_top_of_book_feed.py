@@ -0,0 +1,100 @@
+import queue
+
+import pytest
+
+from ...process_order import process_order
+from ...top_of_book_feed import TopOfBook, TopOfBookFeed
+from ..tree_order_book import TreeOrderBook
+from ..tree_order_storage_factory import create_tree_order_storage
+
+
+def subscribe_list(tree_order_book: TopOfBookFeed) -> list:
+    events = []
+    tree_order_book.subscribe(listener=events.append)
+    return events
+
+
+def test_adding_order_at_new_best_price_should_publish_top_of_book(
+    tree_order_book: TreeOrderBook,
+):
+    events = subscribe_list(tree_order_book=tree_order_book)
+
+    process_order(order_book=tree_order_book, order="1|b1|a|TICK|B|10.1|5")
+    process_order(order_book=tree_order_book, order="1|s1|a|TICK|S|10.5|5")
+
+    assert events == [
+        TopOfBook(ticker="TICK", best_bid=pytest.approx(10.1), best_ask=0.0),
+        TopOfBook(
+            ticker="TICK", best_bid=pytest.approx(10.1), best_ask=pytest.approx(10.5)
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "order",
+    [
+        "2|b2|a|TICK|B|10.0|5",
+        "2|b3|a|TICK|B|10.1|5",
+        "2|s2|a|TICK|S|10.6|5",
+        "2|b1|u|100",
+        "2|missing|c",
+        "2|b1|a|TICK|B|10.3|5",
+        "2|z42|a|TICK|B|10.3|0",
+    ],
+)
+def test_order_not_changing_best_prices_should_not_publish(
+    tree_order_book: TreeOrderBook, order: str
+):
+    process_order(order_book=tree_order_book, order="1|b1|a|TICK|B|10.1|5")
+    process_order(order_book=tree_order_book, order="1|s1|a|TICK|S|10.5|5")
+    events = subscribe_list(tree_order_book=tree_order_book)
+
+    process_order(order_book=tree_order_book, order=order)
+
+    assert events == []
+
+
+def test_cancelling_best_orders_should_publish_next_best_prices(
+    tree_order_book: TreeOrderBook,
+):
+    process_order(order_book=tree_order_book, order="1|b1|a|TICK|B|10.1|5")
+    process_order(order_book=tree_order_book, order="1|b2|a|TICK|B|9.9|5")
+    process_order(order_book=tree_order_book, order="1|s1|a|TICK|S|10.5|5")
+    top_of_book_queue = queue.Queue()
+    tree_order_book.subscribe(listener=top_of_book_queue.put)
+
+    process_order(order_book=tree_order_book, order="2|b1|c")
+    process_order(order_book=tree_order_book, order="2|s1|c")
+    process_order(order_book=tree_order_book, order="2|b2|c")
+
+    assert [top_of_book_queue.get_nowait() for _ in range(3)] == [
+        TopOfBook(
+            ticker="TICK", best_bid=pytest.approx(9.9), best_ask=pytest.approx(10.5)
+        ),
+        TopOfBook(ticker="TICK", best_bid=pytest.approx(9.9), best_ask=0.0),
+        TopOfBook(ticker="TICK", best_bid=0.0, best_ask=0.0),
+    ]
+    assert top_of_book_queue.empty()
+
+
+def test_unsubscribed_listener_should_not_be_called(tree_order_book: TreeOrderBook):
+    events = subscribe_list(tree_order_book=tree_order_book)
+    other_events = subscribe_list(tree_order_book=tree_order_book)
+
+    tree_order_book.unsubscribe(listener=events.append)
+    process_order(order_book=tree_order_book, order="1|b1|a|TICK|B|10.1|5")
+
+    assert events == []
+    assert len(other_events) == 1
+
+
+def test_storage_should_expose_tree_as_top_of_book_feed():
+    storage = create_tree_order_storage()
+    events = subscribe_list(tree_order_book=storage.get_top_of_book_feed())
+
+    process_order(order_book=storage.get_processor(), order="1|b1|a|TICK|B|10.1|5")
+    storage.close()
+
+    assert events == [
+        TopOfBook(ticker="TICK", best_bid=pytest.approx(10.1), best_ask=0.0)
+    ]
@@ -1,9 +1,16 @@
-from typing import Dict
-
-from ..best_bid_and_ask_view import BestBidAndAskView
+import itertools
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from ..depth_view import DepthView, MarketDepth, PriceLevel
+from ..memory_stats import MemoryStats
 from ..order import Order, OrderType
 from ..order_book import OrderBookError, OrderBookProcessor
-from .red_black_tree import RedBlackTree
+from ..prices import ticks_to_price
+from ..top_of_book_feed import TopOfBook, TopOfBookFeed, TopOfBookListener
+from .red_black_tree import RedBlackNode, RedBlackTree
 
 
 class OrderDoesNotExistError(OrderBookError):
@@ -21,10 +28,11 @@ class DuplicatedOrderIdError(OrderBookError):
 TickerOrders = Dict[str, Dict[str, RedBlackTree]]
 
 
-class TreeOrderBook(OrderBookProcessor, BestBidAndAskView):
+class TreeOrderBook(OrderBookProcessor, BestBidAndAskView, DepthView, TopOfBookFeed):
     def __init__(self) -> None:
         self.__orders: TickerOrders = {}
-        self.__ids_to_orders: Dict[str, Order] = {}
+        self.__ids_to_levels: Dict[str, RedBlackNode] = {}
+        self.__listeners: List[TopOfBookListener] = []
 
     def add_order(self, order: Order) -> None:
         if order.size == 0:
@@ -32,55 +40,175 @@ class TreeOrderBook(OrderBookProcessor, BestBidAndAskView):
                 f"Cannot add order with id: {order.order_id} due to size being 0."
             )
 
-        if order.order_id in self.__ids_to_orders:
+        if order.order_id in self.__ids_to_levels:
             raise DuplicatedOrderIdError(
                 f"Cannot add order with id: {order.order_id} to book."
             )
 
+        previous_top = (
+            self.__get_top_of_book(ticker=order.ticker) if self.__listeners else None
+        )
+
         if order.ticker not in self.__orders:
             self.__orders[order.ticker] = {}
             self.__orders[order.ticker]["asks"] = RedBlackTree()
             self.__orders[order.ticker]["bids"] = RedBlackTree()
 
         container_name = _container_from_order_type(order_type=order.order_type)
-        self.__orders[order.ticker][container_name].insert(order=order)
-        self.__ids_to_orders[order.order_id] = order
+        tree = self.__orders[order.ticker][container_name]
+        self.__ids_to_levels[order.order_id] = tree.insert(order=order)
+
+        if previous_top is not None:
+            self.__publish_if_changed(ticker=order.ticker, previous_top=previous_top)
 
     def update(self, order_id: str, size: int) -> None:
-        if order_id not in self.__ids_to_orders:
+        if order_id not in self.__ids_to_levels:
             raise OrderDoesNotExistError(
                 f"Cannot update non existing order: {order_id}"
             )
 
-        order = self.__ids_to_orders[order_id]
-        order.size = size
-        container_name = _container_from_order_type(order_type=order.order_type)
-        self.__orders[order.ticker][container_name].update(order=order)
+        self.__ids_to_levels[order_id].update_order(order_id=order_id, size=size)
 
     def cancel(self, order_id: str) -> None:
-        if order_id not in self.__ids_to_orders:
+        if order_id not in self.__ids_to_levels:
             raise OrderDoesNotExistError(
                 f"Cannot cancel non existing order: {order_id}"
             )
 
-        order = self.__ids_to_orders[order_id]
+        level = self.__ids_to_levels.pop(order_id)
+        order = level.orders[order_id]
+        previous_top = (
+            self.__get_top_of_book(ticker=order.ticker) if self.__listeners else None
+        )
+        ticker_orders = self.__orders[order.ticker]
         container_name = _container_from_order_type(order_type=order.order_type)
-        self.__orders[order.ticker][container_name].delete(order=order)
+        ticker_orders[container_name].remove_order(level=level, order_id=order_id)
+
+        if not ticker_orders["asks"] and not ticker_orders["bids"]:
+            del self.__orders[order.ticker]
+
+        if previous_top is not None:
+            self.__publish_if_changed(ticker=order.ticker, previous_top=previous_top)
 
     def get_best_ask(self, ticker: str) -> float:
         if ticker not in self.__orders:
             return 0.0
-        return self.__orders[ticker]["asks"].get_minimum()
+        return ticks_to_price(price_ticks=self.__orders[ticker]["asks"].get_minimum())
 
     def get_best_bid(self, ticker: str) -> float:
         if ticker not in self.__orders:
             return 0.0
-        return self.__orders[ticker]["bids"].get_maximum()
+        return ticks_to_price(price_ticks=self.__orders[ticker]["bids"].get_maximum())
+
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        if tickers is None:
+            tickers = list(self.__orders)
+
+        bids = array("d")
+        asks = array("d")
+        for ticker in tickers:
+            ticker_orders = self.__orders.get(ticker)
+            if ticker_orders is None:
+                bids.append(0.0)
+                asks.append(0.0)
+            else:
+                bids.append(
+                    ticks_to_price(price_ticks=ticker_orders["bids"].get_maximum())
+                )
+                asks.append(
+                    ticks_to_price(price_ticks=ticker_orders["asks"].get_minimum())
+                )
+
+        return BestBidsAndAsks(tickers=list(tickers), bids=bids, asks=asks)
+
+    def get_depth(self, ticker: str, levels: int) -> MarketDepth:
+        if ticker not in self.__orders:
+            return MarketDepth(bids=[], asks=[])
+
+        return MarketDepth(
+            bids=_top_levels(
+                tree=self.__orders[ticker]["bids"], levels=levels, descending=True
+            ),
+            asks=_top_levels(
+                tree=self.__orders[ticker]["asks"], levels=levels, descending=False
+            ),
+        )
+
+    def memory_stats(self) -> MemoryStats:
+        stats = MemoryStats(
+            live_orders=len(self.__ids_to_levels), tickers=len(self.__orders)
+        )
+
+        for ticker, ticker_orders in self.__orders.items():
+            ticker_bytes = sys.getsizeof(ticker_orders)
+            for tree in ticker_orders.values():
+                stats.price_levels += len(tree)
+                ticker_bytes += _approximate_tree_size(tree=tree)
+            stats.approximate_bytes_per_ticker[ticker] = ticker_bytes
+
+        return stats
+
+    def subscribe(self, listener: TopOfBookListener) -> None:
+        self.__listeners.append(listener)
+
+    def unsubscribe(self, listener: TopOfBookListener) -> None:
+        self.__listeners.remove(listener)
 
     @property
     def orders(self) -> TickerOrders:
         return self.__orders
 
+    def __get_top_of_book(self, ticker: str) -> Tuple[int, int]:
+        if ticker not in self.__orders:
+            return 0, 0
+
+        ticker_orders = self.__orders[ticker]
+        return ticker_orders["bids"].get_maximum(), ticker_orders["asks"].get_minimum()
+
+    def __publish_if_changed(self, ticker: str, previous_top: Tuple[int, int]) -> None:
+        best_bid, best_ask = self.__get_top_of_book(ticker=ticker)
+        if (best_bid, best_ask) == previous_top:
+            return
+
+        top_of_book = TopOfBook(
+            ticker=ticker,
+            best_bid=ticks_to_price(price_ticks=best_bid),
+            best_ask=ticks_to_price(price_ticks=best_ask),
+        )
+        for listener in list(self.__listeners):
+            listener(top_of_book)
+
+
+def _top_levels(tree: RedBlackTree, levels: int, descending: bool) -> List[PriceLevel]:
+    return [
+        PriceLevel(
+            price=ticks_to_price(price_ticks=level.price_ticks),
+            size=level.total_size,
+            num_of_orders=len(level.orders),
+        )
+        for level in itertools.islice(tree.levels(descending=descending), levels)
+    ]
+
+
+def _approximate_tree_size(tree: RedBlackTree) -> int:
+    tree_size = _approximate_object_size(obj=tree)
+    for level in tree.levels():
+        tree_size += _approximate_object_size(obj=level)
+        tree_size += sys.getsizeof(level.orders)
+        for order_id, order in level.orders.items():
+            tree_size += sys.getsizeof(order_id) + _approximate_object_size(obj=order)
+
+    return tree_size
+
+
+def _approximate_object_size(obj: object) -> int:
+    object_size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        object_size += sys.getsizeof(obj.__dict__)
+    return object_size
+
 
 def _container_from_order_type(order_type: OrderType) -> str:
     return "asks" if order_type == OrderType.ASK else "bids"
@@ -1,15 +1,29 @@
+from typing import Optional
+
 from ..best_bid_and_ask_view import BestBidAndAskView
 from ..order_book import OrderBookProcessor
 from ..order_storage import OrderStorage
+from ..top_of_book_feed import TopOfBookFeed
+from ..top_of_book_snapshot import TopOfBookSnapshot
 from .tree_order_book import TreeOrderBook
 
 
 class TreeOrderStorage(OrderStorage):
-    def __init__(self) -> None:
+    def __init__(self, concurrent: bool = False) -> None:
         self.__order_book = TreeOrderBook()
+        self.__snapshot: Optional[TopOfBookSnapshot] = None
+
+        if concurrent:
+            self.__snapshot = TopOfBookSnapshot()
+            self.__order_book.subscribe(listener=self.__snapshot)
 
     def get_processor(self) -> OrderBookProcessor:
         return self.__order_book
 
     def get_price_view(self) -> BestBidAndAskView:
+        if self.__snapshot is None:
+            return self.__order_book
+        return self.__snapshot
+
+    def get_top_of_book_feed(self) -> TopOfBookFeed:
         return self.__order_book
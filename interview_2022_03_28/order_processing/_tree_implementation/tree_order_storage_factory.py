@@ -1,6 +1,5 @@
-from ..order_storage import OrderStorage
 from .tree_order_storage import TreeOrderStorage
 
 
-def create_tree_order_storage() -> OrderStorage:
-    return TreeOrderStorage()
+def create_tree_order_storage(concurrent: bool = False) -> TreeOrderStorage:
+    return TreeOrderStorage(concurrent=concurrent)
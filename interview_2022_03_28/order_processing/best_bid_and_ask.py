@@ -1,6 +1,6 @@
-from typing import Dict
+from typing import Dict, Optional, Sequence
 
-from .best_bid_and_ask_view import BestBidAndAskView
+from .best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
 
 
 def get_best_bid_and_ask(
@@ -10,3 +10,9 @@ def get_best_bid_and_ask(
         "best_ask": order_book.get_best_ask(ticker=ticker),
         "best_bid": order_book.get_best_bid(ticker=ticker),
     }
+
+
+def get_best_bids_and_asks(
+    order_book: BestBidAndAskView, tickers: Optional[Sequence[str]] = None
+) -> BestBidsAndAsks:
+    return order_book.get_best_bids_and_asks(tickers=tickers)
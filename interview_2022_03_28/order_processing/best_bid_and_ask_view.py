@@ -1,4 +1,12 @@
 from abc import ABC, abstractmethod
+from array import array
+from typing import List, NamedTuple, Optional, Sequence
+
+
+class BestBidsAndAsks(NamedTuple):
+    tickers: List[str]
+    bids: array
+    asks: array
 
 
 class BestBidAndAskView(ABC):
@@ -9,3 +17,9 @@ class BestBidAndAskView(ABC):
     @abstractmethod
     def get_best_bid(self, ticker: str) -> float:
         pass
+
+    @abstractmethod
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple
+
+
+class PriceLevel(NamedTuple):
+    price: float
+    size: int
+    num_of_orders: int
+
+
+class MarketDepth(NamedTuple):
+    bids: List[PriceLevel]
+    asks: List[PriceLevel]
+
+
+class DepthView(ABC):
+    @abstractmethod
+    def get_depth(self, ticker: str, levels: int) -> MarketDepth:
+        pass
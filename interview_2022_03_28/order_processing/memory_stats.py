@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class MemoryStats:
+    live_orders: int = 0
+    price_levels: int = 0
+    tickers: int = 0
+    approximate_bytes_per_ticker: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def approximate_bytes(self) -> int:
+        return sum(self.approximate_bytes_per_ticker.values())
@@ -10,9 +10,11 @@ class OrderType(Enum):
 
 @dataclass
 class Order:
+    __slots__ = ("order_id", "timestamp", "ticker", "price_ticks", "size", "order_type")
+
     order_id: str
-    timestamp: str
+    timestamp: int
     ticker: str
-    price: float
+    price_ticks: int
     size: int
     order_type: OrderType
@@ -0,0 +1,24 @@
+from typing import Dict
+
+from .order import Order
+
+
+class OrderLevel:
+    __slots__ = ("price_ticks", "orders", "total_size")
+
+    def __init__(self, price_ticks: int) -> None:
+        self.price_ticks = price_ticks
+        self.orders: Dict[str, Order] = {}
+        self.total_size = 0
+
+    def add_order(self, order: Order) -> None:
+        self.orders[order.order_id] = order
+        self.total_size += order.size
+
+    def update_order(self, order_id: str, size: int) -> None:
+        order = self.orders[order_id]
+        self.total_size += size - order.size
+        order.size = size
+
+    def remove_order(self, order_id: str) -> None:
+        self.total_size -= self.orders.pop(order_id).size
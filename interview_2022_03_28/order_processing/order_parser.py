@@ -0,0 +1,93 @@
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+from . import validators
+from .order import Order, OrderType
+from .order_book import OrderBookProcessor
+from .prices import price_to_ticks
+
+
+@dataclass
+class AddOrderMessage:
+    order: Order
+
+    def apply(self, order_book: OrderBookProcessor) -> None:
+        order_book.add_order(order=self.order)
+
+
+@dataclass
+class UpdateOrderMessage:
+    order_id: str
+    size: int
+
+    def apply(self, order_book: OrderBookProcessor) -> None:
+        order_book.update(order_id=self.order_id, size=self.size)
+
+
+@dataclass
+class CancelOrderMessage:
+    order_id: str
+
+    def apply(self, order_book: OrderBookProcessor) -> None:
+        order_book.cancel(order_id=self.order_id)
+
+
+OrderMessage = Union[AddOrderMessage, UpdateOrderMessage, CancelOrderMessage]
+
+
+class _ParsePlan(NamedTuple):
+    validator: validators.OrderValidator
+    build_message: Callable[[List[str]], OrderMessage]
+
+
+def _build_cancel_message(fields: List[str]) -> CancelOrderMessage:
+    return CancelOrderMessage(order_id=fields[1])
+
+
+def _build_update_message(fields: List[str]) -> UpdateOrderMessage:
+    return UpdateOrderMessage(order_id=fields[1], size=int(fields[3]))
+
+
+def _build_add_message(fields: List[str]) -> AddOrderMessage:
+    return AddOrderMessage(
+        order=Order(
+            order_id=fields[1],
+            timestamp=int(fields[0]),
+            ticker=sys.intern(fields[3]),
+            price_ticks=price_to_ticks(price=float(fields[5])),
+            size=int(fields[6]),
+            order_type=OrderType.BID if fields[4] == "B" else OrderType.ASK,
+        )
+    )
+
+
+_ACTION_VALIDATOR = validators.create_action_validator()
+
+_PARSE_PLANS: Dict[str, _ParsePlan] = {
+    "c": _ParsePlan(
+        validator=validators.create_cancel_validator(),
+        build_message=_build_cancel_message,
+    ),
+    "u": _ParsePlan(
+        validator=validators.create_update_validator(),
+        build_message=_build_update_message,
+    ),
+    "a": _ParsePlan(
+        validator=validators.create_add_validator(),
+        build_message=_build_add_message,
+    ),
+}
+
+
+def parse_order(order: str) -> Optional[OrderMessage]:
+    fields = order.split("|")
+
+    if not _ACTION_VALIDATOR.is_valid(fields=fields):
+        return None
+
+    plan = _PARSE_PLANS[fields[2]]
+    if not plan.validator.is_valid(fields=fields):
+        return None
+
+    return plan.build_message(fields)
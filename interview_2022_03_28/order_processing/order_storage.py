@@ -12,3 +12,6 @@ class OrderStorage(ABC):
     @abstractmethod
     def get_price_view(self) -> BestBidAndAskView:
         pass
+
+    def close(self) -> None:
+        pass
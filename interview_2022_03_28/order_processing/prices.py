@@ -0,0 +1,19 @@
+import math
+
+PRICE_DIGITS = 5
+PRICE_SCALE = 10**PRICE_DIGITS
+
+
+class InvalidPriceError(Exception):
+    pass
+
+
+def price_to_ticks(price: float) -> int:
+    scaled_price = price * PRICE_SCALE
+    if not math.isfinite(scaled_price):
+        raise InvalidPriceError(f"Cannot convert price: {price} to ticks.")
+    return round(scaled_price)
+
+
+def ticks_to_price(price_ticks: int) -> float:
+    return price_ticks / PRICE_SCALE
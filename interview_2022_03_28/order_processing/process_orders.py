@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Union
+
+from interview_2022_03_28.utility import log_err
+
+from .order_book import OrderBookError, OrderBookProcessor
+from .order_parser import parse_order
+
+
+@dataclass
+class ProcessingSummary:
+    applied: int = 0
+    rejected: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def processed(self) -> int:
+        return self.applied + self.rejected + sum(self.errors.values())
+
+    def add(self, other: "ProcessingSummary") -> None:
+        self.applied += other.applied
+        self.rejected += other.rejected
+        for kind, count in other.errors.items():
+            self.errors[kind] = self.errors.get(kind, 0) + count
+
+
+class OrderLineProcessor(ABC):
+    @abstractmethod
+    def process_order_lines(
+        self, orders: Iterable[Union[str, bytes]]
+    ) -> ProcessingSummary:
+        pass
+
+
+def process_orders(
+    order_book: OrderBookProcessor, orders: Iterable[Union[str, bytes]]
+) -> ProcessingSummary:
+    if isinstance(order_book, OrderLineProcessor):
+        return order_book.process_order_lines(orders=orders)
+    return parse_and_apply_orders(order_book=order_book, orders=orders)
+
+
+def parse_and_apply_orders(
+    order_book: OrderBookProcessor, orders: Iterable[Union[str, bytes]]
+) -> ProcessingSummary:
+    summary = ProcessingSummary()
+    errors = summary.errors
+    applied = 0
+    rejected = 0
+
+    for order in orders:
+        if isinstance(order, bytes):
+            try:
+                order = order.decode()
+            except UnicodeDecodeError:
+                log_err(f"ERROR: Cannot decode order: {order!r}")
+                rejected += 1
+                continue
+
+        message = parse_order(order=order.rstrip("\r\n"))
+        if message is None:
+            rejected += 1
+            continue
+
+        try:
+            message.apply(order_book=order_book)
+        except OrderBookError as err:
+            log_err("ERROR: " + str(err))
+            kind = type(err).__name__
+            errors[kind] = errors.get(kind, 0) + 1
+        else:
+            applied += 1
+
+    summary.applied = applied
+    summary.rejected = rejected
+    return summary
@@ -0,0 +1,36 @@
+import mmap
+import os
+from dataclasses import dataclass
+from time import perf_counter
+
+from .order_storage import OrderStorage
+from .process_orders import ProcessingSummary, process_orders
+
+
+@dataclass
+class ReplayReport:
+    summary: ProcessingSummary
+    elapsed_seconds: float
+
+    @property
+    def messages_per_second(self) -> float:
+        if self.elapsed_seconds <= 0.0:
+            return 0.0
+        return self.summary.processed / self.elapsed_seconds
+
+
+def replay_order_log(storage: OrderStorage, path: str) -> ReplayReport:
+    processor = storage.get_processor()
+
+    with open(path, "rb") as order_log:
+        if os.fstat(order_log.fileno()).st_size == 0:
+            return ReplayReport(summary=ProcessingSummary(), elapsed_seconds=0.0)
+
+        with mmap.mmap(order_log.fileno(), 0, access=mmap.ACCESS_READ) as mapped_log:
+            start_time = perf_counter()
+            summary = process_orders(
+                order_book=processor, orders=iter(mapped_log.readline, b"")
+            )
+            stop_time = perf_counter()
+
+    return ReplayReport(summary=summary, elapsed_seconds=stop_time - start_time)
@@ -0,0 +1,86 @@
+import time
+from typing import Callable, Dict, Optional
+
+from .top_of_book_feed import TopOfBook, TopOfBookListener
+
+
+class ConflatedTopOfBookPublisher:
+    def __init__(
+        self,
+        listener: TopOfBookListener,
+        max_updates: Optional[int] = None,
+        max_delay_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__listener = listener
+        self.__max_updates = max_updates
+        self.__max_delay_seconds = max_delay_seconds
+        self.__clock = clock
+        self.__pending: Dict[str, TopOfBook] = {}
+        self.__published: Dict[str, TopOfBook] = {}
+        self.__num_of_updates = 0
+        self.__window_start = 0.0
+
+    def __call__(self, top_of_book: TopOfBook) -> None:
+        if self.__num_of_updates == 0:
+            self.__window_start = self.__clock()
+
+        self.__pending[top_of_book.ticker] = top_of_book
+        self.__num_of_updates += 1
+
+        if self.__is_window_closed():
+            self.flush()
+
+    def flush(self) -> int:
+        pending = self.__pending
+        self.__pending = {}
+        self.__num_of_updates = 0
+
+        num_of_published = 0
+        for ticker, top_of_book in pending.items():
+            if (
+                self.__published.get(ticker, _empty_top_of_book(ticker=ticker))
+                == top_of_book
+            ):
+                continue
+
+            if top_of_book == _empty_top_of_book(ticker=ticker):
+                del self.__published[ticker]
+            else:
+                self.__published[ticker] = top_of_book
+
+            self.__listener(top_of_book)
+            num_of_published += 1
+
+        return num_of_published
+
+    def poll(self) -> int:
+        if not self.__pending or not self.__is_window_closed():
+            return 0
+        return self.flush()
+
+    @property
+    def num_of_pending(self) -> int:
+        return len(self.__pending)
+
+    @property
+    def deadline(self) -> Optional[float]:
+        if not self.__pending or self.__max_delay_seconds is None:
+            return None
+        return self.__window_start + self.__max_delay_seconds
+
+    def __is_window_closed(self) -> bool:
+        if (
+            self.__max_updates is not None
+            and self.__num_of_updates >= self.__max_updates
+        ):
+            return True
+
+        return (
+            self.__max_delay_seconds is not None
+            and self.__clock() - self.__window_start >= self.__max_delay_seconds
+        )
+
+
+def _empty_top_of_book(ticker: str) -> TopOfBook:
+    return TopOfBook(ticker=ticker, best_bid=0.0, best_ask=0.0)
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Callable, NamedTuple
+
+
+class TopOfBook(NamedTuple):
+    ticker: str
+    best_bid: float
+    best_ask: float
+
+
+TopOfBookListener = Callable[[TopOfBook], None]
+
+
+class TopOfBookFeed(ABC):
+    @abstractmethod
+    def subscribe(self, listener: TopOfBookListener) -> None:
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, listener: TopOfBookListener) -> None:
+        pass
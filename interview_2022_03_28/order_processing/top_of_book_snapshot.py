@@ -0,0 +1,44 @@
+from array import array
+from typing import Dict, Optional, Sequence
+
+from .best_bid_and_ask_view import BestBidAndAskView, BestBidsAndAsks
+from .top_of_book_feed import TopOfBook
+
+
+class TopOfBookSnapshot(BestBidAndAskView):
+    def __init__(self) -> None:
+        self.__published: Dict[str, TopOfBook] = {}
+
+    def __call__(self, top_of_book: TopOfBook) -> None:
+        if top_of_book.best_bid == 0.0 and top_of_book.best_ask == 0.0:
+            self.__published.pop(top_of_book.ticker, None)
+        else:
+            self.__published[top_of_book.ticker] = top_of_book
+
+    def get_best_ask(self, ticker: str) -> float:
+        top_of_book = self.__published.get(ticker)
+        return 0.0 if top_of_book is None else top_of_book.best_ask
+
+    def get_best_bid(self, ticker: str) -> float:
+        top_of_book = self.__published.get(ticker)
+        return 0.0 if top_of_book is None else top_of_book.best_bid
+
+    def get_best_bids_and_asks(
+        self, tickers: Optional[Sequence[str]] = None
+    ) -> BestBidsAndAsks:
+        published = self.__published.copy()
+        if tickers is None:
+            tickers = list(published)
+
+        bids = array("d")
+        asks = array("d")
+        for ticker in tickers:
+            top_of_book = published.get(ticker)
+            if top_of_book is None:
+                bids.append(0.0)
+                asks.append(0.0)
+            else:
+                bids.append(top_of_book.best_bid)
+                asks.append(top_of_book.best_ask)
+
+        return BestBidsAndAsks(tickers=list(tickers), bids=bids, asks=asks)
@@ -1,12 +1,15 @@
+import math
 import re
+from typing import List
 
 from interview_2022_03_28.utility import AbstractSingletonMeta, log_err
 
+from ..prices import PRICE_SCALE
 from .order_validator import OrderValidator
 
 
 class NullOrderValidator(OrderValidator, metaclass=AbstractSingletonMeta):
-    def is_valid(self, order: str) -> bool:
+    def is_valid(self, fields: List[str]) -> bool:
         return True
 
     def set_next(self, validator: OrderValidator) -> OrderValidator:
@@ -31,40 +34,38 @@ class NumOfOrderFieldsValidator(BaseOrderValidator):
             "ERROR: Order should have at least {} fields, received: {}"
         )
 
-    def is_valid(self, order: str) -> bool:
-        split_order = order.split("|")
-
-        if len(split_order) < self.__required_fields:
-            log_err(self.__error_to_format.format(self.__required_fields, order))
+    def is_valid(self, fields: List[str]) -> bool:
+        if len(fields) < self.__required_fields:
+            log_err(
+                self.__error_to_format.format(self.__required_fields, "|".join(fields))
+            )
             return False
 
-        return self._next.is_valid(order=order)
+        return self._next.is_valid(fields=fields)
 
 
 class ActionValidator(BaseOrderValidator):
-    def is_valid(self, order: str) -> bool:
-        split_order = order.split("|")
-        action = split_order[2]
+    def is_valid(self, fields: List[str]) -> bool:
+        action = fields[2]
 
         if action not in ("a", "u", "c"):
             log_err(f"ERROR: Cannot process order, unknown action: {action}")
             return False
 
-        return self._next.is_valid(order=order)
+        return self._next.is_valid(fields=fields)
 
 
 class TimestampValidator(BaseOrderValidator):
-    def is_valid(self, order: str) -> bool:
-        split_order = order.split("|")
-        timestamp = split_order[0]
+    def is_valid(self, fields: List[str]) -> bool:
+        timestamp = fields[0]
 
-        if not timestamp.isdigit():
+        if not timestamp.isdecimal():
             log_err(
                 f"ERROR: Timestamp should be a unit unixstamp, received: {timestamp}"
             )
             return False
 
-        return self._next.is_valid(order=order)
+        return self._next.is_valid(fields=fields)
 
 
 class OrderIdValidator(BaseOrderValidator):
@@ -72,15 +73,14 @@ class OrderIdValidator(BaseOrderValidator):
         BaseOrderValidator.__init__(self)
         self.__order_id_regex = re.compile("^[a-zA-Z0-9]+$")
 
-    def is_valid(self, order: str) -> bool:
-        split_order = order.split("|")
-        order_id = split_order[1]
+    def is_valid(self, fields: List[str]) -> bool:
+        order_id = fields[1]
 
         if not self.__order_id_regex.match(order_id):
             log_err(f"ERROR: Format of order id is incorrect, received: {order_id}")
             return False
 
-        return self._next.is_valid(order=order)
+        return self._next.is_valid(fields=fields)
 
 
 class SizeValidator(BaseOrderValidator):
@@ -88,11 +88,10 @@ class SizeValidator(BaseOrderValidator):
         BaseOrderValidator.__init__(self)
         self.__size_idx = size_idx
 
-    def is_valid(self, order: str) -> bool:
-        split_order = order.split("|")
-        size = split_order[self.__size_idx]
+    def is_valid(self, fields: List[str]) -> bool:
+        size = fields[self.__size_idx]
 
-        if not size.isdigit():
+        if not size.isdecimal():
             log_err(f"ERROR: Size should be a number, received: {size}")
             return False
 
@@ -100,16 +99,36 @@ class SizeValidator(BaseOrderValidator):
             log_err(f"ERROR: Size should be positive, received: {size}")
             return False
 
-        return self._next.is_valid(order=order)
+        return self._next.is_valid(fields=fields)
+
+
+class PriceValidator(BaseOrderValidator):
+    def __init__(self, price_idx: int) -> None:
+        BaseOrderValidator.__init__(self)
+        self.__price_idx = price_idx
+
+    def is_valid(self, fields: List[str]) -> bool:
+        price = fields[self.__price_idx]
+
+        try:
+            price_value = float(price)
+        except ValueError:
+            log_err(f"ERROR: Price should be a number, received: {price}")
+            return False
+
+        if not math.isfinite(price_value * PRICE_SCALE):
+            log_err(f"ERROR: Price should be a finite number, received: {price}")
+            return False
+
+        return self._next.is_valid(fields=fields)
 
 
 class SideValidator(BaseOrderValidator):
-    def is_valid(self, order: str) -> bool:
-        split_order = order.split("|")
-        side = split_order[4]
+    def is_valid(self, fields: List[str]) -> bool:
+        side = fields[4]
 
         if side not in ("B", "S"):
             log_err(f"ERROR: Unknown transaction side: {side}, not processing order!")
             return False
 
-        return self._next.is_valid(order=order)
+        return self._next.is_valid(fields=fields)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class OrderValidator(ABC):
     @abstractmethod
-    def is_valid(self, order: str) -> bool:
+    def is_valid(self, fields: List[str]) -> bool:
         pass
 
     @abstractmethod
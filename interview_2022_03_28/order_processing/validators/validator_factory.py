@@ -2,6 +2,7 @@ from ._concrete_validators import (
     ActionValidator,
     NumOfOrderFieldsValidator,
     OrderIdValidator,
+    PriceValidator,
     SideValidator,
     SizeValidator,
     TimestampValidator,
@@ -42,10 +43,12 @@ def create_add_validator() -> OrderValidator:
     timestamp_validator = TimestampValidator()
     order_id_validator = OrderIdValidator()
     side_validator = SideValidator()
+    price_validator = PriceValidator(price_idx=5)
 
     num_validator.set_next(validator=timestamp_validator)
     timestamp_validator.set_next(validator=order_id_validator)
     order_id_validator.set_next(validator=side_validator)
-    side_validator.set_next(validator=SizeValidator(size_idx=6))
+    side_validator.set_next(validator=price_validator)
+    price_validator.set_next(validator=SizeValidator(size_idx=6))
 
     return num_validator
@@ -0,0 +1,88 @@
+import random
+from time import perf_counter
+from typing import List
+
+from interview_2022_03_28 import order_processing
+from interview_2022_03_28.order_processing.order import Order, OrderType
+from interview_2022_03_28.order_processing.prices import price_to_ticks
+
+from ._helpers import (
+    current_timestamp,
+    format_int,
+    generate_tickers,
+    idx_to_order_id,
+    random_add_size,
+    random_price,
+)
+
+NUM_OF_ORDERS = 1_000_000
+NUM_OF_TICKERS = 2_000
+
+
+def create_orders(num_of_orders: int, num_of_tickers: int) -> List[Order]:
+    tickers = generate_tickers(num_of_tickers=num_of_tickers)
+    timestamp = current_timestamp()
+    return [
+        Order(
+            order_id=idx_to_order_id(idx=idx),
+            timestamp=timestamp,
+            ticker=tickers[idx % num_of_tickers],
+            price_ticks=price_to_ticks(price=random_price()),
+            size=random_add_size(),
+            order_type=random.choice([OrderType.BID, OrderType.ASK]),
+        )
+        for idx in range(num_of_orders)
+    ]
+
+
+def run_columnar_bulk_load_scenario(orders: List[Order]) -> None:
+    tree_storage = order_processing.create_tree_order_storage()
+    tree_order_book = tree_storage.get_processor()
+    start_time = perf_counter()
+    for order in orders:
+        tree_order_book.add_order(order=order)
+    print(f"RedBlackTree - per order adds took {perf_counter() - start_time} seconds")
+
+    order_ids = [order.order_id for order in orders]
+    tickers = [order.ticker for order in orders]
+    price_ticks = [order.price_ticks for order in orders]
+    sizes = [order.size for order in orders]
+    sides = [int(order.order_type == OrderType.ASK) for order in orders]
+    timestamps = [order.timestamp for order in orders]
+    columnar_order_book = order_processing.create_columnar_order_storage(
+        initial_capacity=len(orders)
+    ).get_bulk_loader()
+    start_time = perf_counter()
+    columnar_order_book.load_orders(
+        order_ids=order_ids,
+        tickers=tickers,
+        price_ticks=price_ticks,
+        sizes=sizes,
+        sides=sides,
+        timestamps=timestamps,
+    )
+    print(f"Columnar - bulk load took {perf_counter() - start_time} seconds")
+
+    tree_price_view = tree_storage.get_price_view()
+    start_time = perf_counter()
+    for ticker in sorted(set(tickers)):
+        tree_price_view.get_best_bid(ticker=ticker)
+        tree_price_view.get_best_ask(ticker=ticker)
+    print(
+        f"RedBlackTree - best prices of all tickers took {perf_counter() - start_time} seconds"
+    )
+
+    start_time = perf_counter()
+    columnar_order_book.get_best_prices()
+    print(
+        f"Columnar - best prices of all tickers took {perf_counter() - start_time} seconds"
+    )
+
+
+if __name__ == "__main__":
+    print("Running test: Columnar - bulk load and best prices of all tickers")
+    print(f"Number of orders: {format_int(NUM_OF_ORDERS)}")
+    print(f"Number of tickers: {format_int(NUM_OF_TICKERS)}")
+    run_columnar_bulk_load_scenario(
+        orders=create_orders(num_of_orders=NUM_OF_ORDERS, num_of_tickers=NUM_OF_TICKERS)
+    )
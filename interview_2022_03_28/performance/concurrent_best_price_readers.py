@@ -0,0 +1,41 @@
+import os
+import tempfile
+
+from interview_2022_03_28 import order_processing
+
+from .scenarios.concurrent_readers_scenario import run_concurrent_readers_scenario
+
+NUM_OF_TICKERS = 2_000
+
+if __name__ == "__main__":
+    for num_of_readers in [0, 1, 4]:
+        with tempfile.TemporaryDirectory() as directory:
+            storage = order_processing.create_db_order_storage(
+                database_path=os.path.join(directory, "orders.db"),
+                num_of_readers=max(num_of_readers, 1),
+            )
+            run_concurrent_readers_scenario(
+                test_name="File database with reader pool - concurrent best price readers",
+                storage=storage,
+                num_of_readers=num_of_readers,
+                num_of_additions=100_000,
+                num_of_updates=100_000,
+                num_of_cancels=100_000,
+                num_of_tickers=NUM_OF_TICKERS,
+            )
+            storage.close()
+
+        print("=" * 200)
+
+    for num_of_readers in [0, 1, 4]:
+        run_concurrent_readers_scenario(
+            test_name="RedBlackTree with published snapshot - concurrent best price readers",
+            storage=order_processing.create_tree_order_storage(concurrent=True),
+            num_of_readers=num_of_readers,
+            num_of_additions=100_000,
+            num_of_updates=100_000,
+            num_of_cancels=100_000,
+            num_of_tickers=NUM_OF_TICKERS,
+        )
+
+        print("=" * 200)
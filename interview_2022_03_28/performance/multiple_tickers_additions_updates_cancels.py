@@ -16,6 +16,24 @@ if __name__ == "__main__":
         num_of_tickers=NUM_OF_TICKERS,
     )
 
+    run_modification_procesures_scenario(
+        test_name="Batched database - additions & updates & cancels, multiple tickers",
+        storage=order_processing.create_db_order_storage(batch_size=1_000),
+        num_of_additions=100_000,
+        num_of_updates=100_000,
+        num_of_cancels=100_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    run_modification_procesures_scenario(
+        test_name="Asynchronous database - additions & updates & cancels, multiple tickers",
+        storage=order_processing.create_db_order_storage(asynchronous=True),
+        num_of_additions=100_000,
+        num_of_updates=100_000,
+        num_of_cancels=100_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
     run_modification_procesures_scenario(
         test_name="RedBlackTree - additions & updates & cancels, multiple tickers",
         storage=order_processing.create_tree_order_storage(),
@@ -24,3 +42,30 @@ if __name__ == "__main__":
         num_of_cancels=100_000,
         num_of_tickers=NUM_OF_TICKERS,
     )
+
+    run_modification_procesures_scenario(
+        test_name="Heap - additions & updates & cancels, multiple tickers",
+        storage=order_processing.create_heap_order_storage(),
+        num_of_additions=100_000,
+        num_of_updates=100_000,
+        num_of_cancels=100_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    run_modification_procesures_scenario(
+        test_name="Sorted ladder - additions & updates & cancels, multiple tickers",
+        storage=order_processing.create_ladder_order_storage(),
+        num_of_additions=100_000,
+        num_of_updates=100_000,
+        num_of_cancels=100_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    run_modification_procesures_scenario(
+        test_name="Sharded RedBlackTree - additions & updates & cancels, multiple tickers",
+        storage=order_processing.create_sharded_order_storage(),
+        num_of_additions=100_000,
+        num_of_updates=100_000,
+        num_of_cancels=100_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
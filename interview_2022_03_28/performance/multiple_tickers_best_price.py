@@ -1,6 +1,9 @@
 from interview_2022_03_28 import order_processing
 
-from .scenarios.best_price_api_scenario import run_best_price_api_scenario
+from .scenarios.best_price_api_scenario import (
+    run_best_price_api_scenario,
+    run_bulk_best_price_api_scenario,
+)
 
 NUM_OF_TICKERS = 2_000
 
@@ -9,7 +12,7 @@ if __name__ == "__main__":
         description_suffix="Database",
         storage=order_processing.create_db_order_storage(),
         num_of_additions=100_000,
-        num_of_price_api_calls=100,
+        num_of_price_api_calls=100_000,
         num_of_tickers=NUM_OF_TICKERS,
     )
 
@@ -20,3 +23,43 @@ if __name__ == "__main__":
         num_of_price_api_calls=1_000_000,
         num_of_tickers=NUM_OF_TICKERS,
     )
+
+    run_best_price_api_scenario(
+        description_suffix="Heap",
+        storage=order_processing.create_heap_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_price_api_calls=1_000_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    run_best_price_api_scenario(
+        description_suffix="Sorted ladder",
+        storage=order_processing.create_ladder_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_price_api_calls=1_000_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    run_bulk_best_price_api_scenario(
+        description_suffix="Database",
+        storage=order_processing.create_db_order_storage(),
+        num_of_additions=100_000,
+        num_of_snapshots=100,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    run_bulk_best_price_api_scenario(
+        description_suffix="RedBlackTree",
+        storage=order_processing.create_tree_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_snapshots=500,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    run_bulk_best_price_api_scenario(
+        description_suffix="Columnar",
+        storage=order_processing.create_columnar_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_snapshots=500,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
@@ -0,0 +1,72 @@
+from interview_2022_03_28 import order_processing
+
+from .scenarios.replay_scenario import run_replay_scenario
+
+NUM_OF_TICKERS = 2_000
+
+if __name__ == "__main__":
+    run_replay_scenario(
+        test_name="Database - replay of order log, multiple tickers",
+        storage=order_processing.create_db_order_storage(),
+        num_of_additions=100_000,
+        num_of_updates=100_000,
+        num_of_cancels=100_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
+    run_replay_scenario(
+        test_name="Batched database - replay of order log, multiple tickers",
+        storage=order_processing.create_db_order_storage(batch_size=1_000),
+        num_of_additions=100_000,
+        num_of_updates=100_000,
+        num_of_cancels=100_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
+    run_replay_scenario(
+        test_name="RedBlackTree - replay of order log, multiple tickers",
+        storage=order_processing.create_tree_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_updates=1_000_000,
+        num_of_cancels=1_000_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
+    run_replay_scenario(
+        test_name="Heap - replay of order log, multiple tickers",
+        storage=order_processing.create_heap_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_updates=1_000_000,
+        num_of_cancels=1_000_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
+    run_replay_scenario(
+        test_name="Sorted ladder - replay of order log, multiple tickers",
+        storage=order_processing.create_ladder_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_updates=1_000_000,
+        num_of_cancels=1_000_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
+    sharded_storage = order_processing.create_sharded_order_storage()
+    run_replay_scenario(
+        test_name="Sharded RedBlackTree - replay of order log, multiple tickers",
+        storage=sharded_storage,
+        num_of_additions=1_000_000,
+        num_of_updates=1_000_000,
+        num_of_cancels=1_000_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+    sharded_storage.close()
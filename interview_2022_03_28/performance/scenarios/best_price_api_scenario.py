@@ -45,3 +45,31 @@ def run_best_price_api_scenario(
             order_processing.get_best_bid_and_ask(
                 order_book=order_viewer, ticker=ticker_selector()
             )
+
+
+def run_bulk_best_price_api_scenario(
+    description_suffix: str,
+    storage: order_processing.OrderStorage,
+    num_of_additions: int,
+    num_of_snapshots: int,
+    num_of_tickers: int,
+) -> None:
+    describe_price_test(
+        name=description_suffix + " - bulk best api scenario",
+        price_api_calls=num_of_snapshots * num_of_tickers,
+        orders=num_of_additions,
+        num_of_tickers=num_of_tickers,
+    )
+    order_viewer = storage.get_price_view()
+
+    print("Preparing orders before test")
+    prepare_orders_before_test(
+        processor=storage.get_processor(),
+        ticker_selector=TickerSelector(num_of_tickers=num_of_tickers),
+        num_of_additions=num_of_additions,
+    )
+    print("Orders prepared, starting test")
+
+    with check_perf():
+        for _ in range(num_of_snapshots):
+            order_processing.get_best_bids_and_asks(order_book=order_viewer)
@@ -0,0 +1,95 @@
+import itertools
+import threading
+from time import perf_counter
+from typing import List
+
+from interview_2022_03_28 import order_processing
+
+from .._helpers import (
+    SideSelector,
+    TickerSelector,
+    create_add_order,
+    create_cancel_order,
+    create_update_order,
+    describe_test,
+    format_int,
+    generate_tickers,
+)
+
+
+def create_orders(
+    num_of_additions: int,
+    num_of_updates: int,
+    num_of_cancels: int,
+    num_of_tickers: int,
+) -> List[str]:
+    side_selector = SideSelector()
+    ticker_selector = TickerSelector(num_of_tickers=num_of_tickers)
+    orders = [
+        create_add_order(idx=idx, side=side_selector(), ticker=ticker_selector())
+        for idx in range(num_of_additions)
+    ]
+    orders += [create_update_order(idx=idx) for idx in range(num_of_updates)]
+    orders += [create_cancel_order(idx=idx) for idx in range(num_of_cancels)]
+    return orders
+
+
+def run_concurrent_readers_scenario(
+    test_name: str,
+    storage: order_processing.OrderStorage,
+    num_of_readers: int,
+    num_of_additions: int,
+    num_of_updates: int,
+    num_of_cancels: int,
+    num_of_tickers: int,
+) -> None:
+    describe_test(
+        name=test_name,
+        additions=num_of_additions,
+        updates=num_of_updates,
+        cancels=num_of_cancels,
+        num_of_tickers=num_of_tickers,
+    )
+    print(f"Number of reader threads: {format_int(num_of_readers)}")
+
+    orders = create_orders(
+        num_of_additions=num_of_additions,
+        num_of_updates=num_of_updates,
+        num_of_cancels=num_of_cancels,
+        num_of_tickers=num_of_tickers,
+    )
+    tickers = generate_tickers(num_of_tickers=num_of_tickers)
+    price_view = storage.get_price_view()
+    stop = threading.Event()
+    num_of_reads = [0] * num_of_readers
+
+    def read_prices(reader: int) -> None:
+        for ticker in itertools.cycle(tickers):
+            if stop.is_set():
+                return
+            price_view.get_best_bid(ticker=ticker)
+            price_view.get_best_ask(ticker=ticker)
+            num_of_reads[reader] += 2
+
+    readers = [
+        threading.Thread(target=read_prices, args=(reader,))
+        for reader in range(num_of_readers)
+    ]
+
+    start_time = perf_counter()
+    for reader in readers:
+        reader.start()
+    order_processing.process_orders(order_book=storage.get_processor(), orders=orders)
+    stop.set()
+    for reader in readers:
+        reader.join()
+    stop_time = perf_counter()
+
+    elapsed_seconds = stop_time - start_time
+    print(f"Took {elapsed_seconds} seconds")
+    print(
+        f"Writer throughput: {format_int(int(len(orders) / elapsed_seconds))} messages/s"
+    )
+    print(
+        f"Reader throughput: {format_int(int(sum(num_of_reads) / elapsed_seconds))} best price calls/s"
+    )
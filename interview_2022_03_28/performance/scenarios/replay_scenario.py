@@ -0,0 +1,77 @@
+import os
+import tempfile
+
+from interview_2022_03_28 import order_processing
+
+from .._helpers import (
+    SideSelector,
+    TickerSelector,
+    create_add_order,
+    create_cancel_order,
+    create_update_order,
+    describe_test,
+    format_int,
+)
+
+
+def write_order_log(
+    path: str,
+    num_of_additions: int,
+    num_of_updates: int,
+    num_of_cancels: int,
+    num_of_tickers: int,
+) -> None:
+    side_selector = SideSelector()
+    ticker_selector = TickerSelector(num_of_tickers=num_of_tickers)
+
+    with open(path, "w", encoding="utf-8") as order_log:
+        for idx in range(num_of_additions):
+            order = create_add_order(
+                idx=idx, side=side_selector(), ticker=ticker_selector()
+            )
+            order_log.write(order + "\n")
+
+        for idx in range(num_of_updates):
+            order_log.write(create_update_order(idx=idx) + "\n")
+
+        for idx in range(num_of_cancels):
+            order_log.write(create_cancel_order(idx=idx) + "\n")
+
+
+def run_replay_scenario(
+    test_name: str,
+    storage: order_processing.OrderStorage,
+    num_of_additions: int,
+    num_of_updates: int,
+    num_of_cancels: int,
+    num_of_tickers: int,
+) -> None:
+    describe_test(
+        name=test_name,
+        additions=num_of_additions,
+        updates=num_of_updates,
+        cancels=num_of_cancels,
+        num_of_tickers=num_of_tickers,
+    )
+
+    file_descriptor, path = tempfile.mkstemp(suffix=".log")
+    os.close(file_descriptor)
+
+    try:
+        print("Writing order log before test")
+        write_order_log(
+            path=path,
+            num_of_additions=num_of_additions,
+            num_of_updates=num_of_updates,
+            num_of_cancels=num_of_cancels,
+            num_of_tickers=num_of_tickers,
+        )
+        print("Order log written, starting replay")
+
+        report = order_processing.replay_order_log(storage=storage, path=path)
+    finally:
+        os.remove(path)
+
+    print(f"Replayed {format_int(report.summary.processed)} messages")
+    print(f"Took {report.elapsed_seconds} seconds")
+    print(f"Throughput: {format_int(int(report.messages_per_second))} messages/s")
@@ -19,6 +19,17 @@ if __name__ == "__main__":
 
     print("=" * 200)
 
+    run_modification_procesures_scenario(
+        test_name="Batched database - additions & updates & cancels, single ticker",
+        storage=order_processing.create_db_order_storage(batch_size=1_000),
+        num_of_additions=NUM_OF_OPERATIONS,
+        num_of_updates=NUM_OF_OPERATIONS,
+        num_of_cancels=NUM_OF_OPERATIONS,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
     run_modification_procesures_scenario(
         test_name="RedBlackTree - additions & updates & cancels, single ticker",
         storage=order_processing.create_tree_order_storage(),
@@ -27,3 +38,25 @@ if __name__ == "__main__":
         num_of_cancels=NUM_OF_OPERATIONS,
         num_of_tickers=NUM_OF_TICKERS,
     )
+
+    print("=" * 200)
+
+    run_modification_procesures_scenario(
+        test_name="Heap - additions & updates & cancels, single ticker",
+        storage=order_processing.create_heap_order_storage(),
+        num_of_additions=NUM_OF_OPERATIONS,
+        num_of_updates=NUM_OF_OPERATIONS,
+        num_of_cancels=NUM_OF_OPERATIONS,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
+    run_modification_procesures_scenario(
+        test_name="Sorted ladder - additions & updates & cancels, single ticker",
+        storage=order_processing.create_ladder_order_storage(),
+        num_of_additions=NUM_OF_OPERATIONS,
+        num_of_updates=NUM_OF_OPERATIONS,
+        num_of_cancels=NUM_OF_OPERATIONS,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
@@ -9,7 +9,7 @@ if __name__ == "__main__":
         description_suffix="Database",
         storage=order_processing.create_db_order_storage(),
         num_of_additions=100_000,
-        num_of_price_api_calls=100,
+        num_of_price_api_calls=100_000,
         num_of_tickers=NUM_OF_TICKERS,
     )
 
@@ -22,3 +22,23 @@ if __name__ == "__main__":
         num_of_price_api_calls=1_000_000,
         num_of_tickers=NUM_OF_TICKERS,
     )
+
+    print("=" * 200)
+
+    run_best_price_api_scenario(
+        description_suffix="Heap",
+        storage=order_processing.create_heap_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_price_api_calls=1_000_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
+    run_best_price_api_scenario(
+        description_suffix="Sorted ladder",
+        storage=order_processing.create_ladder_order_storage(),
+        num_of_additions=1_000_000,
+        num_of_price_api_calls=1_000_000,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
@@ -18,6 +18,17 @@ if __name__ == "__main__":
 
     print("=" * 200)
 
+    run_modification_procesures_scenario(
+        test_name="Batched database - only additions, single ticker",
+        storage=order_processing.create_db_order_storage(batch_size=1_000),
+        num_of_additions=200_000,
+        num_of_updates=0,
+        num_of_cancels=0,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
     run_modification_procesures_scenario(
         test_name="RedBlackTree - only additions, single ticker",
         storage=order_processing.create_tree_order_storage(),
@@ -26,3 +37,25 @@ if __name__ == "__main__":
         num_of_cancels=0,
         num_of_tickers=NUM_OF_TICKERS,
     )
+
+    print("=" * 200)
+
+    run_modification_procesures_scenario(
+        test_name="Heap - only additions, single ticker",
+        storage=order_processing.create_heap_order_storage(),
+        num_of_additions=200_000,
+        num_of_updates=0,
+        num_of_cancels=0,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
+
+    print("=" * 200)
+
+    run_modification_procesures_scenario(
+        test_name="Sorted ladder - only additions, single ticker",
+        storage=order_processing.create_ladder_order_storage(),
+        num_of_additions=200_000,
+        num_of_updates=0,
+        num_of_cancels=0,
+        num_of_tickers=NUM_OF_TICKERS,
+    )
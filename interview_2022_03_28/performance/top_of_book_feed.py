@@ -0,0 +1,113 @@
+from time import perf_counter
+from typing import List
+
+from interview_2022_03_28 import order_processing
+
+from ._helpers import (
+    SideSelector,
+    TickerSelector,
+    create_add_order,
+    create_cancel_order,
+    create_update_order,
+    format_int,
+)
+
+NUM_OF_ORDERS = 100_000
+NUM_OF_TICKERS = 2_000
+POLLING_INTERVAL = 100
+CONFLATION_WINDOW = 10_000
+
+
+def create_orders(num_of_orders: int, num_of_tickers: int) -> List[str]:
+    side_selector = SideSelector()
+    ticker_selector = TickerSelector(num_of_tickers=num_of_tickers)
+    orders = [
+        create_add_order(idx=idx, side=side_selector(), ticker=ticker_selector())
+        for idx in range(num_of_orders)
+    ]
+    orders += [create_update_order(idx=idx) for idx in range(num_of_orders)]
+    orders += [create_cancel_order(idx=idx) for idx in range(num_of_orders)]
+    return orders
+
+
+def run_polling(orders: List[str]) -> None:
+    storage = order_processing.create_tree_order_storage()
+    processor = storage.get_processor()
+    price_view = storage.get_price_view()
+    tickers = [f"{idx:x}" for idx in range(NUM_OF_TICKERS)]
+    previous = order_processing.get_best_bids_and_asks(
+        order_book=price_view, tickers=tickers
+    )
+    num_of_changes = 0
+
+    start_time = perf_counter()
+    for idx in range(0, len(orders), POLLING_INTERVAL):
+        order_processing.process_orders(
+            order_book=processor, orders=orders[idx : idx + POLLING_INTERVAL]
+        )
+        current = order_processing.get_best_bids_and_asks(
+            order_book=price_view, tickers=tickers
+        )
+        num_of_changes += sum(
+            1
+            for previous_bid, previous_ask, bid, ask in zip(
+                previous.bids, previous.asks, current.bids, current.asks
+            )
+            if previous_bid != bid or previous_ask != ask
+        )
+        previous = current
+    stop_time = perf_counter()
+
+    print(
+        f"Polling every {POLLING_INTERVAL} messages: {format_int(num_of_changes)} changed tickers, "
+        f"took {stop_time - start_time} seconds"
+    )
+
+
+def run_subscription(orders: List[str]) -> None:
+    storage = order_processing.create_tree_order_storage()
+    processor = storage.get_processor()
+    events: List[order_processing.TopOfBook] = []
+    storage.get_top_of_book_feed().subscribe(listener=events.append)
+
+    start_time = perf_counter()
+    order_processing.process_orders(order_book=processor, orders=orders)
+    stop_time = perf_counter()
+
+    print(
+        f"Subscription: {format_int(len(events))} top of book changes, "
+        f"took {stop_time - start_time} seconds"
+    )
+
+
+def run_conflated_subscription(orders: List[str]) -> None:
+    storage = order_processing.create_tree_order_storage()
+    processor = storage.get_processor()
+    events: List[order_processing.TopOfBook] = []
+    publisher = order_processing.ConflatedTopOfBookPublisher(
+        listener=events.append, max_updates=CONFLATION_WINDOW
+    )
+    storage.get_top_of_book_feed().subscribe(listener=publisher)
+
+    start_time = perf_counter()
+    order_processing.process_orders(order_book=processor, orders=orders)
+    publisher.flush()
+    stop_time = perf_counter()
+
+    print(
+        f"Conflated subscription every {format_int(CONFLATION_WINDOW)} updates: "
+        f"{format_int(len(events))} published tops, took {stop_time - start_time} seconds"
+    )
+
+
+if __name__ == "__main__":
+    print("Running test: RedBlackTree - polling versus top of book subscription")
+    print(f"Number of orders: {format_int(NUM_OF_ORDERS)}")
+    print(f"Number of tickers: {format_int(NUM_OF_TICKERS)}")
+
+    test_orders = create_orders(
+        num_of_orders=NUM_OF_ORDERS, num_of_tickers=NUM_OF_TICKERS
+    )
+    run_polling(orders=test_orders)
+    run_subscription(orders=test_orders)
+    run_conflated_subscription(orders=test_orders)
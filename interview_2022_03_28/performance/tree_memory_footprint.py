@@ -0,0 +1,67 @@
+import tracemalloc
+from time import perf_counter
+
+from interview_2022_03_28 import order_processing
+
+from ._helpers import (
+    SideSelector,
+    TickerSelector,
+    create_add_order,
+    create_cancel_order,
+    create_update_order,
+    format_int,
+)
+
+NUM_OF_ORDERS = 200_000
+NUM_OF_TICKERS = 2_000
+
+
+def measure_bytes_per_order(num_of_orders: int, num_of_tickers: int) -> float:
+    side_selector = SideSelector()
+    ticker_selector = TickerSelector(num_of_tickers=num_of_tickers)
+    additions = [
+        create_add_order(idx=idx, side=side_selector(), ticker=ticker_selector())
+        for idx in range(num_of_orders)
+    ]
+    processor = order_processing.create_tree_order_storage().get_processor()
+
+    tracemalloc.start()
+    order_processing.process_orders(order_book=processor, orders=additions)
+    retained_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return retained_bytes / num_of_orders
+
+
+def measure_operations_per_second(num_of_orders: int, num_of_tickers: int) -> float:
+    side_selector = SideSelector()
+    ticker_selector = TickerSelector(num_of_tickers=num_of_tickers)
+    orders = [
+        create_add_order(idx=idx, side=side_selector(), ticker=ticker_selector())
+        for idx in range(num_of_orders)
+    ]
+    orders += [create_update_order(idx=idx) for idx in range(num_of_orders)]
+    orders += [create_cancel_order(idx=idx) for idx in range(num_of_orders)]
+    processor = order_processing.create_tree_order_storage().get_processor()
+
+    start_time = perf_counter()
+    order_processing.process_orders(order_book=processor, orders=orders)
+    stop_time = perf_counter()
+
+    return len(orders) / (stop_time - start_time)
+
+
+if __name__ == "__main__":
+    print("Running test: RedBlackTree - memory footprint and throughput")
+    print(f"Number of orders: {format_int(NUM_OF_ORDERS)}")
+    print(f"Number of tickers: {format_int(NUM_OF_TICKERS)}")
+
+    bytes_per_order = measure_bytes_per_order(
+        num_of_orders=NUM_OF_ORDERS, num_of_tickers=NUM_OF_TICKERS
+    )
+    print(f"Bytes per resting order: {bytes_per_order:.1f}")
+
+    operations_per_second = measure_operations_per_second(
+        num_of_orders=NUM_OF_ORDERS, num_of_tickers=NUM_OF_TICKERS
+    )
+    print(f"Operations per second: {format_int(int(operations_per_second))}")
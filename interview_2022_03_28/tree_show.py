@@ -1,4 +1,5 @@
 from .order_processing.order import Order, OrderType
+from .order_processing.prices import price_to_ticks
 from .order_processing.tree_order_book import RedBlackTree, print_tree
 
 
@@ -24,9 +25,9 @@ added_orders = []
 def create_add_order(price: float) -> Order:
     return Order(
         order_id=next(ORDER_ID_GENERATOR),
-        timestamp="123",
+        timestamp=123,
         ticker="blabla",
-        price=price,
+        price_ticks=price_to_ticks(price=price),
         size=10,
         order_type=OrderType.BID,
     )